@@ -1,16 +1,245 @@
 import pygame
 import os
+import re
+import hashlib
 import logging
-from config import ASSETS_DIR, LARGEUR, HAUTEUR
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from config import ASSETS_DIR, LARGEUR, HAUTEUR, EXPLOSION_CACHE_OCTETS
+from systems.sfx import RECETTES, sfx, variations_son
 
 logger = logging.getLogger('space_invaders')
 
-def load_image(path):
+_polices = {}  # (name, size) -> Font, shared by every user of the same font
+
+def charger_police(taille, nom=None):
+    """Return a cached pygame Font; fonts are assets, never per-object state."""
+    key = (nom, taille)
+    if key not in _polices:
+        _polices[key] = pygame.font.Font(nom, taille)
+    return _polices[key]
+
+def polices_chargees():
+    """((name, size), Font) pairs of every font loaded through charger_police."""
+    return list(_polices.items())
+
+SOUND_EXTENSIONS = ('.wav', '.ogg')
+
+# Sound name -> file in assets/sounds (several names may share one file)
+SOUND_FILES = {
+    'shoot': 'shoot.wav',
+    'explosion': 'explosion.wav',
+    'hit': 'explosion.wav',  # Use explosion sound for hits
+    'powerup': 'health.wav',  # Use health sound for powerups
+    'health': 'health.wav',
+    'shield': 'shield.wav',
+    'boss_damage': 'boss_damage.wav',
+    'boss_transition': 'boss_transition.wav',
+    'boss_defeated': 'boss_defeated.wav',
+    'boss_warning': 'warning.wav',  # Renamed from 'boss' to 'boss_warning'
+    'warning': 'warning.wav',
+    'level_completed': 'LevelCompleted.wav',
+    'gameover': 'gameover.wav',  # Fixed name to match file
+    'game_over': 'gameover.wav',  # Alternative name mapping to same file
+    'boss_phase_change': 'boss_phase_change.wav',
+    'music': 'music.wav'
+}
+
+# Sounds heard often enough that repeats should vary slightly:
+# name -> number of pitch variations, cycled through on each play
+VARIATIONS_SONS = {
+    'boss_damage': 4,
+}
+
+class AssetLoader:
+    """Decodes image and sound files on worker threads, cached by content.
+
+    PNG and WAV decoding mostly runs with the GIL released, so files handed to
+    precharger() decode in parallel. Converting to the display's pixel format
+    needs the display, so it happens on the main thread the first time an
+    asset is requested. Results are keyed by a hash of the file's bytes: the
+    same file (or an identical copy under another name) is decoded, converted
+    and transformed only once.
+    """
+    def __init__(self, workers=None):
+        self.workers = workers or min(8, os.cpu_count() or 2)
+        self._pool = None
+        self.taches = {}    # path -> Future of (digest, decoded asset)
+        self.digests = {}   # path -> content digest, once decoded
+        self.images = {}    # (digest, size, rotation, smooth) -> converted Surface
+        self.sons = {}      # digest -> Sound
+        self.soumis = 0     # Files submitted, for progress reporting
+        self.termines = 0
+
+    @staticmethod
+    def _decoder(path):
+        """Worker thread: hash and decode one file without touching the display."""
+        with open(path, 'rb') as handle:
+            digest = hashlib.blake2b(handle.read(), digest_size=16).digest()
+        if path.lower().endswith(SOUND_EXTENSIONS):
+            return digest, pygame.mixer.Sound(path)
+        return digest, pygame.image.load(path)
+
+    def precharger(self, paths):
+        """Start decoding `paths` in the background."""
+        for path in paths:
+            path = os.path.abspath(path)
+            if path in self.taches or path in self.digests or not os.path.exists(path):
+                continue
+            self.taches[path] = self.executer(self._decoder, path)
+            self.soumis += 1
+
+    def progression(self):
+        """(decoded, submitted) counts of the files handed to precharger()."""
+        en_cours = sum(1 for future in self.taches.values() if not future.done())
+        return self.soumis - en_cours, self.soumis
+
+    def executer(self, fonction, *args):
+        """Run a decode job on the loader's worker threads; returns its Future."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix='assets')
+        return self._pool.submit(fonction, *args)
+
+    def attendre(self, timeout=None):
+        """Block until at least one pending decode finishes (or `timeout`)."""
+        pending = [future for future in self.taches.values() if not future.done()]
+        if pending:
+            wait(pending, timeout, FIRST_COMPLETED)
+
+    def _decode(self, path, garder=True):
+        """Return (digest, decoded) for a path, or (digest, None) if already cached."""
+        if path in self.digests:
+            return self.digests[path], None
+        future = self.taches.pop(path, None)
+        digest, decoded = future.result() if future else self._decoder(path)
+        if garder:
+            self.digests[path] = digest
+        return digest, decoded
+
+    def image(self, path, taille=None, rotation=0, lisse=False, garder=True):
+        """Converted (and optionally scaled/rotated) image; shared unless garder=False."""
+        path = os.path.abspath(path)
+        digest, decoded = self._decode(path, garder)
+        key = (digest, taille, rotation, lisse)
+        if key in self.images:
+            return self.images[key]
+
+        base = self.images.get((digest, None, 0, False))
+        if base is None:
+            if decoded is None:
+                # Cached only in a transformed form: decode again
+                decoded = self._decoder(path)[1]
+            base = decoded.convert_alpha() if pygame.display.get_surface() else decoded
+            if garder:
+                self.images[(digest, None, 0, False)] = base
+
+        surface = base
+        if taille:
+            surface = (pygame.transform.smoothscale if lisse else pygame.transform.scale)(surface, taille)
+        if rotation:
+            surface = pygame.transform.rotate(surface, rotation)
+        if garder:
+            self.images[key] = surface
+        return surface
+
+    def son(self, path):
+        """Sound for a path; identical files share one Sound."""
+        path = os.path.abspath(path)
+        digest, decoded = self._decode(path)
+        if digest not in self.sons:
+            self.sons[digest] = decoded if decoded is not None else self._decoder(path)[1]
+        return self.sons[digest]
+
+_chargeur = AssetLoader()
+
+def chargeur_assets():
+    """The process-wide asset loader."""
+    return _chargeur
+
+class FrameCache:
+    """Animation frames decoded on demand, kept in LRU order within a byte budget.
+
+    Frames are scaled when decoded, so only the size actually drawn is kept.
+    prechauffer() decodes frames on the loader's threads ahead of time; they
+    are converted and enter the cache the first time they are drawn.
+    """
+    def __init__(self, budget):
+        self.budget = budget
+        self.frames = OrderedDict()  # (path, size) -> Surface, least recently used first
+        self.octets = 0
+        self.en_cours = {}           # (path, size) -> Future of the scaled frame
+        self.decodes = 0             # Frames decoded, including re-decodes after eviction
+        self.prechauffage = True     # Off in headless runs, which never draw
+
+    @staticmethod
+    def _preparer(path, taille):
+        """Worker thread: decode and scale one frame without touching the display."""
+        surface = pygame.image.load(path)
+        if taille and surface.get_size() != taille:
+            surface = pygame.transform.scale(surface, taille)
+        return surface
+
+    def prechauffer(self, paths, taille):
+        """Start decoding frames that are neither cached nor already pending."""
+        if not self.prechauffage:
+            return
+        for path in paths:
+            key = (path, taille)
+            if key not in self.frames and key not in self.en_cours:
+                self.en_cours[key] = _chargeur.executer(self._preparer, path, taille)
+
+    def frame(self, path, taille):
+        key = (path, taille)
+        surface = self.frames.get(key)
+        if surface is not None:
+            self.frames.move_to_end(key)
+            return surface
+
+        future = self.en_cours.pop(key, None)
+        surface = future.result() if future else self._preparer(path, taille)
+        if pygame.display.get_surface():
+            surface = surface.convert_alpha()
+        self.decodes += 1
+        self.frames[key] = surface
+        self.octets += surface.get_pitch() * surface.get_height()
+        # Evict the least recently drawn frames, never the one being returned
+        while self.octets > self.budget and len(self.frames) > 1:
+            _, ancienne = self.frames.popitem(last=False)
+            self.octets -= ancienne.get_pitch() * ancienne.get_height()
+        return surface
+
+_frames = FrameCache(EXPLOSION_CACHE_OCTETS)
+
+def cache_frames():
+    """The process-wide animation frame cache."""
+    return _frames
+
+class SequenceExplosion:
+    """A multi-frame explosion read from a folder, one frame at a time.
+
+    Indexes like the list of frames Explosion expects, but a frame is only
+    decoded when it is drawn, through the shared FrameCache.
+    """
+    def __init__(self, nom, chemins, taille):
+        self.nom = nom
+        self.chemins = chemins
+        self.taille = taille
+
+    def __len__(self):
+        return len(self.chemins)
+
+    def __getitem__(self, index):
+        return _frames.frame(self.chemins[index], self.taille)
+
+    def prechauffer(self):
+        _frames.prechauffer(self.chemins, self.taille)
+
+def load_image(path, taille=None, rotation=0):
     """Load an image and convert it to the right format for PyGame."""
     try:
         import warnings
         warnings.filterwarnings('ignore', category=UserWarning)
-        return pygame.image.load(path).convert_alpha()
+        return _chargeur.image(path, taille, rotation)
     except pygame.error as e:
         logger.error(f"Impossible de charger l'image {path}: {e}")
         raise SystemExit
@@ -20,6 +249,8 @@ class SoundManager:
         pygame.mixer.init()
         pygame.mixer.set_num_channels(16)  # Ensure we have enough channels
         self.sounds = {}
+        self.variations = {}         # name -> Sounds cycled through by play()
+        self.prochaine_variation = {}
         self.music_channel = pygame.mixer.Channel(0)  # Reserve channel 0 for music
         self.music_playing = False
         self.music_paused = False
@@ -46,31 +277,23 @@ class SoundManager:
 
     def load_sounds(self):
         sound_dir = os.path.join(ASSETS_DIR, 'sounds')
-        sound_files = {
-            'shoot': 'shoot.wav',
-            'explosion': 'explosion.wav',
-            'hit': 'explosion.wav',  # Use explosion sound for hits
-            'powerup': 'health.wav',  # Use health sound for powerups
-            'health': 'health.wav',
-            'shield': 'shield.wav',
-            'boss_damage': 'boss_damage.wav',
-            'boss_transition': 'boss_transition.wav',
-            'boss_defeated': 'boss_defeated.wav',
-            'boss_warning': 'warning.wav',  # Renamed from 'boss' to 'boss_warning'
-            'warning': 'warning.wav',
-            'level_completed': 'LevelCompleted.wav',
-            'gameover': 'gameover.wav',  # Fixed name to match file
-            'game_over': 'gameover.wav',  # Alternative name mapping to same file
-            'boss_phase_change': 'boss_phase_change.wav',
-            'music': 'music.wav'
-        }
         
-        for sound_name, filename in sound_files.items():
+        for sound_name, filename in SOUND_FILES.items():
             try:
                 sound_path = os.path.join(sound_dir, filename)
+                nombre = VARIATIONS_SONS.get(sound_name, 1)
                 if os.path.exists(sound_path):
-                    self.sounds[sound_name] = pygame.mixer.Sound(sound_path)
+                    self.sounds[sound_name] = _chargeur.son(sound_path)
                     print(f"Loaded sound: {sound_name} from {sound_path}")  # Debug print
+                    if nombre > 1:
+                        # Resampled from the shipped file
+                        self.variations[sound_name] = variations_son(self.sounds[sound_name], nombre)
+                elif sound_name in RECETTES:
+                    # No file shipped: synthesize the effect's recipe instead
+                    self.sounds[sound_name] = sfx().son(sound_name)
+                    print(f"Synthesized sound: {sound_name}")
+                    if nombre > 1:
+                        self.variations[sound_name] = sfx().variations(sound_name, nombre)
                 else:
                     print(f"Warning: Sound file not found: {sound_path}")
             except Exception as e:
@@ -79,6 +302,11 @@ class SoundManager:
     def play(self, sound_name, volume=None, loop=False):
         if sound_name in self.sounds:
             sound = self.sounds[sound_name]
+            variations = self.variations.get(sound_name)
+            if variations:
+                index = self.prochaine_variation.get(sound_name, 0)
+                sound = variations[index % len(variations)]
+                self.prochaine_variation[sound_name] = index + 1
             # Use provided volume or fall back to the default category volume
             if volume is not None:
                 actual_volume = volume
@@ -126,6 +354,9 @@ class SoundManager:
                 self.music_paused = False
             elif sound_name == 'warning':
                 self.channel_warning.stop()
+            elif sound_name in self.variations:
+                for sound in self.variations[sound_name]:
+                    sound.stop()
             elif sound_name in self.sounds:
                 self.sounds[sound_name].stop()
         else:
@@ -135,6 +366,9 @@ class SoundManager:
             self.channel_warning.stop()
             for sound in self.sounds.values():
                 sound.stop()
+            for variations in self.variations.values():
+                for sound in variations:
+                    sound.stop()
 
     def pause_music(self):
         if self.music_playing:
@@ -158,119 +392,132 @@ def load_game_images():
     images = {}
     
     # Load player image
-    images['player'] = load_image(os.path.join(ASSETS_DIR, 'images', 'player.png'))
-    images['player'] = pygame.transform.scale(images['player'], (64, 80))
+    images['player'] = load_image(os.path.join(ASSETS_DIR, 'images', 'player.png'), (64, 80))
     
     # Load alien images
     images['aliens'] = load_alien_images()
     
-    # Load effects images
-    effects_dir = os.path.join(ASSETS_DIR, 'images', 'effects')
-    images['effects'] = {}
-    if os.path.exists(effects_dir):
-        effects_files = {
-            'damage': 'damage_particle.png',
-            'danger': 'danger_zone.png',
-            'particle': 'particle.png',
-            'phase': 'phase_transition.png',
-            'teleport': 'teleport_particle.png',
-            'warning': 'warning.png'
-        }
-        
-        for effect_name, filename in effects_files.items():
-            try:
-                img_path = os.path.join(effects_dir, filename)
-                if os.path.exists(img_path):
-                    images['effects'][effect_name] = load_image(img_path)
-                    print(f"Successfully loaded effect image: {filename}")
-                else:
-                    print(f"Warning: Effect image not found: {img_path}")
-            except Exception as e:
-                print(f"Error loading effect image {filename}: {e}")
-    else:
-        print(f"Warning: Effects images directory not found: {effects_dir}")
-    
-    # Load boss images
-    images['boss'] = []
-    boss_dir = os.path.join(ASSETS_DIR, 'images', 'boss')
-    if os.path.exists(boss_dir):
-        boss_files = [f for f in os.listdir(boss_dir) if f.startswith('boss') and f.endswith('.png')]
-        boss_files.sort()  # Sort files to ensure consistent loading order
-        print(f"Loading boss images from: {boss_dir}")
-        print(f"Found boss images: {boss_files}")
-        
-        if not boss_files:
-            print("Warning: No boss image files found in", boss_dir)
-        
-        for boss_file in boss_files:
-            try:
-                img_path = os.path.join(boss_dir, boss_file)
-                if not os.path.exists(img_path):
-                    print(f"Warning: Boss image file not found: {img_path}")
-                    continue
-                    
-                img = load_image(img_path)
-                if img is None:
-                    print(f"Warning: Failed to load boss image: {boss_file}")
-                    continue
-                    
-                # Pre-scale the boss images to the correct size
-                img = pygame.transform.scale(img, (200, 200))  # Using BossConstants.TAILLE
-                images['boss'].append(img)
-                print(f"Successfully loaded and scaled boss image: {boss_file}")
-            except Exception as e:
-                print(f"Error loading boss image {boss_file}: {e}")
-        
-        print(f"Successfully loaded {len(images['boss'])} boss images")
-    else:
-        print(f"Warning: Boss images directory not found: {boss_dir}")
+    # Effect textures are baked into the effect atlas (effects/effect_atlas.py)
     
     # Load shots images
     images['shots'] = []
     for i in range(1, 7):
-        img = load_image(os.path.join(ASSETS_DIR, 'images', 'shots', f'shot{i}.png'))
-        img = pygame.transform.scale(img, (20, 20))
-        img_rotated = pygame.transform.rotate(img, -90)
-        images['shots'].append(img_rotated)
+        img = load_image(os.path.join(ASSETS_DIR, 'images', 'shots', f'shot{i}.png'), (20, 20), -90)
+        images['shots'].append(img)
 
     # Load projectile images
     images['projectile'] = load_image(os.path.join(ASSETS_DIR, 'images', 'missile.png'))
     images['projectile_alien'] = []
     for i in range(1, 7):
-        img = load_image(os.path.join(ASSETS_DIR, 'images', 'shots', f'shot{i}.png'))
-        img = pygame.transform.scale(img, (20, 20))
-        img_rotated = pygame.transform.rotate(img, -90)
-        images['projectile_alien'].append(img_rotated)
+        # Same file and transform as 'shots': served from the loader cache
+        img = load_image(os.path.join(ASSETS_DIR, 'images', 'shots', f'shot{i}.png'), (20, 20), -90)
+        images['projectile_alien'].append(img)
     
-    # Load missile image
+    # Load missile image (same file as 'projectile', served from the loader cache)
     images['missile'] = load_image(os.path.join(ASSETS_DIR, 'images', 'missile.png'))
-    images['missile'] = pygame.transform.scale(images['missile'], (images['missile'].get_width(), images['missile'].get_height()))
     
     # Load powerups images
     images['powerups'] = {}
     powerup_types = ['shield', 'life', 'fire']
     for powerup in powerup_types:
-        img = load_image(os.path.join(ASSETS_DIR, 'images', 'powerup', f'{powerup}.png'))
-        img = pygame.transform.scale(img, (60, 60))
+        img = load_image(os.path.join(ASSETS_DIR, 'images', 'powerup', f'{powerup}.png'), (60, 60))
         images['powerups'][powerup] = img
 
     # Load explosion images
     images['explosions'] = []
     for i in range(1, 7):
-        img = load_image(os.path.join(ASSETS_DIR, 'images', 'explosions', f'explosion{i}.png'))
-        img = pygame.transform.scale(img, (128, 128))
+        img = load_image(os.path.join(ASSETS_DIR, 'images', 'explosions', f'explosion{i}.png'), (128, 128))
         images['explosions'].append(img)
+    # Boss death: the same frames at twice the size
+    images['explosions_boss'] = [pygame.transform.scale(img, (256, 256)) for img in images['explosions']]
+
+    # Per-ship and player sequences, decoded frame by frame when drawn
+    images['explosions_vaisseaux'] = {}
+    for i in range(1, 7):
+        sequence = sequence_explosion(f'ship{i}')
+        if sequence is not None:
+            images['explosions_vaisseaux'][i] = sequence
+    images['explosion_joueur'] = sequence_explosion('player') or images['explosions']
     
     return images
 
+def _ordre_naturel(nom):
+    """Sort key putting 'Explosion_2' before 'Explosion_10'."""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', nom)]
+
+# Sequence name -> (folder in assets/images/explosions, frame size)
+EXPLOSION_SEQUENCES = {
+    **{f'ship{i}': (f'ship{i}_explosions', (128, 128)) for i in range(1, 7)},
+    'player': ('player_explosions', (192, 192)),
+}
+
+_sequences = {}  # Sequence name -> SequenceExplosion, shared by every game
+
+def sequence_explosion(nom):
+    """The explosion sequence `nom` (see EXPLOSION_SEQUENCES), or None if missing."""
+    if nom not in _sequences:
+        dossier, taille = EXPLOSION_SEQUENCES[nom]
+        chemin = os.path.join(ASSETS_DIR, 'images', 'explosions', dossier)
+        fichiers = []
+        if os.path.isdir(chemin):
+            fichiers = sorted((f for f in os.listdir(chemin) if f.endswith('.png')), key=_ordre_naturel)
+        _sequences[nom] = SequenceExplosion(nom, [os.path.join(chemin, f) for f in fichiers], taille) if fichiers else None
+    return _sequences[nom]
+
+def prechauffer_explosions(vaisseaux):
+    """Start decoding the explosion frames of the given alien ship numbers."""
+    for vaisseau in vaisseaux:
+        sequence = sequence_explosion(f'ship{vaisseau}')
+        if sequence is not None:
+            sequence.prechauffer()
+
 def load_alien_images():
     alien_images = []
     for i in range(1, 7):
-        img = load_image(os.path.join(ASSETS_DIR, 'images', 'aliens', f'Ship{i}.png'))
-        img = pygame.transform.scale(img, (64, 64))
+        img = load_image(os.path.join(ASSETS_DIR, 'images', 'aliens', f'Ship{i}.png'), (64, 64))
         alien_images.append(img)
     return alien_images
 
+def fichiers_boss():
+    """Boss image files, in loading order."""
+    boss_dir = os.path.join(ASSETS_DIR, 'images', 'boss')
+    if not os.path.isdir(boss_dir):
+        return []
+    boss_files = sorted(f for f in os.listdir(boss_dir) if f.startswith('boss') and f.endswith('.png'))
+    return [os.path.join(boss_dir, f) for f in boss_files]
+
+def load_boss_images():
+    """Boss images, pre-scaled. Loaded on the first boss level rather than at startup."""
+    images = []
+    boss_files = fichiers_boss()
+    if not boss_files:
+        print("Warning: No boss image files found")
+    for img_path in boss_files:
+        try:
+            img = load_image(img_path, (200, 200))  # Using BossConstants.TAILLE
+            if img is None:
+                print(f"Warning: Failed to load boss image: {img_path}")
+                continue
+            images.append(img)
+        except Exception as e:
+            print(f"Error loading boss image {img_path}: {e}")
+    print(f"Successfully loaded {len(images)} boss images")
+    return images
+
+def fichiers_demarrage():
+    """Every file the game loads at startup, for AssetLoader.precharger()."""
+    images_dir = os.path.join(ASSETS_DIR, 'images')
+    fichiers = [os.path.join(images_dir, 'player.png'), os.path.join(images_dir, 'missile.png')]
+    for dossier in ('player', 'aliens', 'shots', 'powerup', 'explosions'):
+        chemin = os.path.join(images_dir, dossier)
+        if os.path.isdir(chemin):
+            fichiers += [os.path.join(chemin, f) for f in sorted(os.listdir(chemin)) if f.endswith('.png')]
+    # The other effect textures are generated by the effect atlas
+    fichiers.append(os.path.join(images_dir, 'effects', 'warning.png'))
+    sound_dir = os.path.join(ASSETS_DIR, 'sounds')
+    fichiers += [os.path.join(sound_dir, f) for f in sorted(set(SOUND_FILES.values()))]
+    return fichiers
+
 def load_backgrounds():
     backgrounds = []
     backgrounds_dir = os.path.join('assets', 'backgrounds')  # Changed to relative path
@@ -0,0 +1,148 @@
+"""
+Classic grid movement check.
+
+The classic Envahisseur formation is only a fallback of creer_envahisseurs(),
+so games rarely exercise ClassicGrid. This builds the classic 5x11 grid
+directly, steps a ClassicGrid(legacy=True) and, on an identical copy, the
+original two-deplacer() loop of Game.update_aliens, and asserts that every
+alien has the same position and direction after every tick: across edge
+reversals, descents down to the bottom limit, and kills of whole edge columns
+and of single aliens. Exits with status 1 on the first difference:
+
+    python check_classic_grid.py [--seed N] [--ticks N]
+"""
+
+import argparse
+import os
+import random
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from config import LARGEUR
+from entities.alien import ClassicGrid, Envahisseur
+
+# Speed cases: (level, post_boss), covering whole and fractional speeds
+CAS = [(1, False), (2, False), (4, False), (7, False), (1, True), (2, True), (5, True)]
+
+
+def grille_classique(niveau, post_boss):
+    """The classic formation of creer_envahisseurs(), with 64x64 placeholder sprites."""
+    images = [pygame.Surface((64, 64)) for _ in range(6)]
+    rangees, colonnes, espace = 5, 11, 60
+    debut_x = (LARGEUR - (colonnes - 1) * espace) // 2
+    debut_y = 80
+    return [
+        Envahisseur(debut_x + colonne * espace, debut_y + rangee * espace, rangee // 2,
+                    niveau, rangee, images[rangee % 6], post_boss)
+        for rangee in range(rangees)
+        for colonne in range(colonnes)
+    ]
+
+
+def deplacer_reference(aliens):
+    """One tick of the original update_aliens() movement; True if an alien reached the bottom."""
+    en_bas = False
+    direction_change = False
+    for alien in aliens:
+        new_x = alien.deplacer()
+        if (new_x <= 50 and alien.direction < 0) or \
+           (new_x >= LARGEUR - 50 and alien.direction > 0):
+            direction_change = True
+    if direction_change:
+        for alien in aliens:
+            alien.direction *= -1
+            if alien.descendre(20):
+                en_bas = True
+
+    move_down = False
+    for alien in aliens:
+        new_x = alien.deplacer()
+        if (new_x <= 0 and alien.direction < 0) or (new_x >= LARGEUR - alien.rect.width and alien.direction > 0):
+            move_down = True
+            break
+    if move_down:
+        for alien in aliens:
+            alien.direction *= -1
+            if alien.descendre(20):
+                en_bas = True
+    return en_bas
+
+
+def victimes(vivants, rng, tick, periode=200, survivants=6):
+    """Indices of the aliens to kill before `tick`: an edge column, or one alien.
+
+    A few aliens are kept alive so the grid still reaches the bottom limit.
+    """
+    if len(vivants) <= survivants or tick % periode:
+        return []
+    choix = (tick // periode) % 3
+    if choix == 2:
+        return [rng.choice(sorted(vivants))]
+    colonnes = sorted({index % 11 for index in vivants})
+    colonne = colonnes[0] if choix == 0 else colonnes[-1]
+    return [index for index in sorted(vivants) if index % 11 == colonne]
+
+
+def verifier(niveau, post_boss, seed, max_ticks):
+    """Step both copies; returns (ticks, reversals, kills) or raises AssertionError."""
+    originaux = grille_classique(niveau, post_boss)
+    reference = list(originaux)  # Removed from like Game.envahisseurs
+    pilotes = grille_classique(niveau, post_boss)
+    grille = ClassicGrid(pilotes, legacy=True)
+    vivants = set(range(len(reference)))
+    rng = random.Random(seed)
+    inversions = 0
+    tues = 0
+
+    for tick in range(max_ticks):
+        for index in victimes(vivants, rng, tick):
+            vivants.discard(index)
+            reference.remove(originaux[index])
+            grille.retirer(pilotes[index])
+            tues += 1
+        direction = grille.direction
+        en_bas_reference = deplacer_reference(reference)
+        en_bas = grille.update()
+        if grille.direction != direction:
+            inversions += 1
+
+        for index in sorted(vivants):
+            attendu = originaux[index]
+            obtenu = pilotes[index]
+            assert (obtenu.rect.topleft, obtenu.direction) == (attendu.rect.topleft, attendu.direction), (
+                f"level {niveau}, post_boss {post_boss}, tick {tick}, alien {index}: "
+                f"grid {obtenu.rect.topleft} dir {obtenu.direction}, "
+                f"reference {attendu.rect.topleft} dir {attendu.direction}")
+        assert en_bas == en_bas_reference, (
+            f"level {niveau}, post_boss {post_boss}, tick {tick}: bottom reached "
+            f"{en_bas} by the grid, {en_bas_reference} by the reference")
+        if en_bas:
+            return tick + 1, inversions, tues
+    raise AssertionError(f"level {niveau}, post_boss {post_boss}: bottom not reached in {max_ticks} ticks")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check ClassicGrid(legacy=True) against the original alien loop")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the single-alien kills")
+    parser.add_argument('--ticks', type=int, default=60000, help="Ticks per case at most")
+    args = parser.parse_args()
+
+    pygame.init()
+    for niveau, post_boss in CAS:
+        try:
+            ticks, inversions, tues = verifier(niveau, post_boss, args.seed, args.ticks)
+        except AssertionError as e:
+            print(f"Mismatch: {e}")
+            sys.exit(1)
+        print(f"  level {niveau}{' post-boss' if post_boss else ''}: {ticks} ticks, "
+              f"{inversions} reversals, {tues} kills, identical down to the bottom")
+    print("ClassicGrid(legacy=True) matches the original movement")
+
+
+if __name__ == '__main__':
+    main()
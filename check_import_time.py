@@ -0,0 +1,69 @@
+"""
+Import-time budget for the game's own modules.
+
+Runs `python -X importtime -c "import main"` in a fresh interpreter and adds up
+the self time of every module that lives in this repository (pygame, numpy and
+the standard library are not counted). Exits with status 1 when the total is
+over budget, so it can run in CI:
+
+    python check_import_time.py [--budget MS] [--top N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BUDGET_MS = 20  # Game modules only; pygame itself is ~250ms on its own
+
+
+def _module_du_projet(nom):
+    """True when the top-level package or module of `nom` is in this repository."""
+    racine = nom.split('.')[0]
+    return (os.path.isfile(os.path.join(ROOT, racine + '.py'))
+            or os.path.isdir(os.path.join(ROOT, racine)))
+
+
+def mesurer(module='main'):
+    """Return [(self_us, cumulative_us, name)] for the project's modules."""
+    env = dict(os.environ)
+    env.setdefault('SDL_VIDEODRIVER', 'dummy')
+    env.setdefault('SDL_AUDIODRIVER', 'dummy')
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    resultat = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if resultat.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{resultat.stderr}")
+
+    modules = []
+    for ligne in resultat.stderr.splitlines():
+        if not ligne.startswith('import time:') or 'self [us]' in ligne:
+            continue
+        self_us, cumul_us, nom = ligne[len('import time:'):].split('|')
+        nom = nom.strip()
+        if _module_du_projet(nom):
+            modules.append((int(self_us), int(cumul_us), nom))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import-time budget of the game's own modules")
+    parser.add_argument('--budget', type=float, default=BUDGET_MS, help="Budget in milliseconds")
+    parser.add_argument('--top', type=int, default=8, help="Slowest modules to list")
+    args = parser.parse_args()
+
+    modules = mesurer()
+    total_ms = sum(self_us for self_us, _, _ in modules) / 1000
+    print(f"Game modules: {len(modules)}, import self time {total_ms:.1f}ms (budget {args.budget:.0f}ms)")
+    for self_us, cumul_us, nom in sorted(modules, reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:7.2f}ms  {nom}")
+
+    if total_ms > args.budget:
+        print("Over budget: move import-time work into functions or import it on first use")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
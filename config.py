@@ -28,6 +28,7 @@ JAUNE = (255, 255, 0)
 VITESSE_ALIEN = 1
 VITESSE_ALIEN_POST_BOSS = 1.5  # Speed multiplier after boss fight
 VITESSE_DESCENTE = 20
+ALIEN_GRID_LEGACY_MOVEMENT = False  # Replay the original double-step classic grid movement
 FREQUENCE_TIR_ALIEN_BASE = 0.0003
 FREQUENCE_TIR_REDUCTION_BOSS = 0.5
 DELAI_ENTRE_TIRS = 1000
@@ -46,8 +47,48 @@ COMBOS_POINTS = {
 }
 COMBO_TEMPS_MAX = 2000
 
+# Display quality ('basse', 'moyenne', 'haute', or 'auto' to follow the frame time)
+QUALITE_GRAPHIQUE = 'haute'
+
+# Effect density per quality: fraction of the particles spawned and of the
+# projectile trails drawn, and number of parallax layers drawn
+QUALITE_EFFETS = {
+    'basse': {'particules': 0.3, 'trainee': 0.35, 'couches_fond': 1},
+    'moyenne': {'particules': 0.6, 'trainee': 0.7, 'couches_fond': 2},
+    'haute': {'particules': 1.0, 'trainee': 1.0, 'couches_fond': 3},
+}
+QUALITE_BUDGET_MS = 14.0  # 'auto' lowers effects when a frame's work takes longer
+
+# How the 1600x1200 image reaches a window of another size, per quality:
+# 'scaled' lets SDL's renderer scale (falls back to 'lisse' or 'entier'),
+# 'entier' is an integer nearest-neighbour upscale, 'lisse' a smoothscale
+PRESENTATION_PAR_QUALITE = {
+    'basse': {'mode': 'entier', 'lisse': False},
+    'moyenne': {'mode': 'scaled', 'lisse': False},
+    'haute': {'mode': 'scaled', 'lisse': True},
+}
+
+# Input latency (systems/latency.py)
+LATENCE_MESURE = False          # Time inputs from their read to the flip showing them; report on exit
+BOUCLE_FAIBLE_LATENCE = False   # Busy-waited frame pacing, input read just in time for the display
+
 # Asset Directory
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+BULLET_PATTERNS_FILE = os.path.join(DATA_DIR, 'bullet_patterns.json')
+
+# Explosion animations: frames are decoded on demand into a shared LRU cache
+EXPLOSION_CACHE_OCTETS = 6 * 1024 * 1024  # Memory budget for decoded frames
+
+# Replays
+REPLAY_ENREGISTREMENT = True  # Record every game's inputs for playback/profiling
+REPLAY_DIR = os.path.join(DATA_DIR, 'replays')
+
+# Quick-save (F5 to save, F9 to load)
+QUICKSAVE_FILE = os.path.join(DATA_DIR, 'quicksave.sav')
+
+# Local leaderboard (SQLite, one row per finished run)
+LEADERBOARD_FILE = os.path.join(DATA_DIR, 'leaderboard.db')
 
 # Boss Constants
 class BossConstants:
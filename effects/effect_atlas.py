@@ -0,0 +1,228 @@
+"""
+Effect texture atlas.
+
+The glow, ring, particle, danger-zone and phase-transition textures are drawn
+procedurally at the size they are displayed at, and every texture is baked
+with its fade ramp: NIVEAUX_ALPHA copies with the alpha multiplied into the
+pixels. All frames are packed into one atlas surface and looked up through an
+index of (texture, size) -> area per alpha level, so drawing an effect is a
+single blit from the atlas: no PNG to load, no scaling, no per-draw copy or
+surface-alpha modulation.
+
+The warning sign is artwork (warning.png) when the file is present, scaled
+into the atlas once; otherwise a warning triangle is drawn in its place.
+Sizes not listed in TAILLES_EFFETS are built on first use and left to the
+caller to cache.
+
+create_effects.py writes the same textures and the atlas to disk for
+inspection.
+"""
+
+import math
+import os
+
+import pygame
+
+from assets import load_image
+from config import ASSETS_DIR, BossConstants
+
+# Fades are quantized to this many levels, one pre-built frame each
+NIVEAUX_ALPHA = 16
+
+LARGEUR_ATLAS = 2048
+
+
+def _warning(taille):
+    """The warning artwork, or a red warning triangle drawn in its place."""
+    chemin = os.path.join(ASSETS_DIR, 'images', 'effects', 'warning.png')
+    if os.path.exists(chemin):
+        return pygame.transform.scale(load_image(chemin), taille)
+    w, h = taille
+    surface = pygame.Surface(taille, pygame.SRCALPHA)
+    points = [(w // 2, 5), (w - 5, h - 5), (5, h - 5)]
+    pygame.draw.polygon(surface, (255, 0, 0, 128), points)
+    pygame.draw.polygon(surface, (255, 0, 0), points, 2)
+    pygame.draw.rect(surface, (255, 0, 0), (w // 2 - 2, h // 2 - 10, 4, 15))
+    pygame.draw.circle(surface, (255, 0, 0), (w // 2, h // 2 + 10), 2)
+    return surface
+
+
+def _danger(taille):
+    """Concentric red circles, fading out towards the centre."""
+    surface = pygame.Surface(taille, pygame.SRCALPHA)
+    rayon_max = min(taille) // 2
+    echelle = rayon_max / 64  # Designed at 128x128
+    pas = max(2, round(10 * echelle))
+    epaisseur = max(1, round(2 * echelle))
+    for rayon in range(rayon_max, 0, -pas):
+        alpha = int(128 * (rayon / rayon_max))
+        pygame.draw.circle(surface, (255, 0, 0, alpha), (taille[0] // 2, taille[1] // 2), rayon, epaisseur)
+    return surface
+
+
+def _particule(couleur):
+    def dessiner(taille):
+        surface = pygame.Surface(taille, pygame.SRCALPHA)
+        pygame.draw.circle(surface, couleur, (taille[0] // 2, taille[1] // 2), min(taille) // 2)
+        return surface
+    return dessiner
+
+
+def _phase(taille):
+    """Burst of 24 rays, fading out along their length."""
+    surface = pygame.Surface(taille, pygame.SRCALPHA)
+    centre_x, centre_y = taille[0] // 2, taille[1] // 2
+    rayon = min(taille) // 2
+    point = max(1, round(2 * rayon / 64))
+    for degres in range(0, 360, 15):
+        angle = math.radians(degres)
+        for segment in range(20):
+            t = segment / 20
+            x = centre_x + math.cos(angle) * rayon * t
+            y = centre_y + math.sin(angle) * rayon * t
+            pygame.draw.circle(surface, (255, 255, 200, int(255 * (1 - t))), (int(x), int(y)), point)
+    return surface
+
+
+def _glow(couleur):
+    def dessiner(taille):
+        """Soft disc, opaque in the centre and quadratically transparent at the edge."""
+        surface = pygame.Surface(taille, pygame.SRCALPHA)
+        rayon_max = min(taille) // 2
+        for rayon in range(rayon_max, 0, -1):
+            alpha = int(255 * (1 - rayon / rayon_max) ** 2)
+            pygame.draw.circle(surface, (*couleur, alpha), (taille[0] // 2, taille[1] // 2), rayon)
+        return surface
+    return dessiner
+
+
+def _anneau(couleur):
+    def dessiner(taille):
+        """Thin ring with a fainter halo just inside it."""
+        surface = pygame.Surface(taille, pygame.SRCALPHA)
+        centre = (taille[0] // 2, taille[1] // 2)
+        rayon = min(taille) // 2
+        epaisseur = max(1, rayon // 8)
+        pygame.draw.circle(surface, (*couleur, 96), centre, rayon - epaisseur, epaisseur * 2)
+        pygame.draw.circle(surface, (*couleur, 255), centre, rayon, epaisseur)
+        return surface
+    return dessiner
+
+
+# Texture name -> drawing function of a given size
+TEXTURES = {
+    'warning': _warning,
+    'danger': _danger,
+    'particle': _particule((255, 255, 255, 255)),
+    'damage': _particule((255, 165, 0, 255)),
+    'teleport': _particule((0, 255, 255, 255)),
+    'explosion': _particule((255, 165, 0, 255)),
+    'phase': _phase,
+    'glow': _glow((255, 255, 200)),
+    'ring': _anneau((255, 255, 255)),
+}
+
+_AGRANDI = (BossConstants.TAILLE[0] + 20, BossConstants.TAILLE[1] + 20)
+
+# Sizes baked into the atlas: the ones the boss effects are drawn at
+TAILLES_EFFETS = {
+    'warning': (BossConstants.TAILLE, _AGRANDI),
+    'danger': ((60, 60),),
+    'particle': ((4, 4),),
+    'damage': ((4, 4),),
+    'teleport': ((4, 4),),
+    'explosion': ((4, 4),),
+    'phase': ((128, 128),),
+    'glow': ((16, 16), (32, 32), (64, 64)),
+    'ring': ((32, 32), (64, 64)),
+}
+
+
+def niveau_alpha(alpha):
+    """Fade level (0 to NIVEAUX_ALPHA) of an alpha value."""
+    return round(max(0, min(255, alpha)) * NIVEAUX_ALPHA / 255)
+
+
+def rampe(texture):
+    """NIVEAUX_ALPHA + 1 frames of a texture, alpha baked in (level 0 is None)."""
+    frames = [None]
+    for niveau in range(1, NIVEAUX_ALPHA + 1):
+        frame = texture.copy()
+        if niveau < NIVEAUX_ALPHA:
+            frame.fill((255, 255, 255, round(niveau * 255 / NIVEAUX_ALPHA)),
+                       special_flags=pygame.BLEND_RGBA_MULT)
+        frames.append(frame)
+    return frames
+
+
+class EffectAtlas:
+    """Every effect texture and fade level of TAILLES_EFFETS in one surface."""
+
+    def __init__(self, tailles=TAILLES_EFFETS, largeur=LARGEUR_ATLAS):
+        self.index = {}        # (name, size) -> [None, Rect per fade level]
+        self.hors_atlas = {}   # (name, size) -> texture built for a size not baked
+        frames = []
+        for nom, liste in tailles.items():
+            for taille in liste:
+                taille = tuple(taille)
+                self.index[(nom, taille)] = [None] * (NIVEAUX_ALPHA + 1)
+                for niveau, frame in enumerate(rampe(TEXTURES[nom](taille))):
+                    if frame is not None:
+                        frames.append(((nom, taille), niveau, frame))
+        self.surface = self._emballer(frames, largeur)
+
+    def _emballer(self, frames, largeur):
+        """Shelf packing: tallest frames first, left to right, one row at a time."""
+        frames.sort(key=lambda entree: entree[2].get_height(), reverse=True)
+        x = y = hauteur_rangee = 0
+        positions = []
+        for cle, niveau, frame in frames:
+            w, h = frame.get_size()
+            if x + w > largeur:
+                x, y = 0, y + hauteur_rangee
+                hauteur_rangee = 0
+            positions.append((x, y))
+            self.index[cle][niveau] = pygame.Rect(x, y, w, h)
+            x += w + 1  # One transparent pixel between frames
+            hauteur_rangee = max(hauteur_rangee, h + 1)
+
+        surface = pygame.Surface((largeur, max(1, y + hauteur_rangee)), pygame.SRCALPHA)
+        if pygame.display.get_surface():
+            surface = surface.convert_alpha()
+        surface.fill((0, 0, 0, 0))
+        # MAX over a cleared surface copies the pixels, alpha included, unblended
+        surface.blits([(frame, position, None, pygame.BLEND_RGBA_MAX)
+                       for (_, _, frame), position in zip(frames, positions)], False)
+        return surface
+
+    def zone(self, nom, taille, alpha):
+        """Atlas area of a texture at `alpha`; None if invisible or not baked."""
+        zones = self.index.get((nom, taille))
+        if zones is None:
+            return None
+        return zones[niveau_alpha(alpha)]
+
+    def contient(self, nom, taille):
+        return (nom, taille) in self.index
+
+    def texture(self, nom, taille):
+        """Full-opacity texture at any size, drawn once for sizes not in the atlas."""
+        zones = self.index.get((nom, taille))
+        if zones is not None:
+            return self.surface.subsurface(zones[NIVEAUX_ALPHA])
+        texture = self.hors_atlas.get((nom, taille))
+        if texture is None:
+            texture = TEXTURES[nom](taille)
+            self.hors_atlas[(nom, taille)] = texture
+        return texture
+
+
+_atlas = None
+
+
+def effect_atlas():
+    """The process-wide effect atlas, baked on first use (after the display is set)."""
+    global _atlas
+    if _atlas is None:
+        _atlas = EffectAtlas()
+    return _atlas
@@ -2,7 +2,13 @@ import pygame
 import math
 import random
 
+# Effect particles and draw-time jitter use their own generator so effects
+# never consume the gameplay RNG (keeps seeded runs and replays deterministic)
+_rng_visuel = random.Random()
+
 class PowerupEffect:
+    __slots__ = ('x', 'y', 'color', 'radius', 'max_radius', 'growth_rate', 'alpha', 'fade_rate', 'particles')
+
     def __init__(self, x, y, color):
         self.x = x
         self.y = y
@@ -17,15 +23,15 @@ class PowerupEffect:
 
     def spawn_particles(self):
         for _ in range(12):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(2, 5)
+            angle = _rng_visuel.uniform(0, math.pi * 2)
+            speed = _rng_visuel.uniform(2, 5)
             self.particles.append({
                 'x': self.x,
                 'y': self.y,
                 'dx': math.cos(angle) * speed,
                 'dy': math.sin(angle) * speed,
                 'alpha': 255,
-                'size': random.randint(2, 4)
+                'size': _rng_visuel.randint(2, 4)
             })
 
     def update(self):
@@ -62,6 +68,8 @@ class PowerupEffect:
                         particle['y'] - particle['size']))
 
 class ShieldEffect(PowerupEffect):
+    __slots__ = ('shield_radius', 'shield_alpha', 'shield_pulse')
+
     def __init__(self, x, y):
         super().__init__(x, y, (0, 255, 255))  # Cyan color for shield
         self.shield_radius = 40
@@ -85,6 +93,8 @@ class ShieldEffect(PowerupEffect):
                        (self.x - pulse_radius, self.y - pulse_radius))
 
 class HealthEffect(PowerupEffect):
+    __slots__ = ('cross_size', 'cross_alpha')
+
     def __init__(self, x, y):
         super().__init__(x, y, (0, 255, 0))  # Green color for health
         self.cross_size = 20
@@ -108,6 +118,8 @@ class HealthEffect(PowerupEffect):
                        (self.x - self.cross_size, self.y - self.cross_size))
 
 class FireEffect(PowerupEffect):
+    __slots__ = ('flame_particles',)
+
     def __init__(self, x, y):
         super().__init__(x, y, (255, 165, 0))  # Orange color for fire powerup
         self.flame_particles = []
@@ -115,9 +127,9 @@ class FireEffect(PowerupEffect):
             self.flame_particles.append({
                 'x': self.x,
                 'y': self.y,
-                'speed': random.uniform(2, 4),
-                'angle': random.uniform(-math.pi/4, math.pi/4),
-                'size': random.randint(3, 6),
+                'speed': _rng_visuel.uniform(2, 4),
+                'angle': _rng_visuel.uniform(-math.pi/4, math.pi/4),
+                'size': _rng_visuel.randint(3, 6),
                 'alpha': 255
             })
 
@@ -138,9 +150,9 @@ class FireEffect(PowerupEffect):
             self.flame_particles.append({
                 'x': self.x,
                 'y': self.y,
-                'speed': random.uniform(2, 4),
-                'angle': random.uniform(-math.pi/4, math.pi/4),
-                'size': random.randint(3, 6),
+                'speed': _rng_visuel.uniform(2, 4),
+                'angle': _rng_visuel.uniform(-math.pi/4, math.pi/4),
+                'size': _rng_visuel.randint(3, 6),
                 'alpha': 255
             })
             
@@ -159,6 +171,8 @@ class FireEffect(PowerupEffect):
                         particle['y'] - particle['size']))
 
 class RapidFireEffect:
+    __slots__ = ('rect', 'particles', 'color')
+
     def __init__(self, player_rect):
         self.rect = player_rect
         self.particles = []
@@ -167,10 +181,10 @@ class RapidFireEffect:
     def update(self):
         # Add new particles
         if len(self.particles) < 20:
-            x = self.rect.centerx + random.randint(-20, 20)
-            y = self.rect.bottom + random.randint(0, 10)
-            speed = random.uniform(2, 5)
-            size = random.randint(2, 4)
+            x = self.rect.centerx + _rng_visuel.randint(-20, 20)
+            y = self.rect.bottom + _rng_visuel.randint(0, 10)
+            speed = _rng_visuel.uniform(2, 5)
+            size = _rng_visuel.randint(2, 4)
             self.particles.append({
                 'pos': [x, y],
                 'speed': speed,
@@ -240,9 +254,9 @@ class PowerupEffectManager:
         # Draw rapid fire effect if active
         if self.active_rapid_fire and self.player_rect:
             for _ in range(2):
-                x = self.player_rect.centerx + random.randint(-20, 20)
-                y = self.player_rect.bottom + random.randint(0, 10)
-                size = random.randint(2, 4)
+                x = self.player_rect.centerx + _rng_visuel.randint(-20, 20)
+                y = self.player_rect.bottom + _rng_visuel.randint(0, 10)
+                size = _rng_visuel.randint(2, 4)
                 surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
                 pygame.draw.circle(surface, (255, 165, 0, 200),
                                  (size, size), size)
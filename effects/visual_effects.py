@@ -1,18 +1,111 @@
 import pygame
 import math
 import random
+from collections import OrderedDict
 from config import LARGEUR, HAUTEUR, BossConstants
+from utils import timing
+from systems.quality import qualite
+from effects.effect_atlas import NIVEAUX_ALPHA, TEXTURES, effect_atlas, niveau_alpha
+
+# Particle counts follow the quality preset, so particles are spawned from
+# their own generator and never consume the gameplay RNG
+_rng_visuel = random.Random()
+
+
+class EffectSpriteCache:
+    """Scaled effect sprites and fallback shapes, with pre-built alpha frames.
+
+    Each (image, size) is scaled once; each pulse level is a copy with the
+    alpha baked into its pixels, built on first use. Drawing an indicator is
+    then a plain per-pixel-alpha blit: no transform, no new surface, and no
+    surface-alpha modulation (several times slower to blit in SDL). Sizes
+    baked into the effect atlas never get here.
+    """
+
+    def __init__(self, max_sprites=64):
+        self.max_sprites = max_sprites
+        self.sprites = OrderedDict()  # key -> [source, base, frames], least recently used first
+
+    def _frame(self, cle, source, construire, alpha):
+        niveau = niveau_alpha(alpha)
+        if niveau == 0:
+            return None  # Fully transparent: nothing to draw
+        entree = self.sprites.get(cle)
+        # The source is kept with the sprite, so its id() cannot be reused
+        if entree is None or entree[0] is not source:
+            entree = [source, construire(), [None] * (NIVEAUX_ALPHA + 1)]
+            self.sprites[cle] = entree
+            if len(self.sprites) > self.max_sprites:
+                self.sprites.popitem(last=False)
+        else:
+            self.sprites.move_to_end(cle)
+        frames = entree[2]
+        if frames[niveau] is None:
+            frame = entree[1].copy()
+            if niveau < NIVEAUX_ALPHA:
+                frame.fill((255, 255, 255, round(niveau * 255 / NIVEAUX_ALPHA)),
+                           special_flags=pygame.BLEND_RGBA_MULT)
+            frames[niveau] = frame
+        return frames[niveau]
+
+    def image(self, image, taille, alpha):
+        """`image` scaled to `taille` (None: its own size) at `alpha`; None if invisible."""
+        def construire():
+            if taille is None or tuple(taille) == image.get_size():
+                return image.copy()
+            return pygame.transform.scale(image, taille)
+        return self._frame((id(image), taille), image, construire, alpha)
+
+    def forme(self, forme, taille, couleur, alpha):
+        """A 'rect' or 'cercle' of `couleur` filling `taille`, at `alpha`."""
+        def construire():
+            sprite = pygame.Surface(taille, pygame.SRCALPHA)
+            if forme == 'cercle':
+                pygame.draw.circle(sprite, couleur, (taille[0] // 2, taille[1] // 2), min(taille) // 2)
+            else:
+                sprite.fill(couleur)
+            return sprite
+        return self._frame((forme, taille, couleur), None, construire, alpha)
+
+
+_sprites = EffectSpriteCache()
+
+
+def sprites_effets():
+    """The process-wide effect sprite cache."""
+    return _sprites
+
+
+def sprite_effet(nom, taille, alpha):
+    """(source, area) of an effect texture at `alpha`; None when invisible.
+
+    Sizes baked into the atlas are an area of the atlas surface; any other
+    size is drawn once and faded through the sprite cache.
+    """
+    atlas = effect_atlas()
+    if atlas.contient(nom, taille):
+        zone = atlas.zone(nom, taille, alpha)
+        return (atlas.surface, zone) if zone else None
+    sprite = sprites_effets().image(atlas.texture(nom, taille), None, alpha)
+    return (sprite, None) if sprite else None
+
+
+# Drawn size of each particle texture (the size of the former effect PNGs)
+TAILLES_PARTICULES = {'phase': (128, 128)}
+
 
 class WarningIndicator:
+    __slots__ = ('rect', 'duration', 'start_time', 'alpha', 'texture')
+
     def __init__(self, x, y, width, height, duration=BossConstants.WARNING_DURATION, images=None):
         self.rect = pygame.Rect(x, y, width, height)
         self.duration = duration
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = timing.get_ticks()
         self.alpha = BossConstants.WARNING_ALPHA
-        self.image = images['effects']['warning'] if images and 'effects' in images else None
+        self.texture = images is not None  # Shape fallback when drawn without the game's textures
         
-    def update(self):
-        current_time = pygame.time.get_ticks()
+    def update(self, maintenant=None):
+        current_time = timing.get_ticks() if maintenant is None else maintenant
         progress = (current_time - self.start_time) / self.duration
         
         if progress >= 1:
@@ -23,31 +116,30 @@ class WarningIndicator:
         return False
         
     def draw(self, surface):
-        if self.image:
-            # Scale image to fit the rect
-            scaled_image = pygame.transform.scale(self.image, (self.rect.width, self.rect.height))
-            # Set alpha
-            scaled_image.set_alpha(self.alpha)
-            surface.blit(scaled_image, self.rect)
+        if self.texture:
+            # Texture at the rect's size
+            sprite = sprite_effet('warning', tuple(self.rect.size), self.alpha)
         else:
-            # Fallback to shape drawing if image not available
-            warning_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(warning_surface, (255, 0, 0, self.alpha), warning_surface.get_rect())
-            surface.blit(warning_surface, self.rect)
+            sprite = sprites_effets().forme('rect', self.rect.size, (255, 0, 0), self.alpha)
+            sprite = (sprite, None) if sprite else None
+        if sprite:
+            surface.blit(sprite[0], self.rect, sprite[1])
 
 class DangerZone:
+    __slots__ = ('x', 'y', 'radius', 'duration', 'start_time', 'alpha', 'texture', 'target')
+
     def __init__(self, x, y, radius, duration=BossConstants.DANGER_ZONE_DURATION, images=None, target=None):
         self.x = x
         self.y = y
         self.radius = radius
         self.duration = duration
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = timing.get_ticks()
         self.alpha = BossConstants.WARNING_ALPHA
-        self.image = images['effects']['danger'] if images and 'effects' in images else None
+        self.texture = images is not None
         self.target = target  # Store reference to target (player ship)
         
-    def update(self):
-        current_time = pygame.time.get_ticks()
+    def update(self, maintenant=None):
+        current_time = timing.get_ticks() if maintenant is None else maintenant
         progress = (current_time - self.start_time) / self.duration
         
         if progress >= 1:
@@ -63,32 +155,35 @@ class DangerZone:
         return False
         
     def draw(self, surface):
-        if self.image:
-            # Scale image to fit the danger zone
-            size = self.radius * 2
-            scaled_image = pygame.transform.scale(self.image, (size, size))
-            # Set alpha
-            scaled_image.set_alpha(self.alpha)
-            surface.blit(scaled_image, (self.x - self.radius, self.y - self.radius))
+        # Same size every frame while following the player: scaled once
+        taille = (self.radius * 2, self.radius * 2)
+        if self.texture:
+            sprite = sprite_effet('danger', taille, self.alpha)
         else:
-            # Fallback to shape drawing if image not available
-            warning_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(warning_surface, (255, 0, 0, self.alpha), (self.radius, self.radius), self.radius)
-            surface.blit(warning_surface, (self.x - self.radius, self.y - self.radius))
+            sprite = sprites_effets().forme('cercle', taille, (255, 0, 0), self.alpha)
+            sprite = (sprite, None) if sprite else None
+        if sprite:
+            surface.blit(sprite[0], (self.x - self.radius, self.y - self.radius), sprite[1])
 
 class Particle:
+    __slots__ = ('x', 'y', 'color', 'velocity', 'lifetime', 'start_time', 'alpha', 'texture')
+
     def __init__(self, x, y, color, velocity, lifetime=BossConstants.PARTICLE_LIFETIME, images=None, particle_type='particle'):
         self.x = x
         self.y = y
         self.color = color
         self.velocity = velocity
         self.lifetime = lifetime
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = timing.get_ticks()
         self.alpha = 255
-        self.image = images['effects'][particle_type] if images and 'effects' in images else None
+        # Unknown types use the plain particle; no textures: a circle of `color`
+        if images is None:
+            self.texture = None
+        else:
+            self.texture = particle_type if particle_type in TEXTURES else 'particle'
         
-    def update(self):
-        current_time = pygame.time.get_ticks()
+    def update(self, maintenant=None):
+        current_time = timing.get_ticks() if maintenant is None else maintenant
         progress = (current_time - self.start_time) / self.lifetime
         
         if progress >= 1:
@@ -99,47 +194,57 @@ class Particle:
         self.alpha = int(255 * (1 - progress))
         return False
         
+    def sprite(self):
+        """(source, position, area) to blit, or None when invisible."""
+        if self.alpha <= 0:
+            return None
+        if self.texture:
+            sprite = sprite_effet(self.texture, TAILLES_PARTICULES.get(self.texture, (4, 4)), self.alpha)
+        else:
+            sprite = sprites_effets().forme('cercle', (4, 4), self.color, self.alpha)
+            sprite = (sprite, None) if sprite else None
+        if sprite is None:
+            return None
+        return sprite[0], (int(self.x), int(self.y)), sprite[1]
+
     def draw(self, surface):
-        if self.alpha > 0:
-            if self.image:
-                # Create a copy of the image for alpha modification
-                particle_surface = self.image.copy()
-                particle_surface.set_alpha(self.alpha)
-                surface.blit(particle_surface, (int(self.x), int(self.y)))
-            else:
-                # Fallback to shape drawing if image not available
-                color_with_alpha = (*self.color, self.alpha)
-                particle_surface = pygame.Surface((4, 4), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surface, color_with_alpha, (2, 2), 2)
-                surface.blit(particle_surface, (int(self.x), int(self.y)))
+        sprite = self.sprite()
+        if sprite:
+            surface.blit(*sprite)
+
+
+def dessiner_particules(surface, particules):
+    """Blit a batch of particles in one call."""
+    surface.blits([sprite for sprite in (p.sprite() for p in particules) if sprite], False)
 
 class TransitionEffect:
+    __slots__ = ('duration', 'start_time', 'particles', 'images')
+
     def __init__(self, duration=BossConstants.TRANSITION_DURATION, images=None):
         self.duration = duration
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = timing.get_ticks()
         self.particles = []
         self.images = images
         self.generate_particles()
         
     def generate_particles(self, num_particles=50):
-        for _ in range(num_particles):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(2, 5)
+        for _ in range(qualite().nombre_particules(num_particles)):
+            angle = _rng_visuel.uniform(0, math.pi * 2)
+            speed = _rng_visuel.uniform(2, 5)
             velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            color = (random.randint(200, 255), random.randint(100, 200), 0)  # Orange-yellow colors
+            color = (_rng_visuel.randint(200, 255), _rng_visuel.randint(100, 200), 0)  # Orange-yellow colors
             self.particles.append(Particle(LARGEUR//2, HAUTEUR//2, color, velocity, images=self.images, particle_type='phase'))
             
-    def update(self):
-        current_time = pygame.time.get_ticks()
+    def update(self, maintenant=None):
+        current_time = timing.get_ticks() if maintenant is None else maintenant
         if current_time - self.start_time > self.duration:
             return True  # Effect finished
             
-        self.particles = [p for p in self.particles if not p.update()]
+        self.particles = [p for p in self.particles if not p.update(current_time)]
         return False
         
     def draw(self, surface):
-        for particle in self.particles:
-            particle.draw(surface)
+        dessiner_particules(surface, self.particles)
 
 class EffectManager:
     def __init__(self, images=None):
@@ -156,27 +261,37 @@ class EffectManager:
         self.danger_zones.append(DangerZone(x, y, radius, duration, self.images, target))
         
     def add_particles(self, x, y, num_particles=10, color=(255, 255, 0), particle_type='particle'):
-        for _ in range(num_particles):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(1, 3)
+        for _ in range(qualite().nombre_particules(num_particles)):
+            angle = _rng_visuel.uniform(0, math.pi * 2)
+            speed = _rng_visuel.uniform(1, 3)
             velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
             self.particles.append(Particle(x, y, color, velocity, images=self.images, particle_type=particle_type))
             
     def add_transition(self):
         self.transition_effects.append(TransitionEffect(images=self.images))
         
-    def update(self):
-        self.warning_indicators = [w for w in self.warning_indicators if not w.update()]
-        self.danger_zones = [d for d in self.danger_zones if not d.update()]
-        self.particles = [p for p in self.particles if not p.update()]
-        self.transition_effects = [t for t in self.transition_effects if not t.update()]
+    def update(self, maintenant=None):
+        # One clock read for every effect of the manager
+        if maintenant is None:
+            maintenant = timing.get_ticks()
+        self.warning_indicators = [w for w in self.warning_indicators if not w.update(maintenant)]
+        self.danger_zones = [d for d in self.danger_zones if not d.update(maintenant)]
+        self.particles = [p for p in self.particles if not p.update(maintenant)]
+        self.transition_effects = [t for t in self.transition_effects if not t.update(maintenant)]
         
-    def draw(self, surface):
+    def draw_under(self, surface):
+        """Layer under the owner's sprite: warnings and danger zones."""
         for warning in self.warning_indicators:
             warning.draw(surface)
         for zone in self.danger_zones:
             zone.draw(surface)
-        for particle in self.particles:
-            particle.draw(surface)
+
+    def draw_over(self, surface):
+        """Layer over the owner's sprite: particles and transitions."""
+        dessiner_particules(surface, self.particles)
         for transition in self.transition_effects:
             transition.draw(surface)
+
+    def draw(self, surface):
+        self.draw_under(surface)
+        self.draw_over(surface)
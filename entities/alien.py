@@ -7,6 +7,7 @@ It includes both standard aliens and formation-based aliens with unique movement
 Classes:
     Envahisseur: Base alien class with standard movement and shooting mechanics
     FormationAlien: Advanced alien class that moves in specific patterns (triangle, circle, wave)
+    ClassicGrid: Block controller moving the classic Envahisseur grid with a single offset
 
 Formation Types:
     - Triangle: 5 rows increasing in size, front row shoots more frequently
@@ -14,15 +15,19 @@ Formation Types:
     - Wave: 6 rows of 8 aliens moving in a wave pattern with synchronized shooting
 """
 
-import pygame
 import random
 import math
+from utils import timing
+from assets import prechauffer_explosions
+from systems.collisions import masques
 from config import (
     VITESSE_ALIEN,
     HAUTEUR,
     FREQUENCE_TIR_ALIEN_BASE,
     FREQUENCE_TIR_REDUCTION_BOSS,
     VITESSE_ALIEN_POST_BOSS,
+    VITESSE_DESCENTE,
+    ALIEN_GRID_LEGACY_MOVEMENT,
     LARGEUR
 )
 
@@ -40,6 +45,11 @@ class Envahisseur:
         points: Score value when destroyed
         chance_tir: Probability of shooting in any given frame
     """
+    # Formations can hold hundreds of aliens: no per-instance __dict__
+    __slots__ = ('image', 'rect', 'type_alien', 'niveau', 'rangee', 'vaisseau_index',
+                 'direction', 'derniere_position', 'dernier_tir', 'vitesse', 'sante',
+                 'y_initial', 'limite_descente', 'grille', 'points', 'chance_tir')
+
     def __init__(self, x, y, type_alien, niveau, rangee, image, post_boss=False):
         self.image = image
         self.rect = self.image.get_rect()
@@ -48,14 +58,15 @@ class Envahisseur:
         self.type_alien = type_alien
         self.niveau = niveau
         self.rangee = rangee
-        self.vaisseau_index = rangee % 6
+        self.vaisseau_index = rangee % 6  # Ship sprite (and explosion) number - 1
         self.direction = 1
         self.derniere_position = x
-        self.dernier_tir = pygame.time.get_ticks()
+        self.dernier_tir = timing.get_ticks()
         self.vitesse = (VITESSE_ALIEN + (niveau - 1) * 0.2) * (VITESSE_ALIEN_POST_BOSS if post_boss else 1)
         self.sante = 1 + (niveau // 3)
         self.y_initial = y
         self.limite_descente = HAUTEUR - 100
+        self.grille = None  # (colonne, rangee, base_x, base_y) when driven by a ClassicGrid
         
         # Points calculation
         self.points = 100 + (type_alien * 50) + ((5 - (rangee % 6)) * 25)
@@ -74,7 +85,7 @@ class Envahisseur:
             return True
         return False
 
-    def tirer(self, boss_present=False):
+    def tirer(self, boss_present=False, maintenant=None):
         if boss_present:
             self.chance_tir *= FREQUENCE_TIR_REDUCTION_BOSS
         
@@ -86,6 +97,9 @@ class Envahisseur:
         self.sante -= degats
         return self.sante <= 0
 
+    def zone_collision(self):
+        return masques().masque(self.image), self.rect.topleft
+
     def dessiner(self, fenetre):
         fenetre.blit(self.image, self.rect)
 
@@ -117,6 +131,10 @@ class FormationAlien(Envahisseur):
             - Shooting frequency increases at wave peaks/troughs
             - Phase calculated based on column position
     """
+    __slots__ = ('formation_id', 'position_in_formation', 'formation_offset_x', 'formation_offset_y',
+                 'formation_angle', 'base_x', 'base_y', 'initial_x', 'global_offset_x',
+                 'is_post_boss', 'movement_speed')
+
     def __init__(self, x, y, type_alien, niveau, rangee, image, formation_id, position_in_formation, post_boss=False):
         super().__init__(x, y, type_alien, niveau, rangee, image, post_boss)
         self.formation_id = formation_id
@@ -133,7 +151,7 @@ class FormationAlien(Envahisseur):
         self.movement_speed = VITESSE_ALIEN * (1.5 if post_boss else 1.0)
         
         # Enhanced shooting attributes
-        self.dernier_tir = pygame.time.get_ticks()
+        self.dernier_tir = timing.get_ticks()
         # Increase shooting chance based on formation type and position
         if formation_id == 'triangle':
             # Front row aliens shoot more frequently
@@ -230,8 +248,8 @@ class FormationAlien(Envahisseur):
         self.rect.x = int(self.base_x + self.formation_offset_x)
         self.rect.y = int(self.base_y + self.formation_offset_y)
 
-    def tirer(self, boss_present=False):
-        current_time = pygame.time.get_ticks()
+    def tirer(self, boss_present=False, maintenant=None):
+        current_time = timing.get_ticks() if maintenant is None else maintenant
         
         # Add cooldown between shots
         if current_time - self.dernier_tir < 1000:  # 1 second cooldown
@@ -263,6 +281,150 @@ class FormationAlien(Envahisseur):
             
         return False
 
+class ClassicGrid:
+    """
+    Moves the classic Envahisseur formation as one block.
+    
+    Aliens keep their spawn position as a grid base and are placed at base + block
+    offset every tick. Live column extents and the lowest live row are tracked
+    incrementally through retirer(), so edge and bottom checks are O(1) instead of
+    a scan over every alien.
+    
+    Attributes:
+        legacy: When True, replays the original per-alien rules (two deplacer()
+            steps per tick with separate 50px and screen-edge checks)
+        offset_x, offset_y: Block displacement from the spawn positions, in
+            whole pixels: the block moves by two deplacer() steps per tick, each
+            rounded like the rect.x it used to move
+        gauche, droite: Indices of the leftmost/rightmost columns with live aliens
+        bas: Index of the lowest row with live aliens
+    """
+    def __init__(self, aliens, legacy=None, marge=50, descente=None):
+        # Config read at construction so overridden constants (sweeps) apply
+        self.legacy = ALIEN_GRID_LEGACY_MOVEMENT if legacy is None else legacy
+        self.marge = marge
+        self.descente = VITESSE_DESCENTE if descente is None else descente
+        self.direction = 1
+        self.offset_x = 0
+        self.offset_y = 0.0
+        self.aliens = {}  # alien -> alien, insertion ordered for the legacy loops
+        self.vitesse = aliens[0].vitesse if aliens else VITESSE_ALIEN
+        self.largeur_alien = aliens[0].rect.width if aliens else 0
+        self.limite_descente = aliens[0].limite_descente if aliens else HAUTEUR - 100
+        
+        colonnes_x = sorted({alien.rect.x for alien in aliens})
+        rangees_y = sorted({alien.rect.y for alien in aliens})
+        index_colonne = {x: i for i, x in enumerate(colonnes_x)}
+        index_rangee = {y: i for i, y in enumerate(rangees_y)}
+        self.colonnes_x = colonnes_x
+        self.rangees_bas = [0] * len(rangees_y)
+        self.par_colonne = [0] * len(colonnes_x)
+        self.par_rangee = [0] * len(rangees_y)
+        
+        for alien in aliens:
+            colonne = index_colonne[alien.rect.x]
+            rangee = index_rangee[alien.rect.y]
+            alien.grille = (colonne, rangee, alien.rect.x, alien.rect.y)
+            self.aliens[alien] = alien
+            self.par_colonne[colonne] += 1
+            self.par_rangee[rangee] += 1
+            self.rangees_bas[rangee] = max(self.rangees_bas[rangee], alien.rect.bottom)
+        
+        self.gauche = 0
+        self.droite = len(colonnes_x) - 1
+        self.bas = len(rangees_y) - 1
+
+    def __len__(self):
+        return len(self.aliens)
+
+    def retirer(self, alien):
+        """Forget a dead alien and shrink the live extents if it emptied an edge."""
+        if self.aliens.pop(alien, None) is None:
+            return
+        colonne, rangee = alien.grille[0], alien.grille[1]
+        self.par_colonne[colonne] -= 1
+        self.par_rangee[rangee] -= 1
+        while self.gauche <= self.droite and self.par_colonne[self.gauche] == 0:
+            self.gauche += 1
+        while self.droite >= self.gauche and self.par_colonne[self.droite] == 0:
+            self.droite -= 1
+        while self.bas >= 0 and self.par_rangee[self.bas] == 0:
+            self.bas -= 1
+
+    def update(self):
+        """Advance the block one tick; returns True if it reached the bottom."""
+        if not self.aliens:
+            return False
+        if self.legacy:
+            return self._update_legacy()
+        
+        self.offset_x += self._pas()
+        self.offset_x += self._pas()
+        gauche = self.colonnes_x[self.gauche] + self.offset_x
+        droite = self.colonnes_x[self.droite] + self.offset_x
+        if (gauche <= self.marge and self.direction < 0) or \
+           (droite >= LARGEUR - self.marge and self.direction > 0):
+            self.direction *= -1
+            self.offset_y += self.descente
+        
+        # Clamp like descendre() so the block stops at the descent limit
+        en_bas = False
+        depassement = self.rangees_bas[self.bas] + self.offset_y - self.limite_descente
+        if depassement > 0:
+            self.offset_y -= depassement
+            en_bas = True
+        
+        offset_x = self.offset_x
+        offset_y = self.offset_y
+        for alien in self.aliens.values():
+            grille = alien.grille
+            alien.rect.x = int(grille[2] + offset_x)
+            alien.rect.y = int(grille[3] + offset_y)
+        return en_bas
+
+    def _pas(self):
+        """Whole pixels one deplacer() step moves the block.
+
+        Assigning a float to rect.x rounds it half up, so the step is the
+        rounded speed, whatever column it is measured on.
+        """
+        x = self.colonnes_x[self.gauche] + self.offset_x
+        return math.floor(x + self.direction * self.vitesse + 0.5) - x
+
+    def _update_legacy(self):
+        """Original per-alien movement: two steps and two edge checks per tick."""
+        en_bas = False
+        aliens = list(self.aliens.values())
+        
+        direction_change = False
+        for alien in aliens:
+            new_x = alien.deplacer()
+            if (new_x <= self.marge and alien.direction < 0) or \
+               (new_x >= LARGEUR - self.marge and alien.direction > 0):
+                direction_change = True
+        
+        if direction_change:
+            for alien in aliens:
+                alien.direction *= -1
+                if alien.descendre(self.descente):
+                    en_bas = True
+        
+        move_down = False
+        for alien in aliens:
+            new_x = alien.deplacer()
+            if (new_x <= 0 and alien.direction < 0) or (new_x >= LARGEUR - alien.rect.width and alien.direction > 0):
+                move_down = True
+                break
+        
+        if move_down:
+            for alien in aliens:
+                alien.direction *= -1
+                if alien.descendre(self.descente):
+                    en_bas = True
+        
+        self.direction = aliens[0].direction
+        return en_bas
+
 def creer_envahisseurs(niveau, images, post_boss=False):
     """
     Factory function to create aliens in various formations.
@@ -364,4 +526,11 @@ def creer_envahisseurs(niveau, images, post_boss=False):
                                   images[rangee % 6], post_boss)
                 envahisseurs.append(alien)
     
+    # Formations pick sprites by column or position: record the ship actually used
+    index_images = {id(image): index for index, image in enumerate(images)}
+    for alien in envahisseurs:
+        alien.vaisseau_index = index_images.get(id(alien.image), alien.vaisseau_index)
+    # Decode this wave's explosion frames in the background before the first kill
+    prechauffer_explosions({alien.vaisseau_index + 1 for alien in envahisseurs})
+    
     return envahisseurs
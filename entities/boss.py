@@ -2,11 +2,52 @@ import pygame
 import random
 import math
 from .boss_patterns import *
+from .bullet_patterns import BulletPatternEngine
 from effects.visual_effects import EffectManager
 from entities.explosion import Explosion
 from config import LARGEUR, HAUTEUR, BossConstants
+from utils import timing
+from systems.collisions import masques
+
+# Flash frames, shared by every boss drawn with the same image
+_images_flash = {}  # id(image) -> (image, flash)
+
+
+def image_flash(image):
+    """The hit-flash version of a boss image, built once per image."""
+    entree = _images_flash.get(id(image))
+    if entree is None or entree[0] is not image:
+        flash = image.copy()
+        flash.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
+        entree = _images_flash[id(image)] = (image, flash)
+    return entree[1]
+
+
+def dessiner_boss(bosses, fenetre):
+    """Draw bosses layer by layer, each layer once for all of them.
+
+    Every boss's warnings and danger zones go under every boss sprite, and
+    particles, explosions and health bars over them, so overlapping bosses
+    never cover each other's indicators.
+    """
+    for boss in bosses:
+        boss.effect_manager.draw_under(fenetre)
+    for boss in bosses:
+        if not boss.is_dead:
+            fenetre.blit(image_flash(boss.image) if boss.flash_timer > 0 else boss.image, boss.rect)
+    for boss in bosses:
+        boss.effect_manager.draw_over(fenetre)
+        if not boss.is_dead:
+            for explosion in boss.explosions:
+                explosion.draw(fenetre)
+    for boss in bosses:
+        if not boss.is_dead:
+            fenetre.blit(boss.barre_de_vie(), (boss.rect.x, boss.rect.y - 20))
+
 
 class Boss(pygame.sprite.Sprite):
+    _barre = None  # (health, width, surface) of the last health bar drawn
+
     def __init__(self, niveau, image, images=None, sound_manager=None):
         pygame.sprite.Sprite.__init__(self)
         
@@ -16,7 +57,7 @@ class Boss(pygame.sprite.Sprite):
         # Use the pre-scaled image directly
         try:
             self.original_image = image
-            self.image = self.original_image.copy()
+            self.image = self.original_image
         except Exception as e:
             print(f"Error initializing boss image: {e}")
             raise
@@ -46,10 +87,10 @@ class Boss(pygame.sprite.Sprite):
         # State and pattern optimization
         self.direction = 1
         self.phase = 1
-        self.current_time = pygame.time.get_ticks()
+        self.current_time = timing.get_ticks()
         self.last_shot = self.current_time
         self.dernier_tir = self.current_time
-        self.explosions = pygame.sprite.Group()
+        self.explosions = []  # Explosion instances drawn over the boss
         self.damaged_timer = 0
         self.damaged_duration = 100
         self.is_dead = False
@@ -61,13 +102,12 @@ class Boss(pygame.sprite.Sprite):
         # Visual feedback optimization
         self.flash_timer = 0
         self.flash_duration = 200
-        self.flash_image = self.create_flash_image()
         
         # Pattern attributes - pre-calculate common values
         self.angle_rotation = 0
         self.amplitude_y = 50
         self.frequence_y = 0.05
-        self.pattern_time = pygame.time.get_ticks()
+        self.pattern_time = timing.get_ticks()
         self.pattern_duration = 5000
         self.dash_speed = self.speed * 3
         self.dash_target = None
@@ -90,6 +130,10 @@ class Boss(pygame.sprite.Sprite):
             3: self.max_health * 0.3
         }
         
+        # Data-driven fire patterns (see data/bullet_patterns.json)
+        projectile_images = images.get('projectile_alien') if images else None
+        self.bullet_engine = BulletPatternEngine(niveau, image_count=len(projectile_images or [None]))
+        
         # Movement optimization
         self.shot_cooldown = BossConstants.SHOT_COOLDOWN
         self.velocity = [0, 0]
@@ -97,11 +141,11 @@ class Boss(pygame.sprite.Sprite):
 
     def update(self, player_pos=None):
         # Cache current time to avoid multiple calls
-        self.current_time = pygame.time.get_ticks()
+        self.current_time = timing.get_ticks()
         
         # Early return for dead state
         if self.is_dead:
-            self.explosions.update()
+            self.animer_explosions()
             self.effect_manager.update()
             return
         
@@ -130,7 +174,12 @@ class Boss(pygame.sprite.Sprite):
         
         # Update effects
         self.effect_manager.update()
-        self.explosions.update()
+        self.animer_explosions()
+
+    def animer_explosions(self):
+        """Advance the boss's own explosions; finished ones are dropped."""
+        self.explosions = [explosion for explosion in self.explosions
+                           if not explosion.update(self.current_time)]
 
     def deplacer(self, position_joueur=None):
         # Apply velocity with smooth boundary checks
@@ -156,8 +205,8 @@ class Boss(pygame.sprite.Sprite):
         self.rect.centerx = new_x
         self.rect.centery = new_y
         
-    def tirer(self, position_joueur):
-        current_time = pygame.time.get_ticks()
+    def tirer(self, position_joueur, store=None):
+        current_time = timing.get_ticks()
         delai = BossConstants.DELAI_TIR * (0.7 if self.en_rage else 1.0)  # Faster shooting in rage mode
         
         if current_time - self.dernier_tir > delai:
@@ -180,54 +229,34 @@ class Boss(pygame.sprite.Sprite):
                     target=target  # Pass the player object as target
                 )
             
-            return self.creer_projectiles(position_joueur)
-        return []
+            return self.creer_projectiles(position_joueur, store)
+        return [] if store is None else 0
 
-    def creer_projectiles(self, position_joueur):
-        projectiles = []
+    def creer_projectiles(self, position_joueur, store=None):
+        """Emit the volley for the current phase.
         
+        With a store (ProjectileBatch) the bullets go straight into it and the
+        bullet count is returned; otherwise a list of (x, y, dx, dy) tuples is.
+        """
         # Get player position coordinates
-        if hasattr(position_joueur, 'rect'):
+        if position_joueur is None:
+            target = None
+        elif hasattr(position_joueur, 'rect'):
             # If we received a Player object
-            player_x = position_joueur.rect.centerx
-            player_y = position_joueur.rect.centery
+            target = position_joueur.rect.center
         else:
             # If we received a position tuple
-            player_x, player_y = position_joueur
+            target = position_joueur
         
-        if self.phase == 1:
-            # Phase 1: Spread shots
-            angles = [-45, -30, 0, 30, 45] if self.en_rage else [-30, 0, 30]
-            vitesse = 4 if self.en_rage else 3
-            
-            for angle in angles:
-                rad_angle = math.radians(angle)
-                dx = math.sin(rad_angle) * vitesse
-                dy = math.cos(rad_angle) * vitesse
-                projectiles.append((self.rect.centerx, self.rect.bottom, dx, dy))
-        else:
-            # Phase 2: Aimed shots plus spread
-            dx = player_x - self.rect.centerx
-            dy = player_y - self.rect.centery
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance > 0:
-                vitesse = 5 if self.en_rage else 4
-                dx = (dx / distance) * vitesse
-                dy = (dy / distance) * vitesse
-                
-                # Add main shot
-                projectiles.append((self.rect.centerx, self.rect.bottom, dx, dy))
-                
-                # Add side shots in rage mode
-                if self.en_rage:
-                    angles = [-15, 15]
-                    for angle in angles:
-                        rad_angle = math.radians(angle)
-                        new_dx = dx * math.cos(rad_angle) - dy * math.sin(rad_angle)
-                        new_dy = dx * math.sin(rad_angle) + dy * math.cos(rad_angle)
-                        projectiles.append((self.rect.centerx, self.rect.bottom, new_dx, new_dy))
+        origin = (self.rect.centerx, self.rect.bottom)
+        if store is not None:
+            return self.bullet_engine.emit(self.phase, self.en_rage, origin, target, store.spawn)
         
+        projectiles = []
+        self.bullet_engine.emit(
+            self.phase, self.en_rage, origin, target,
+            lambda x, y, dx, dy, image_index: projectiles.append((x, y, dx, dy))
+        )
         return projectiles
 
     def prendre_degats(self, degats):
@@ -318,40 +347,28 @@ class Boss(pygame.sprite.Sprite):
         )
 
     def draw(self, fenetre):
-        if self.is_dead:
-            self.effect_manager.draw(fenetre)
-            return
-            
-        # Draw warning/danger zones first
-        self.effect_manager.draw(fenetre)
-        
-        # Draw the boss
-        if self.flash_timer > 0:
-            fenetre.blit(self.flash_image, self.rect)
-        else:
-            fenetre.blit(self.image, self.rect)
-        
-        # Draw active effects
-        self.effect_manager.draw(fenetre)
-        
-        # Draw explosions
-        for explosion in self.explosions:
-            explosion.draw(fenetre)
-            
-        # Draw health bar
+        dessiner_boss((self,), fenetre)
+
+    def zone_collision(self):
+        # The hit flash is drawn from the same pixels: one mask for both
+        return masques().masque(self.image), self.rect.topleft
+
+    def barre_de_vie(self):
+        """Health bar surface, redrawn only when health (or width) changed."""
         barre_largeur = self.rect.width
-        barre_hauteur = 10
-        x = self.rect.x
-        y = self.rect.y - 20
-        
-        # Background (red)
-        pygame.draw.rect(fenetre, (255, 0, 0), (x, y, barre_largeur, barre_hauteur))
-        # Health (green)
-        sante_largeur = max(0, (self.health / self.max_health) * barre_largeur)
-        pygame.draw.rect(fenetre, (0, 255, 0), (x, y, sante_largeur, barre_hauteur))
+        if self._barre is None or self._barre[:2] != (self.health, barre_largeur):
+            # A new surface each time: snapshots may still share the previous one
+            barre = pygame.Surface((barre_largeur, 10))
+            # Background (red)
+            barre.fill((255, 0, 0))
+            # Health (green)
+            sante_largeur = max(0, (self.health / self.max_health) * barre_largeur)
+            barre.fill((0, 255, 0), (0, 0, int(sante_largeur), 10))
+            self._barre = (self.health, barre_largeur, barre)
+        return self._barre[2]
 
     def can_shoot(self):
-        now = pygame.time.get_ticks()
+        now = timing.get_ticks()
         if now - self.last_shot > BossConstants.DELAI_TIR:
             self.last_shot = now
             return True
@@ -373,7 +390,8 @@ class Boss(pygame.sprite.Sprite):
         self.current_pattern = pattern_class(self)
         self.current_pattern.start()
 
-    def create_flash_image(self):
-        flash = self.original_image.copy()
-        flash.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
-        return flash
+    def __getstate__(self):
+        # The health bar is derived from health; redrawn after a restore
+        state = self.__dict__.copy()
+        state.pop('_barre', None)
+        return state
@@ -1,7 +1,7 @@
 import math
 import random
 from config import LARGEUR, HAUTEUR, BossConstants
-import pygame
+from utils import timing
 
 class BossPattern:
     def __init__(self, boss):
@@ -16,7 +16,7 @@ class BossPattern:
         self.height = (boss.max_y - boss.min_y)
         
     def start(self):
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = timing.get_ticks()
         self.is_finished = False
         
     def update(self, player_pos):
@@ -24,7 +24,7 @@ class BossPattern:
         if self.is_finished:
             return True
             
-        current_time = pygame.time.get_ticks()
+        current_time = timing.get_ticks()
         progress = (current_time - self.start_time) / self.duration
         
         if progress >= 1:
@@ -60,7 +60,7 @@ class SineWavePattern(BossPattern):
         if super().update(player_pos):  # Check if pattern should end
             return True
             
-        current_time = pygame.time.get_ticks()
+        current_time = timing.get_ticks()
         progress = (current_time - self.start_time) / self.duration
             
         # Check screen bounds and reverse direction if needed
@@ -0,0 +1,199 @@
+"""
+Bullet Pattern Engine
+
+Data-driven boss fire patterns. Emitter definitions are read from
+data/bullet_patterns.json and emitted straight into a ProjectileBatch (or any
+callable taking x, y, dx, dy, image_index) with per-bullet velocities.
+
+Emitter Types:
+    - spread: fixed fan of angles (0 = straight down, positive = to the right)
+    - aimed: `count` shots centered on the player, `spread` degrees apart
+    - ring: `count` shots evenly around the boss, rotated by `rotation_step` each volley
+    - spiral: `arms` arms of `count` shots, each shot turning by `angle_step`
+      and speeding up by `speed_step` so the volley unrolls into a spiral
+    - wave: `count` shots over an `arc` whose speeds follow a sine, giving a
+      rippling front that shifts by `phase_step` each volley
+"""
+
+import json
+import math
+import os
+import random
+from config import BULLET_PATTERNS_FILE
+
+# Used when the data file is missing or invalid; mirrors the original hardcoded shots
+DEFAULT_DEFINITIONS = {
+    'version': 1,
+    'max_bullets': 4000,
+    'patterns': {
+        'phase1': [{'type': 'spread', 'angles': [-30, 0, 30], 'speed': 3}],
+        'phase1_rage': [{'type': 'spread', 'angles': [-45, -30, 0, 30, 45], 'speed': 4}],
+        'phase2': [{'type': 'aimed', 'count': 1, 'speed': 4}],
+        'phase2_rage': [{'type': 'aimed', 'count': 3, 'spread': 15, 'speed': 5}],
+        'phase3_rage': [{'type': 'aimed', 'count': 3, 'spread': 15, 'speed': 5}],
+    },
+    'escalation': [],
+}
+
+_definitions_cache = {}
+
+
+def charger_definitions(path=BULLET_PATTERNS_FILE):
+    """Load emitter definitions once per path, falling back to the defaults."""
+    if path in _definitions_cache:
+        return _definitions_cache[path]
+
+    definitions = DEFAULT_DEFINITIONS
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as handle:
+                data = json.load(handle)
+            if isinstance(data.get('patterns'), dict):
+                definitions = data
+            else:
+                print(f"Warning: No patterns found in {path}, using defaults")
+        except (OSError, ValueError) as e:
+            print(f"Error loading bullet patterns {path}: {e}")
+    else:
+        print(f"Warning: Bullet pattern file not found: {path}")
+
+    _definitions_cache[path] = definitions
+    return definitions
+
+
+def _direction(angle_deg, speed):
+    rad = math.radians(angle_deg)
+    return math.sin(rad) * speed, math.cos(rad) * speed
+
+
+def _emit_spread(emitter, state, ox, oy, aim_angle, image_index, spawn):
+    speed = emitter.get('speed', 3)
+    count = 0
+    for angle in emitter.get('angles', (0,)):
+        dx, dy = _direction(angle, speed)
+        spawn(ox, oy, dx, dy, image_index)
+        count += 1
+    return count
+
+
+def _emit_aimed(emitter, state, ox, oy, aim_angle, image_index, spawn):
+    if aim_angle is None:
+        return 0
+    speed = emitter.get('speed', 4)
+    shots = emitter.get('count', 1)
+    spread = emitter.get('spread', 0)
+    first = aim_angle - spread * (shots - 1) / 2
+    for i in range(shots):
+        dx, dy = _direction(first + i * spread, speed)
+        spawn(ox, oy, dx, dy, image_index)
+    return shots
+
+
+def _emit_ring(emitter, state, ox, oy, aim_angle, image_index, spawn):
+    speed = emitter.get('speed', 3)
+    shots = emitter.get('count', 16)
+    rotation = state.get('rotation', emitter.get('rotation', 0))
+    step = 360 / shots
+    for i in range(shots):
+        dx, dy = _direction(rotation + i * step, speed)
+        spawn(ox, oy, dx, dy, image_index)
+    state['rotation'] = (rotation + emitter.get('rotation_step', 0)) % 360
+    return shots
+
+
+def _emit_spiral(emitter, state, ox, oy, aim_angle, image_index, spawn):
+    arms = emitter.get('arms', 4)
+    per_arm = emitter.get('count', 8)
+    angle_step = emitter.get('angle_step', 8)
+    speed = emitter.get('speed', 2)
+    speed_step = emitter.get('speed_step', 0.25)
+    rotation = state.get('rotation', emitter.get('rotation', 0))
+    arm_step = 360 / arms
+    for arm in range(arms):
+        base = rotation + arm * arm_step
+        for i in range(per_arm):
+            dx, dy = _direction(base + i * angle_step, speed + i * speed_step)
+            spawn(ox, oy, dx, dy, image_index)
+    state['rotation'] = (rotation + emitter.get('rotation_step', 0)) % 360
+    return arms * per_arm
+
+
+def _emit_wave(emitter, state, ox, oy, aim_angle, image_index, spawn):
+    shots = emitter.get('count', 24)
+    arc = emitter.get('arc', 120)
+    speed = emitter.get('speed', 3)
+    amplitude = emitter.get('amplitude', 1)
+    wavelength = max(1, emitter.get('wavelength', 8))
+    phase = state.get('phase', 0.0)
+    first = -arc / 2
+    step = arc / (shots - 1) if shots > 1 else 0
+    for i in range(shots):
+        ripple = math.sin(2 * math.pi * i / wavelength + math.radians(phase))
+        dx, dy = _direction(first + i * step, speed + ripple * amplitude)
+        spawn(ox, oy, dx, dy, image_index)
+    state['phase'] = (phase + emitter.get('phase_step', 0)) % 360
+    return shots
+
+
+EMITTERS = {
+    'spread': _emit_spread,
+    'aimed': _emit_aimed,
+    'ring': _emit_ring,
+    'spiral': _emit_spiral,
+    'wave': _emit_wave,
+}
+
+
+class BulletPatternEngine:
+    """Per-boss emitter state on top of shared pattern definitions."""
+
+    def __init__(self, niveau=1, definitions=None, image_count=6):
+        self.niveau = niveau
+        self.definitions = definitions if definitions is not None else charger_definitions()
+        self.image_count = max(1, image_count)
+        self.max_bullets = self.definitions.get('max_bullets', DEFAULT_DEFINITIONS['max_bullets'])
+        self._volleys = {}
+        self._states = {}
+
+    def volley(self, phase, en_rage):
+        """Return the resolved emitter list for a phase, cached per (phase, rage)."""
+        key = (phase, en_rage)
+        if key not in self._volleys:
+            patterns = self.definitions.get('patterns', {})
+            # A phase without its own volley falls back to the closest earlier one
+            names = []
+            for precedente in range(phase, 0, -1):
+                if en_rage:
+                    names.append(f'phase{precedente}_rage')
+                names.append(f'phase{precedente}')
+            emitters = []
+            for name in names:
+                if name in patterns:
+                    emitters = list(patterns[name])
+                    break
+
+            for stage in self.definitions.get('escalation', []):
+                if self.niveau >= stage.get('min_level', 1) and phase in stage.get('phases', (phase,)):
+                    emitters.extend(stage.get('emitters', []))
+
+            self._volleys[key] = [e for e in emitters if e.get('type') in EMITTERS]
+        return self._volleys[key]
+
+    def emit(self, phase, en_rage, origin, target, spawn):
+        """Emit one volley from `origin` towards `target`; returns the bullet count."""
+        ox, oy = origin
+        aim_angle = None
+        if target is not None:
+            dx = target[0] - ox
+            dy = target[1] - oy
+            if dx or dy:
+                aim_angle = math.degrees(math.atan2(dx, dy))
+
+        total = 0
+        for index, emitter in enumerate(self.volley(phase, en_rage)):
+            state = self._states.setdefault((phase, en_rage, index), {})
+            image_index = emitter.get('image')
+            if image_index is None:
+                image_index = random.randrange(self.image_count)
+            total += EMITTERS[emitter['type']](emitter, state, ox, oy, aim_angle, image_index, spawn)
+        return total
@@ -1,27 +1,61 @@
 import pygame
+from utils import timing
+from systems.ecs import dessiner_sprites
+
+class Explosion:
+    __slots__ = ('images', 'delai_frame', 'rect', 'frame_index', 'derniere_update')
 
-class Explosion(pygame.sprite.Sprite):
     def __init__(self, x, y, images, is_player=False):
-        super().__init__()
+        """`images` is a list of frames or a SequenceExplosion decoded as it plays."""
         self.images = images
         self.delai_frame = 100 if is_player else 50
-        self.image = self.images[0]  # Current image for sprite
-        self.rect = self.image.get_rect(center=(x, y))
+        # Sequences know their frame size, so nothing is decoded before the first draw
+        taille = getattr(images, 'taille', None) or images[0].get_size()
+        self.rect = pygame.Rect((0, 0), taille)
+        self.rect.center = (x, y)
         self.frame_index = 0
-        self.derniere_update = pygame.time.get_ticks()
+        self.derniere_update = timing.get_ticks()
+
+    @property
+    def image(self):
+        """Current frame (decoded on first use for sequences)."""
+        return self.images[min(self.frame_index, len(self.images) - 1)]
 
-    def update(self):
-        current_time = pygame.time.get_ticks()
+    def update(self, maintenant=None):
+        current_time = timing.get_ticks() if maintenant is None else maintenant
         if current_time - self.derniere_update > self.delai_frame:
             self.frame_index += 1
-            if self.frame_index < len(self.images):
-                self.image = self.images[self.frame_index]
             self.derniere_update = current_time
         return self.frame_index >= len(self.images)
 
     def dessiner(self, fenetre):  # Keep the original French name for consistency
         if self.frame_index < len(self.images):
             fenetre.blit(self.image, self.rect)
-            
+
     def draw(self, fenetre):  # Add alias for compatibility
         self.dessiner(fenetre)
+
+# Columns of the game's explosion archetype (systems.ecs); the boss keeps
+# its own Explosion sprites
+COMPOSANTS_EXPLOSION = ('x', 'y', 'taille', 'frames', 'frame', 'delai', 'derniere')
+
+def ajouter_explosion(explosions, x, y, images, is_player=False):
+    """Add an explosion row; `images` is a frame list or a SequenceExplosion."""
+    taille = getattr(images, 'taille', None) or images[0].get_size()
+    return explosions.ajouter(x=int(x), y=int(y), taille=taille, frames=images, frame=0,
+                              delai=100 if is_player else 50, derniere=timing.get_ticks())
+
+def animer_explosions(explosions, maintenant=None):
+    """Advance every explosion by one frame per delay; finished ones are destroyed."""
+    current_time = timing.get_ticks() if maintenant is None else maintenant
+    frame, delai, derniere = explosions.frame, explosions.delai, explosions.derniere
+    for i, frames in enumerate(explosions.frames):
+        if current_time - derniere[i] > delai[i]:
+            frame[i] += 1
+            derniere[i] = current_time
+        if frame[i] >= len(frames):
+            explosions.detruire(i)
+
+def dessiner_explosions(explosions, fenetre):
+    images = [frames[min(index, len(frames) - 1)] for frames, index in zip(explosions.frames, explosions.frame)]
+    dessiner_sprites(fenetre, images, explosions)
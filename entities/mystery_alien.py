@@ -3,16 +3,31 @@ import random
 import math
 import os
 from config import LARGEUR, HAUTEUR
+from systems.collisions import zone_tournee
+from systems.snapshot import slot_state, restore_slots
+
+_images = {}  # image number -> (original, scaled 80x80)
+
+def _charger_image(numero):
+    """Load each mystery alien image once and share it between spawns."""
+    if numero not in _images:
+        image_path = os.path.join('assets', 'images', 'misteryAliens', f'{numero}.png')
+        original = pygame.image.load(image_path).convert_alpha()
+        _images[numero] = (original, pygame.transform.scale(original, (80, 80)))
+    return _images[numero]
+
+class MysteryAlien:
+    __slots__ = ('image_number', 'original_image', 'base_image', 'image', 'rect', 'speed',
+                 'angle', 'amplitude', 'frequency', 'base_x', 'current_y', 'time_alive',
+                 'movement_pattern', 'direction', 'sound_manager', 'is_alive',
+                 'vertical_speed', 'circular_speed', 'zigzag_speed', 'rotation_step',
+                 'min_x', 'max_x', 'rotation_frame_skip', 'cached_rotated_images')
 
-class MysteryAlien(pygame.sprite.Sprite):
     def __init__(self, sound_manager=None):
-        super().__init__()
         # Load a random mystery alien image
         self.image_number = random.randint(1, 20)
-        image_path = os.path.join('assets', 'images', 'misteryAliens', f'{self.image_number}.png')
-        self.original_image = pygame.image.load(image_path).convert_alpha()
-        # Scale the image to be visible but not too large and cache it
-        self.base_image = pygame.transform.scale(self.original_image, (80, 80))
+        # Scaled to be visible but not too large, cached per image number
+        self.original_image, self.base_image = _charger_image(self.image_number)
         self.image = self.base_image
         self.rect = self.image.get_rect()
         
@@ -48,6 +63,26 @@ class MysteryAlien(pygame.sprite.Sprite):
         self.cached_rotated_images = {}  # Cache for rotated images
         
         print(f"Mystery Alien spawned: Pattern={self.movement_pattern}, Position=({self.rect.x}, {self.rect.y})")
+
+    def zone_collision(self):
+        return zone_tournee(self.base_image, self.angle, self.rect.center)
+
+    def __getstate__(self):
+        # Images are rebuilt from the image number rather than serialized
+        state = slot_state(self)
+        for name in ('original_image', 'base_image', 'image', 'cached_rotated_images'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        restore_slots(self, state)
+        self.original_image, self.base_image = _charger_image(self.image_number)
+        self.cached_rotated_images = {}
+        if self.angle:
+            self.image = pygame.transform.rotate(self.base_image, self.angle)
+            self.cached_rotated_images[self.angle] = self.image
+        else:
+            self.image = self.base_image
         
     def update(self):
         if not self.is_alive:  # Updated check
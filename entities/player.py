@@ -1,18 +1,25 @@
 import pygame
 from config import LARGEUR, HAUTEUR, DELAI_ENTRE_TIRS_JOUEUR, DELAI_ENTRE_TIRS_JOUEUR_RAPIDE
+from assets import charger_police
 from effects.powerup_effects import PowerupEffectManager
-from utils.control_settings import ControlSettings
+from utils import timing
+from systems.input_state import sample_keyboard, ACTION_LEFT, ACTION_RIGHT, ACTION_UP, ACTION_DOWN
+from systems.quality import qualite
+from systems.collisions import masques
 import os
 import random
 import math
 
+# Hit particles follow the quality preset: own generator, never the gameplay RNG
+_rng_visuel = random.Random()
+
 class PrecisionTracker:
     def __init__(self):
         self.tirs_total = 0
         self.tirs_reussis = 0
         self.current_streak = 0
         self.best_streak = 0
-        self.font = pygame.font.Font(None, 24)
+        self.font = charger_police(24)
         self.last_milestone = 0
         self.milestone_flash = 0
         self.milestone_alpha = 0
@@ -49,7 +56,7 @@ class Joueur(pygame.sprite.Sprite):
             original_image = pygame.image.load(os.path.join('assets', 'images', 'player', 'player1.png'))
             self.image = pygame.transform.scale(original_image, (80, 80))  # Scale to match menu size
         
-        self.original_image = self.image.copy()  # Store original image for hit effect
+        self.original_image = self.image  # Never modified; the hit flash draws from a copy
         self.rect = self.image.get_rect()
         self.rect.centerx = LARGEUR // 2
         self.rect.bottom = HAUTEUR - 20
@@ -63,12 +70,9 @@ class Joueur(pygame.sprite.Sprite):
         self.hit_flash_duration = 100  # Flash duration in milliseconds
         self.hit_particles = []
         
-        # Collision box adjustment
-        self.hitbox = self.rect.inflate(-20, -20)  # Smaller collision box
-        
         # Energy system
         self.energie = 100
-        self.derniere_recharge = pygame.time.get_ticks()
+        self.derniere_recharge = timing.get_ticks()
         
         # Shield
         self.shield_actif = False
@@ -110,31 +114,28 @@ class Joueur(pygame.sprite.Sprite):
     def set_sound_manager(self, sound_manager):
         self.sound_manager = sound_manager
 
-    def _get_action_key(self, action):
-        if self.controls:
-            return self.controls.get(action)
-        return ControlSettings.DEFAULT_BINDINGS[action]
+    def _actions(self, actions):
+        """Use the tick's action bitmask, or sample the live keyboard without one."""
+        if actions is None:
+            return sample_keyboard(self.controls)
+        return actions
 
-    def deplacer(self):
-        keys = pygame.key.get_pressed()
+    def deplacer(self, actions=None):
+        """Move by one tick of `actions` (or a dash) and stay on screen."""
+        actions = self._actions(actions)
         self.derniere_position = self.rect.x
 
-        left = self._get_action_key("move_left")
-        right = self._get_action_key("move_right")
-        up = self._get_action_key("move_up")
-        down = self._get_action_key("move_down")
-
         if self.en_dash:
             self.rect.x += self.dash_direction * self.dash_vitesse
         else:
-            if keys[left]:
+            if actions & ACTION_LEFT:
                 self.rect.x -= self.vitesse
-            if keys[right]:
+            if actions & ACTION_RIGHT:
                 self.rect.x += self.vitesse
 
-        if keys[up]:
+        if actions & ACTION_UP:
             self.rect.y -= self.vitesse
-        if keys[down]:
+        if actions & ACTION_DOWN:
             self.rect.y += self.vitesse
 
         # Keep player within screen bounds
@@ -152,23 +153,25 @@ class Joueur(pygame.sprite.Sprite):
             self.en_dash = True
             self.dash_direction = direction
             self.dash_disponible = False
-            self.dash_timer = pygame.time.get_ticks()
+            self.dash_timer = timing.get_ticks()
 
     def peut_tirer(self):
-        current_time = pygame.time.get_ticks()
+        current_time = timing.get_ticks()
         delai = self.rapid_fire_rate if self.rapid_fire else self.fire_rate
         if current_time - self.last_shot > delai:
             self.last_shot = current_time
             return True
         return False
 
-    def update(self):
-        current_time = pygame.time.get_ticks()
+    def update(self, actions=None, maintenant=None):
+        """One controller pass per tick: timers, movement from the action bitmask, effects."""
+        actions = self._actions(actions)
+        current_time = timing.get_ticks() if maintenant is None else maintenant
         
         # Update hit flash effect
         if self.hit_flash and current_time - self.hit_flash_start > self.hit_flash_duration:
             self.hit_flash = False
-            self.image = self.original_image.copy()
+            self.image = self.original_image
         
         # Update hit particles
         for particle in self.hit_particles[:]:
@@ -198,69 +201,21 @@ class Joueur(pygame.sprite.Sprite):
         if not self.dash_disponible and current_time - self.dash_timer > self.dash_cooldown:
             self.dash_disponible = True
         
-        # Update effect manager
-        if self.effect_manager:
-            self.effect_manager.update(self.rect)
-        
-        # Rest of the update code...
-        keys = pygame.key.get_pressed()
-        left = self._get_action_key("move_left")
-        right = self._get_action_key("move_right")
-        up = self._get_action_key("move_up")
-        down = self._get_action_key("move_down")
-
-        if keys[left]:
-            self.rect.x -= self.vitesse
-        if keys[right]:
-            self.rect.x += self.vitesse
-        if keys[up]:
-            self.rect.y -= self.vitesse
-        if keys[down]:
-            self.rect.y += self.vitesse
-
-        if self.rect.left < 0:
-            self.rect.left = 0
-        if self.rect.right > LARGEUR:
-            self.rect.right = LARGEUR
-        if self.rect.top < 0:
-            self.rect.top = 0
-        if self.rect.bottom > HAUTEUR:
-            self.rect.bottom = HAUTEUR
-
-        self.hitbox.centerx = self.rect.centerx
-        self.hitbox.centery = self.rect.centery
+        # Movement and bounds
+        self.deplacer(actions)
 
         # Recharge d'énergie
         if current_time - self.derniere_recharge >= 100:  # Recharge every 100ms
             if self.energie < 100:
                 self.energie = min(100, self.energie + 1)
             self.derniere_recharge = current_time
-            
-        # Mise à jour du bouclier
-        if self.shield_actif:
-            if current_time - self.shield_temps > self.shield_duree:
-                self.shield_actif = False
-                if self.effect_manager:
-                    self.effect_manager.active_shield = False
-                
-        # Mise à jour du tir rapide
-        if self.rapid_fire:
-            if current_time - self.rapid_fire_timer > self.rapid_fire_duration:
-                self.rapid_fire = False
-                if self.effect_manager:
-                    self.effect_manager.active_rapid_fire = False
-                
-        # Mise à jour de l'invincibilité
-        if self.est_invincible:
-            if current_time - self.temps_invincible > self.duree_invincibilite:
-                self.est_invincible = False
-                
-        # Mise à jour des effets
+        
+        # Update effect manager
         if self.effect_manager:
             self.effect_manager.update(self.rect)
 
     def shoot(self):
-        current_time = pygame.time.get_ticks()
+        current_time = timing.get_ticks()
         delai = self.rapid_fire_rate if self.rapid_fire else self.fire_rate
         if current_time - self.last_shot > delai:
             self.last_shot = current_time
@@ -272,7 +227,7 @@ class Joueur(pygame.sprite.Sprite):
     def activer_powerup(self, powerup_type):
         if powerup_type == "shield":
             self.shield_actif = True
-            self.shield_temps = pygame.time.get_ticks()
+            self.shield_temps = timing.get_ticks()
             if self.sound_manager:
                 self.sound_manager.play('shield', 0.7)
             if self.effect_manager:
@@ -284,7 +239,7 @@ class Joueur(pygame.sprite.Sprite):
                 )
         elif powerup_type == "fire":
             self.rapid_fire = True
-            self.rapid_fire_timer = pygame.time.get_ticks()
+            self.rapid_fire_timer = timing.get_ticks()
             if self.effect_manager:
                 self.effect_manager.active_rapid_fire = True
                 self.effect_manager.add_pickup_effect(
@@ -302,30 +257,48 @@ class Joueur(pygame.sprite.Sprite):
                     powerup_type
                 )
 
+    def zone_collision(self):
+        # Collisions follow the ship's opaque pixels (the flash keeps its outline)
+        return masques().masque(self.original_image), self.rect.topleft
+
+    def _image_flash(self):
+        flash_image = self.original_image.copy()
+        flash_image.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
+        return flash_image
+
+    def __getstate__(self):
+        # Snapshots reference the ship image by asset ID; the flash is rebuilt
+        state = self.__dict__.copy()
+        state['image'] = self.original_image
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.hit_flash:
+            self.image = self._image_flash()
+
     def prendre_degats(self):
         if not self.shield_actif and not self.est_invincible:
-            current_time = pygame.time.get_ticks()
+            current_time = timing.get_ticks()
             
             # Activate hit flash
             self.hit_flash = True
             self.hit_flash_start = current_time
             
             # Create white flash effect
-            flash_image = self.original_image.copy()
-            flash_image.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
-            self.image = flash_image
+            self.image = self._image_flash()
             
             # Create particle effects
-            num_particles = 20
+            num_particles = qualite().nombre_particules(20)
             for _ in range(num_particles):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(2, 5)
+                angle = _rng_visuel.uniform(0, 2 * math.pi)
+                speed = _rng_visuel.uniform(2, 5)
                 self.hit_particles.append({
                     'x': self.rect.centerx,
                     'y': self.rect.centery,
                     'dx': math.cos(angle) * speed,
                     'dy': math.sin(angle) * speed,
-                    'life': random.randint(10, 20),
+                    'life': _rng_visuel.randint(10, 20),
                     'color': (255, 100, 100)
                 })
             
@@ -347,14 +320,11 @@ class Joueur(pygame.sprite.Sprite):
         
         # Draw the player with flashing effect during invincibility
         if self.est_invincible and not self.shield_actif:
-            if pygame.time.get_ticks() % 200 < 100:  # Blink every 100ms
+            if timing.get_ticks() % 200 < 100:  # Blink every 100ms
                 fenetre.blit(self.image, self.rect)
         else:
             fenetre.blit(self.image, self.rect)
         
         # Draw powerup effects
         if self.effect_manager:
-            self.effect_manager.draw(fenetre)
-        
-        # Debug: Draw hitbox (comment out in production)
-        # pygame.draw.rect(fenetre, (255, 0, 0), self.hitbox, 1)
\ No newline at end of file
+            self.effect_manager.draw(fenetre)
\ No newline at end of file
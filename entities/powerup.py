@@ -1,39 +1,48 @@
-import pygame
 import random
 import os
-from config import ASSETS_DIR
+from config import ASSETS_DIR, HAUTEUR
+from utils import timing
+from systems.ecs import integrer, dessiner_sprites
 
-class PowerUp:
-    def __init__(self, x, y, type_powerup, image):
-        self.type = type_powerup
-        self.image = image
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.centery = y
-        self.vitesse = 2
+# Columns of the game's power-up archetype (systems.ecs)
+COMPOSANTS_POWERUP = ('x', 'y', 'vitesse', 'taille', 'image', 'type')
 
-    def deplacer(self):
-        self.rect.y += self.vitesse
-        return self.rect.top <= 1200  # Using HAUTEUR constant
+def ajouter_power_up(powerups, x, y, type_powerup, image):
+    return powerups.ajouter(x=int(x), y=int(y), vitesse=2, taille=image.get_size(),
+                            image=image, type=type_powerup)
 
-    def dessiner(self, fenetre):
-        fenetre.blit(self.image, self.rect)
+def deplacer_power_ups(powerups):
+    """Move every power-up down; the ones below the screen are destroyed."""
+    integrer(powerups, 'y', 'vitesse')
+    for i, (y, (_, hauteur)) in enumerate(zip(powerups.y, powerups.taille)):
+        if y - hauteur // 2 > HAUTEUR:
+            powerups.detruire(i)
 
-    def appliquer(self, joueur, vies):
-        if self.type == "shield":
-            joueur.shield_actif = True
-            joueur.shield_temps = pygame.time.get_ticks()
-            return vies
-        elif self.type == "life" and vies < 3:  # Map 'vie' to 'life'
-            return vies + 1
-        elif self.type == "fire":  # Map 'tir_rapide' to 'fire'
-            joueur.rapid_fire = True
-            joueur.rapid_fire_timer = pygame.time.get_ticks()
-            return vies
+def power_ups_touches(powerups, rect):
+    """Rows of the live power-ups overlapping `rect`."""
+    return [i for i, (x, y, (largeur, hauteur)) in enumerate(zip(powerups.x, powerups.y, powerups.taille))
+            if i not in powerups.a_detruire
+            and rect.colliderect((x - largeur // 2, y - hauteur // 2, largeur, hauteur))]
+
+def dessiner_power_ups(powerups, fenetre):
+    dessiner_sprites(fenetre, powerups.image, powerups)
+
+def appliquer_power_up(type_powerup, joueur, vies):
+    """Apply a collected power-up to the player; returns the new life count."""
+    if type_powerup == "shield":
+        joueur.shield_actif = True
+        joueur.shield_temps = timing.get_ticks()
+        return vies
+    elif type_powerup == "life" and vies < 3:  # Map 'vie' to 'life'
+        return vies + 1
+    elif type_powerup == "fire":  # Map 'tir_rapide' to 'fire'
+        joueur.rapid_fire = True
+        joueur.rapid_fire_timer = timing.get_ticks()
         return vies
+    return vies
 
-def generer_power_up(x, y, images):
-    """Generate a random power-up at the given position."""
+def generer_power_up(powerups, x, y, images):
+    """Add a random power-up at the given position."""
     types = ["shield", "life", "fire"]  # Use the mapped types directly
     type_powerup = random.choice(types)
-    return PowerUp(x, y, type_powerup, images['powerups'][type_powerup])
+    return ajouter_power_up(powerups, x, y, type_powerup, images['powerups'][type_powerup])
@@ -1,9 +1,14 @@
 import pygame
 import math
 import random
-from config import VITESSE_PROJECTILE_ALIEN, LARGEUR
+from config import VITESSE_PROJECTILE_ALIEN, LARGEUR, HAUTEUR
+from systems.quality import qualite
+from systems.collisions import masques, rect_tourne, zone_tournee
+from systems.snapshot import slot_state, restore_slots
 
 class Projectile:
+    __slots__ = ('image', 'rect', 'vitesse', 'type_tir', 'trainee', 'max_trainee', 'damage', 'a_touche')
+
     def __init__(self, x, y, image, type_tir='normal'):
         self.image = image
         self.rect = self.image.get_rect()
@@ -14,10 +19,6 @@ class Projectile:
         self.trainee = []
         self.max_trainee = 4
         
-        # Ajustement de la taille du rectangle de collision pour un meilleur gameplay
-        self.rect.width = self.rect.width // 2
-        self.rect.height = self.rect.height // 2
-        
         # Set damage based on projectile type
         if type_tir == 'puissant':
             self.vitesse = 10
@@ -32,10 +33,18 @@ class Projectile:
 
         self.a_touche = False
 
+    def zone_collision(self):
+        # Powerful shots are drawn as a filled rect, the others as their sprite
+        if self.type_tir == 'puissant':
+            return masques().plein(self.rect.size), self.rect.topleft
+        return masques().masque(self.image), self.rect.topleft
+
     def dessiner(self, fenetre):
         # Draw trail effect for rapid fire
         if self.type_tir == 'rapide':
-            for i, pos in enumerate(self.trainee):
+            # Low quality drops the oldest, faintest positions
+            debut = max(0, len(self.trainee) - qualite().longueur_trainee(self.max_trainee))
+            for i, pos in enumerate(self.trainee[debut:], debut):
                 alpha = int(255 * ((i + 1) / self.max_trainee) * 0.6)
                 trail_surface = self.image.copy()
                 trail_surface.set_alpha(alpha)
@@ -59,6 +68,9 @@ class Projectile:
         self.rect.y -= self.vitesse
 
 class ProjectileAlien:
+    __slots__ = ('vitesse', 'type_alien', 'image_originale', 'image', 'rect', 'angle',
+                 'trainee', 'max_trainee', 'rotation_speed')
+
     def __init__(self, x, y, image, type_alien, rangee):
         self.vitesse = VITESSE_PROJECTILE_ALIEN
         self.type_alien = type_alien
@@ -74,6 +86,12 @@ class ProjectileAlien:
             
         self.rotation_speed = random.randint(3, 8)
 
+    def __getstate__(self):
+        # The rotated frame is rebuilt by dessiner(); keep the asset reference only
+        state = slot_state(self)
+        state['image'] = self.image_originale
+        return None, state
+
     def deplacer(self):
         self.angle = (self.angle + self.rotation_speed) % 360
         
@@ -85,10 +103,17 @@ class ProjectileAlien:
         self.rect.y += self.vitesse
         if self.type_alien > 2:
             self.rect.x += math.sin(self.rect.y / 30) * 2
+        # Rotated bounds are simulation state, not a side effect of drawing
+        self.rect = rect_tourne(self.image_originale, self.angle, self.rect.center)
+
+    def zone_collision(self):
+        return zone_tournee(self.image_originale, self.angle, self.rect.center)
 
     def dessiner(self, fenetre):
         # Dessin de la traînée avec opacité plus élevée
-        for i, (pos, angle) in enumerate(self.trainee[:-1]):  # Exclure la dernière position
+        # (en qualité réduite, les positions les plus anciennes ne sont pas dessinées)
+        debut = max(0, len(self.trainee) - qualite().longueur_trainee(self.max_trainee))
+        for i, (pos, angle) in enumerate(self.trainee[debut:-1], debut):  # Exclure la dernière position
             alpha = int(255 * ((i + 1) / self.max_trainee) * 0.7)  # Augmenté à 0.7
             trainee_surface = pygame.transform.rotate(self.image_originale, angle)
             trainee_surface.set_alpha(alpha)
@@ -97,11 +122,12 @@ class ProjectileAlien:
         
         # Dessin du projectile principal
         self.image = pygame.transform.rotate(self.image_originale, self.angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
-        fenetre.blit(self.image, self.rect)
+        fenetre.blit(self.image, self.image.get_rect(center=self.rect.center))
 
 class ProjectileMystereAgressif:
     """Projectile spécial pour les aliens mystères qui suit le joueur"""
+    __slots__ = ('image', 'rect', 'dx', 'dy', 'damage', 'image_originale', 'angle')
+
     def __init__(self, x, y, dx, dy, image):
         self.image = image
         self.rect = self.image.get_rect()
@@ -113,9 +139,20 @@ class ProjectileMystereAgressif:
         
         # Rotate image based on direction
         angle = math.degrees(math.atan2(-dy, dx))  # Negative dy because pygame y increases downward
-        self.image = pygame.transform.rotate(image, angle - 90)  # -90 to point in direction of movement
+        self.image_originale = image
+        self.angle = angle - 90  # -90 to point in direction of movement
+        self.image = pygame.transform.rotate(image, self.angle)
         self.rect = self.image.get_rect(center=(x, y))
 
+    def __getstate__(self):
+        state = slot_state(self)
+        del state['image']
+        return state
+
+    def __setstate__(self, state):
+        restore_slots(self, state)
+        self.image = pygame.transform.rotate(self.image_originale, self.angle)
+
     def update(self):
         self.rect.x += self.dx
         self.rect.y += self.dy
@@ -132,10 +169,16 @@ class ProjectileMystereAgressif:
         """Alias for update to maintain consistency with other projectile classes"""
         self.update()
 
+    def zone_collision(self):
+        return zone_tournee(self.image_originale, self.angle, self.rect.center)
+
     def dessiner(self, fenetre):
         fenetre.blit(self.image, self.rect)
 
 class ProjectileMystere:
+    __slots__ = ('image_originale', 'image', 'rect', 'dx', 'dy', 'vitesse', 'angle',
+                 'trainee', 'max_trainee', 'rotation_speed')
+
     def __init__(self, x, y, dx, dy, image):
         self.image_originale = image
         self.image = self.image_originale
@@ -148,6 +191,11 @@ class ProjectileMystere:
         self.max_trainee = 8  # Traînée plus longue pour les projectiles mystère
         self.rotation_speed = random.randint(5, 12)
 
+    def __getstate__(self):
+        state = slot_state(self)
+        state['image'] = self.image_originale
+        return None, state
+
     def deplacer(self):
         self.angle = (self.angle + self.rotation_speed) % 360
         
@@ -158,10 +206,15 @@ class ProjectileMystere:
             
         self.rect.x += self.dx
         self.rect.y += self.dy
+        self.rect = rect_tourne(self.image_originale, self.angle, self.rect.center)
+
+    def zone_collision(self):
+        return zone_tournee(self.image_originale, self.angle, self.rect.center)
 
     def dessiner(self, fenetre):
         # Dessin de la traîne avec effet de brillance plus visible
-        for i, (pos, angle) in enumerate(self.trainee[:-1]):  # Exclure la dernière position
+        debut = max(0, len(self.trainee) - qualite().longueur_trainee(self.max_trainee))
+        for i, (pos, angle) in enumerate(self.trainee[debut:-1], debut):  # Exclure la dernière position
             alpha = int(255 * ((i + 1) / self.max_trainee) * 0.8)  # Augmenté à 0.8
             
             trainee_surface = pygame.transform.rotate(self.image_originale, angle)
@@ -180,11 +233,107 @@ class ProjectileMystere:
         
         # Dessin du projectile principal avec brillance renforcée
         self.image = pygame.transform.rotate(self.image_originale, self.angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
         
         glow_surface = self.image.copy()
         glow_surface.set_alpha(150)  # Augmenté à 150
         glow_rect = glow_surface.get_rect(center=self.rect.center)
         
         fenetre.blit(glow_surface, glow_rect.inflate(8, 8))
-        fenetre.blit(self.image, self.rect)
+        fenetre.blit(self.image, glow_rect)
+
+class ProjectileBatch:
+    """Struct-of-arrays store for large bullet counts (boss patterns).
+
+    Bullets are kept as parallel lists of position, velocity and image index
+    instead of one object per bullet, moved with a single pass per tick and
+    drawn with one `Surface.blits` call. Removal swaps with the last bullet so
+    it never shifts the arrays.
+    """
+    def __init__(self, images, capacity=4000, marge=40):
+        self.images = list(images)
+        self.offsets = [(img.get_width() // 2, img.get_height() // 2) for img in self.images]
+        self.capacity = capacity
+        self.marge = marge
+        # Collision half-extents, matching the rect overlap of a single shot sprite
+        self.demi_largeur, self.demi_hauteur = self.offsets[0] if self.offsets else (0, 0)
+        self.clear()
+
+    def __len__(self):
+        return len(self.x)
+
+    def clear(self):
+        self.x = []
+        self.y = []
+        self.dx = []
+        self.dy = []
+        self.image_index = []
+
+    def spawn(self, x, y, dx, dy, image_index=0):
+        if len(self.x) >= self.capacity:
+            return False
+        self.x.append(float(x))
+        self.y.append(float(y))
+        self.dx.append(dx)
+        self.dy.append(dy)
+        self.image_index.append(image_index % len(self.images) if self.images else 0)
+        return True
+
+    def update(self):
+        if not self.x:
+            return
+
+        xs = [x + dx for x, dx in zip(self.x, self.dx)]
+        ys = [y + dy for y, dy in zip(self.y, self.dy)]
+
+        min_x, max_x = -self.marge, LARGEUR + self.marge
+        min_y, max_y = -self.marge, HAUTEUR + self.marge
+        keep = [i for i, (x, y) in enumerate(zip(xs, ys))
+                if min_x < x < max_x and min_y < y < max_y]
+
+        if len(keep) == len(xs):
+            self.x, self.y = xs, ys
+        else:
+            self.x = [xs[i] for i in keep]
+            self.y = [ys[i] for i in keep]
+            self.dx = [self.dx[i] for i in keep]
+            self.dy = [self.dy[i] for i in keep]
+            self.image_index = [self.image_index[i] for i in keep]
+
+    def collide_rect(self, rect, zone=None):
+        """Remove the first bullet overlapping `rect`; returns True on a hit.
+
+        With `zone` (a target's zone_collision()), bullets inside the rect
+        test are checked against the target's mask before they count.
+        """
+        left = rect.left - self.demi_largeur
+        right = rect.right + self.demi_largeur
+        top = rect.top - self.demi_hauteur
+        bottom = rect.bottom + self.demi_hauteur
+        for i, (x, y) in enumerate(zip(self.x, self.y)):
+            if left < x < right and top < y < bottom:
+                if zone is not None:
+                    masque, (zx, zy) = zone
+                    k = self.image_index[i]
+                    decalage = (int(x) - self.offsets[k][0] - zx, int(y) - self.offsets[k][1] - zy)
+                    if masque.overlap(masques().masque(self.images[k]), decalage) is None:
+                        continue
+                self.remove(i)
+                return True
+        return False
+
+    def remove(self, index):
+        last = len(self.x) - 1
+        for column in (self.x, self.y, self.dx, self.dy, self.image_index):
+            column[index] = column[last]
+            column.pop()
+
+    def dessiner(self, fenetre):
+        if not self.x:
+            return
+        images = self.images
+        offsets = self.offsets
+        fenetre.blits(
+            [(images[k], (int(x) - offsets[k][0], int(y) - offsets[k][1]))
+             for x, y, k in zip(self.x, self.y, self.image_index)],
+            False
+        )
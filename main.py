@@ -2,26 +2,33 @@ import pygame
 import sys
 import random
 import math
-from pygame.locals import QUIT, KEYDOWN, K_ESCAPE, K_p, K_r, K_f
+import time
+import functools
+import pickle
+from pygame.locals import QUIT, KEYDOWN, K_ESCAPE, K_p, K_r, K_f, K_F5, K_F9
 import os
 
 # Import configuration
 from config import *
 
 # Import assets
-from assets import SoundManager, load_game_images, load_alien_images, load_image
-from effects.visual_effects import EffectManager
+from assets import (SoundManager, load_game_images, load_boss_images, load_image, chargeur_assets,
+                    fichiers_demarrage, fichiers_boss, cache_frames)
 
 # Import entities
 from entities.player import Joueur
-from entities.alien import Envahisseur, FormationAlien, creer_envahisseurs
-from entities.boss import Boss
+from entities.alien import Envahisseur, FormationAlien, ClassicGrid, creer_envahisseurs
+from entities.bullet_patterns import charger_definitions
 from entities.mystery_alien import MysteryAlien
-from entities.projectiles import Projectile, ProjectileAlien, ProjectileMystereAgressif
-from entities.powerup import PowerUp, generer_power_up
-from entities.explosion import Explosion
+from entities.projectiles import Projectile, ProjectileAlien, ProjectileMystereAgressif, ProjectileBatch
+from entities.powerup import (COMPOSANTS_POWERUP, generer_power_up, deplacer_power_ups, power_ups_touches,
+                              dessiner_power_ups, appliquer_power_up)
+from entities.explosion import COMPOSANTS_EXPLOSION, ajouter_explosion, animer_explosions, dessiner_explosions
+from effects.effect_atlas import effect_atlas
 from ui.background import ParallaxBackground
 from ui.modern_hud import ModernHUD
+from ui.presentation import Presentation
+from ui.splash import dessiner_splash
 
 from ui.menus import dessiner_menu_accueil, handle_menu_event, menu_state
 
@@ -29,27 +36,46 @@ from ui.menus import dessiner_menu_accueil, handle_menu_event, menu_state
 from systems.score import ComboSystem, charger_meilleur_score, sauvegarder_meilleur_score
 from systems.level_transition import LevelTransitionManager
 
+from systems.input_state import InputSampler, ACTION_FIRE
+from systems.latency import LatencyProbe, LowLatencyPacer
+from systems.replay import ReplayRecorder, REPLAY_EXTENSION
+from systems.simulation import configurer_headless
+from systems.snapshot import serialize_state, deserialize_state
+from systems.ecs import World, EntityPool
+from systems.leaderboard import Leaderboard
+from systems.quality import qualite
+from systems.collisions import se_touchent
+
 from utils.control_settings import ControlSettings
+from utils.persistence import persistance
+from utils import timing
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False):
+        self.headless = headless
+        if headless:
+            configurer_headless()
+            cache_frames().prechauffage = False  # Explosions are never drawn
         pygame.init()
         pygame.mixer.init()
         
         # Initialize random seed using current time
         random.seed()
         
-        self.fenetre = pygame.display.set_mode((LARGEUR, HAUTEUR))
-        self.windowed_size = (LARGEUR, HAUTEUR)
-        self.render_surface = pygame.Surface((LARGEUR, HAUTEUR)).convert()
-        pygame.display.set_caption('Nebula Surge')
+        presentation = PRESENTATION_PAR_QUALITE.get(QUALITE_GRAPHIQUE, PRESENTATION_PAR_QUALITE['haute'])
+        self.presentation = Presentation((LARGEUR, HAUTEUR), titre='Nebula Surge', **presentation)
+        self.fenetre = self.presentation.ouvrir_fenetre()
+        
+        # Decode every startup file on worker threads behind a progress screen
+        self._precharger_assets()
         
         self.controls = ControlSettings()
+        self.entrees = InputSampler(self.controls)
+        self.latence = LatencyProbe() if LATENCE_MESURE and not headless else None
         menu_state.load_resources()
 
         # Load assets
         self.images = load_game_images()
-        self.effect_manager = EffectManager(self.images)
         
         # Use selected ship if available, otherwise use default
         from ui.menus import get_selected_ship
@@ -57,21 +83,21 @@ class Game:
         if selected_ship:
             self.images['player'] = selected_ship
         
-        # Load alien images
-        self.alien_images = load_alien_images()  # Load alien images
+        # Mystery alien shots, scaled once instead of on every shot
+        self.images['projectile_mystere'] = [
+            pygame.transform.scale(img, (20, 40)) for img in self.images['projectile_alien']
+        ]
         
-        # Load boss images
-        boss_dir = os.path.join(ASSETS_DIR, 'images', 'boss')
-        print(f"Looking for boss images in: {boss_dir}")  # Debug print
-        boss_files = [f for f in os.listdir(boss_dir) if f.startswith('boss') and f.endswith('.png')]
-        boss_files.sort()  # Sort files to ensure consistent loading order
-        print(f"Found boss images: {boss_files}")  # Debug print
+        # Alien images (same set as load_game_images' 'aliens')
+        self.alien_images = self.images['aliens']
+
+        # Bake the effect textures now rather than at the first boss warning
+        effect_atlas()
         
         self.sound_manager = SoundManager()
         
         # Initialize background with random patterns
-        self.background = ParallaxBackground()
-        self.background.randomize_backgrounds()  # Ensure initial randomization
+        self.background = ParallaxBackground()  # Picks random layers on creation
         
         # Initialize HUD
         self.hud = ModernHUD()
@@ -85,14 +111,22 @@ class Game:
         
         # Initialize game objects
         self.joueur = None
-        self.projectiles = []
-        self.projectiles_aliens = []
-        self.envahisseurs = []
-        self.explosions = []
-        self.powerups = []
+        # Objects with per-instance behaviour, removed through generational handles
+        self.projectiles = EntityPool()
+        self.projectiles_aliens = EntityPool()
+        self.boss_projectiles = ProjectileBatch(
+            self.images['projectile_alien'],
+            capacity=charger_definitions().get('max_bullets', 4000)
+        )
+        self.envahisseurs = EntityPool()
+        self.classic_grid = None
+        # Explosions and power-ups are component columns, updated in bulk
+        self.monde = World()
+        self.explosions = self.monde.archetype('explosions', COMPOSANTS_EXPLOSION)
+        self.powerups = self.monde.archetype('powerups', COMPOSANTS_POWERUP)
         self.boss = None
-        self.mystery_aliens = []  # Changed to list to support multiple aliens
-        self.last_mystery_spawn = pygame.time.get_ticks()
+        self.mystery_aliens = EntityPool()  # Several mystery aliens per wave
+        self.last_mystery_spawn = timing.get_ticks()
         self.mystery_spawn_delay = random.randint(10000, 15000)  # Increased delay between waves
         self.mystery_wave_size = 0  # Current wave size
         
@@ -116,8 +150,39 @@ class Game:
         self.dernier_powerup = 0
         self.delai_min_powerup = 10000  # Minimum 10 seconds between powerups
 
-    def demarrer_nouveau_jeu(self):
-        """Initialize a new game."""
+        # Input and replays
+        self.tir_demande = False
+        self.seed = None
+        self.recorder = None
+        self.enregistrer_replays = REPLAY_ENREGISTREMENT and not headless
+
+        # Finished runs go to the local leaderboard (not for bots and sweeps)
+        self.leaderboard = None if headless else Leaderboard()
+        self.debut_partie = 0
+        self.partie_enregistree = False
+
+    def _precharger_assets(self):
+        chargeur = chargeur_assets()
+        chargeur.precharger(fichiers_demarrage())
+        if self.headless:
+            return
+        while True:
+            fait, total = chargeur.progression()
+            pygame.event.pump()
+            surface = self.presentation.surface_de_rendu()
+            dessiner_splash(surface, fait / total if total else 1.0)
+            self.presentation.presenter()
+            if fait >= total:
+                break
+            chargeur.attendre(1 / 60)
+
+    def demarrer_nouveau_jeu(self, seed=None):
+        """Initialize a new game; a fixed `seed` makes the run reproducible."""
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        random.seed(seed)
+        
         self.score = 0
         self.vies = 3
         self.niveau = 1
@@ -125,11 +190,14 @@ class Game:
         self.menu = False
         self.niveau_termine = False
         self.transition_niveau = False
-        self.dernier_temps_niveau = pygame.time.get_ticks()
+        self.dernier_temps_niveau = timing.get_ticks()
+        self.debut_partie = timing.get_ticks()
+        self.partie_enregistree = False
         
         # Reset all game objects
         self.projectiles.clear()
         self.projectiles_aliens.clear()
+        self.boss_projectiles.clear()
         self.explosions.clear()
         self.powerups.clear()
         
@@ -137,10 +205,12 @@ class Game:
         self.background.randomize_backgrounds()
         
         # Reset mystery alien
-        self.mystery_aliens = []  # Changed to list to support multiple aliens
-        self.last_mystery_spawn = pygame.time.get_ticks()
+        self.mystery_aliens.clear()
+        self.last_mystery_spawn = timing.get_ticks()
         self.mystery_spawn_delay = random.randint(10000, 15000)  # Increased delay between waves
         self.mystery_wave_size = 0  # Current wave size
+        self.dernier_powerup = 0
+        self.tir_demande = False
         
         # Get the selected ship image
         from ui.menus import get_selected_ship
@@ -154,7 +224,7 @@ class Game:
         self.joueur.rect.bottom = HAUTEUR - 20
         
         # Create aliens for first level
-        self.envahisseurs = creer_envahisseurs(self.niveau, self.alien_images)
+        self.creer_vague()
         self.boss = None
         
         # Reset combo system and start music
@@ -163,21 +233,108 @@ class Game:
         self.level_transition.reset()
         self.scheduled_sounds.clear()
 
+        # Record the session's inputs from the first tick
+        self.recorder = None
+        if self.enregistrer_replays:
+            self.recorder = ReplayRecorder(seed, timing.get_ticks(), menu_state.selected_ship_index)
+
+    def _enregistrer_meilleur_score(self):
+        """Keep the best score; headless runs (bots, sweeps) never write it to disk."""
+        if self.score > self.meilleur_score:
+            self.meilleur_score = self.score
+            if not self.headless:
+                sauvegarder_meilleur_score(self.score)
+        self._enregistrer_partie()
+
+    def _enregistrer_partie(self):
+        """Add the finished run to the leaderboard, once per game."""
+        if self.leaderboard is None or self.partie_enregistree:
+            return
+        self.partie_enregistree = True
+        self.leaderboard.enregistrer({
+            'score': self.score,
+            'niveau': self.niveau,
+            'precision': round(self.joueur.precision_tracker.obtenir_precision(), 1),
+            'meilleur_combo': self.combo_system.meilleur_combo,
+            'vaisseau': menu_state.selected_ship_index,
+            'seed': self.seed,
+            'duree_ms': timing.get_ticks() - self.debut_partie,
+        })
+
+    def _terminer_enregistrement(self):
+        """Save the current recording, if any, under REPLAY_DIR."""
+        if self.recorder is None:
+            return
+        replay = self.recorder.finish()
+        self.recorder = None
+        if not len(replay):
+            return
+        filename = time.strftime('%Y%m%d-%H%M%S') + f'_{replay.seed}{REPLAY_EXTENSION}'
+        # Encoded and written on the persistence thread
+        persistance().ecrire(os.path.join(REPLAY_DIR, filename), replay.encode, rappel=self._replay_ecrit)
+
+    @staticmethod
+    def _replay_ecrit(path, erreur):
+        if erreur is not None:
+            print(f"Error saving replay: {erreur}")
+
+    def snapshot(self):
+        """Serialize the simulation state to a compact binary blob."""
+        return serialize_state(self)
+
+    def restore(self, data):
+        """Restore a blob from snapshot(); the game resumes from its tick."""
+        self._images_boss()  # The blob may reference boss images
+        deserialize_state(self, data)
+        # The recording no longer matches what happens next
+        self.recorder = None
+        self.tir_demande = False
+
+    def sauvegarde_rapide(self):
+        try:
+            data = self.snapshot()
+        except pickle.PicklingError as e:
+            print(f"Error quick-saving: {e}")
+            return
+
+        def fin(path, erreur):
+            if erreur is None:
+                print(f"Quick-saved {len(data)} bytes")
+            else:
+                print(f"Error quick-saving: {erreur}")
+        persistance().ecrire(QUICKSAVE_FILE, data, rappel=fin)
+
+    def chargement_rapide(self):
+        # A quick-save still being written must land before it can be read
+        if persistance().en_attente(QUICKSAVE_FILE):
+            persistance().vider(2.0)
+        if not os.path.exists(QUICKSAVE_FILE):
+            return
+        try:
+            with open(QUICKSAVE_FILE, 'rb') as f:
+                self.restore(f.read())
+            print("Quick-save loaded")
+        except (OSError, ValueError, pickle.UnpicklingError) as e:
+            print(f"Error loading quick-save: {e}")
+
+    def echantillonner_actions(self):
+        """Sample this tick's input as an action bitmask."""
+        actions = self.entrees.sample()
+        if self.latence:
+            self.latence.mouvement(actions)
+        if self.tir_demande:
+            actions |= ACTION_FIRE
+            self.tir_demande = False
+            if self.latence:
+                self.latence.appliquer('tir')
+        return actions
+
     def toggle_fullscreen(self):
-        current_flags = self.fenetre.get_flags()
-        if current_flags & pygame.FULLSCREEN:
-            self.fenetre = pygame.display.set_mode(self.windowed_size)
-        else:
-            self.windowed_size = self.fenetre.get_size()
-            fullscreen_flags = pygame.FULLSCREEN | pygame.SCALED
-            try:
-                self.fenetre = pygame.display.set_mode((0, 0), fullscreen_flags)
-            except pygame.error as error:
-                print(f"Falling back to standard fullscreen: {error}")
-                self.fenetre = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        pygame.display.set_caption('Nebula Surge')
+        self.fenetre = self.presentation.basculer_plein_ecran()
 
     def handle_events(self):
+        if self.latence:
+            self.latence.pompe()
         for event in pygame.event.get():
             if event.type == QUIT:
                 self.running = False
@@ -222,8 +379,9 @@ class Game:
 
                 elif event.key == fire_key and not self.menu:
                     if not self.pause and not self.game_over:
-                        self.tirer()
-                        self.tirer()
+                        self.tir_demande = True  # Consumed by the next update()
+                        if self.latence:
+                            self.latence.lire('tir')
 
                 elif event.key == K_p and not self.menu and not self.game_over:
                     self.pause = not self.pause
@@ -232,6 +390,12 @@ class Game:
                     else:
                         self.sound_manager.unpause_music()
 
+                elif event.key == K_F5 and not self.menu and not self.game_over:
+                    self.sauvegarde_rapide()
+
+                elif event.key == K_F9 and not self.menu:
+                    self.chargement_rapide()
+
                 elif event.key == K_r and self.game_over:
                     self.game_over = False
                     self.demarrer_nouveau_jeu()
@@ -242,20 +406,35 @@ class Game:
             x = self.joueur.rect.centerx
             y = self.joueur.rect.top
             projectile = Projectile(x, y, self.images['missile'])
-            self.projectiles.append(projectile)
+            self.projectiles.ajouter(projectile)
+
+    def update(self, actions=None, frame=None):
+        """Advance one tick; `actions` overrides live input (replays, bots).
 
-    def update(self):
-        current_time = pygame.time.get_ticks()
+        `frame` is the tick's FrameContext (timing.begin_tick()); the
+        tick-level updates below read its timestamp instead of the clock.
+        """
+        if frame is None:
+            frame = timing.frame()
+        current_time = frame.now
         self.level_transition.update(current_time)
         self._process_scheduled_sounds(current_time)
 
         if not self.menu and not self.game_over:
-            if not self.pause:
+            if not frame.paused:
+                if actions is None:
+                    actions = self.echantillonner_actions()
+                if self.recorder is not None:
+                    self.recorder.record(actions, current_time)
+                if actions & ACTION_FIRE:
+                    self.tirer()
+                    self.tirer()
+
                 # Update game objects
                 self.background.update()
-                self.joueur.update()
+                self.joueur.update(actions, current_time)
                 self.update_projectiles()
-                self.update_aliens()
+                self.update_aliens(current_time)
 
                 # Update mystery aliens
                 # Mystery alien wave spawning
@@ -268,33 +447,31 @@ class Game:
                         # Override the random x position to ensure proper spacing
                         new_alien.rect.x = spacing * (i + 1)
                         new_alien.base_x = float(new_alien.rect.x)  # Update base_x for wave movement
-                        self.mystery_aliens.append(new_alien)
+                        self.mystery_aliens.ajouter(new_alien)
                     
                     self.last_mystery_spawn = current_time
                     self.mystery_spawn_delay = random.randint(10000, 15000)  # 10-15 seconds between waves
                 
                 # Update mystery aliens and handle firing
-                for alien in self.mystery_aliens[:]:
+                for alien in self.mystery_aliens:
                     if alien.is_alive:
                         # Update returns True if alien reached bottom
                         if alien.update():
                             self.vies -= 1  # Lose a life
                             # Create explosion at bottom
-                            explosion = Explosion(
+                            ajouter_explosion(
+                                self.explosions,
                                 alien.rect.centerx,
                                 alien.rect.bottom,
                                 self.images['explosions']
                             )
-                            self.explosions.append(explosion)
                             if self.sound_manager:
                                 self.sound_manager.play('explosion', 0.3)
                             
                             # Check for game over
                             if self.vies <= 0:
                                 self.game_over = True
-                                if self.score > self.meilleur_score:
-                                    self.meilleur_score = self.score
-                                    sauvegarder_meilleur_score(self.score)
+                                self._enregistrer_meilleur_score()
                                 if self.sound_manager:
                                     self.sound_manager.play('gameover', 0.3)
                             else:
@@ -315,10 +492,7 @@ class Game:
                             normalized_dy = abs(dy / distance) * speed  # Make sure dy is positive to go down
                             
                             # Select a larger, more visible projectile image
-                            projectile_img = pygame.transform.scale(
-                                random.choice(self.images['projectile_alien']), 
-                                (20, 40)  # Make projectile bigger
-                            )
+                            projectile_img = random.choice(self.images['projectile_mystere'])
                             
                             projectile = ProjectileMystereAgressif(
                                 alien.rect.centerx,
@@ -327,27 +501,26 @@ class Game:
                                 normalized_dy,
                                 projectile_img
                             )
-                            self.projectiles_aliens.append(projectile)
+                            self.projectiles_aliens.ajouter(projectile)
                     else:
-                        self.mystery_aliens.remove(alien)
+                        self.mystery_aliens.retirer(alien)
                 
                 # Check collisions with mystery aliens
-                for alien in self.mystery_aliens[:]:
+                for alien in self.mystery_aliens:
                     if not alien.is_alive:
                         continue
                     
-                    for projectile in self.projectiles[:]:
-                        if alien.rect.colliderect(projectile.rect):
+                    for projectile in self.projectiles:
+                        if alien.rect.colliderect(projectile.rect) and se_touchent(alien, projectile):
                             points = alien.hit()
                             self.score += points
                             self.combo_system.add_hit()
                             # Create explosion
-                            explosion = Explosion(alien.rect.centerx, alien.rect.centery, self.images['explosions'])
-                            self.explosions.append(explosion)
-                            self.projectiles.remove(projectile)
+                            ajouter_explosion(self.explosions, alien.rect.centerx, alien.rect.centery, self.images['explosions'])
+                            self.projectiles.retirer(projectile)
                 
-                self.update_explosions()
-                self.update_powerups()
+                self.update_explosions(current_time)
+                self.update_powerups(current_time)
                 
                 # Only update boss if it exists
                 if self.boss is not None:
@@ -359,75 +532,77 @@ class Game:
                 
                 # Check level completion
                 self.check_level_completion()
+
+                self._compacter()
             
             # Ensure music is playing during gameplay
             if not self.sound_manager.is_playing('music') and not self.pause:
                 self.sound_manager.play('music', 0.3)
         
-        elif self.menu:
-            pass
-        
-        elif self.game_over:
-            pass
+        if (self.menu or self.game_over) and self.recorder is not None:
+            self._terminer_enregistrement()
 
     def update_projectiles(self):
         # Update player projectiles
-        for projectile in self.projectiles[:]:
+        for projectile in self.projectiles:
             projectile.deplacer()
             if projectile.rect.bottom < 0:
-                self.projectiles.remove(projectile)
+                self.projectiles.retirer(projectile)
                 self.joueur.precision_tracker.ajouter_tir(False)
                 # Reset combo by setting a long time since last kill
                 self.combo_system.dernier_kill = 0
         
         # Update alien projectiles
-        for projectile in self.projectiles_aliens[:]:
+        for projectile in self.projectiles_aliens:
             projectile.deplacer()
             if projectile.rect.top > HAUTEUR:
-                self.projectiles_aliens.remove(projectile)
-            elif projectile.rect.colliderect(self.joueur.rect) and not self.joueur.est_invincible and not self.joueur.shield_actif:
-                self.projectiles_aliens.remove(projectile)
-                self.joueur.prendre_degats()
-                self.vies -= 1
-                if self.vies <= 0:
-                    self.game_over = True
-                    if self.score > self.meilleur_score:
-                        self.meilleur_score = self.score
-                        sauvegarder_meilleur_score(self.score)
-                    if self.sound_manager:
-                        self.sound_manager.play('gameover', 0.3)
-                        self.sound_manager.play('music', 0.1)
-                else:
-                    if self.sound_manager:
-                        self.sound_manager.play('hit', 0.3)
-
-    def update_aliens(self):
-        # Update alien positions and check for direction changes
-        direction_change = False
-        current_time = pygame.time.get_ticks()
+                self.projectiles_aliens.retirer(projectile)
+            elif (projectile.rect.colliderect(self.joueur.rect) and not self.joueur.est_invincible
+                  and not self.joueur.shield_actif and se_touchent(projectile, self.joueur)):
+                self.projectiles_aliens.retirer(projectile)
+                self._joueur_touche()
+
+        # Update batched boss bullets
+        self.boss_projectiles.update()
+        if not self.joueur.est_invincible and not self.joueur.shield_actif:
+            if self.boss_projectiles.collide_rect(self.joueur.rect, self.joueur.zone_collision()):
+                self._joueur_touche()
+
+    def _joueur_touche(self):
+        """Apply an enemy bullet hit to the player."""
+        self.joueur.prendre_degats()
+        self.vies -= 1
+        ajouter_explosion(
+            self.explosions,
+            self.joueur.rect.centerx,
+            self.joueur.rect.centery,
+            self.images['explosion_joueur'],
+            True
+        )
+        if self.vies <= 0:
+            self.game_over = True
+            self._enregistrer_meilleur_score()
+            if self.sound_manager:
+                self.sound_manager.play('gameover', 0.3)
+                self.sound_manager.play('music', 0.1)
+        else:
+            if self.sound_manager:
+                self.sound_manager.play('hit', 0.3)
+
+    def update_aliens(self, current_time):
+        
+        # Classic aliens move as one block
+        if self.classic_grid is not None and self.classic_grid.update():
+            self._aliens_en_bas()
         
         for alien in self.envahisseurs:
             if isinstance(alien, FormationAlien):
                 # Update formation-based movement
                 alien.update_formation_position(current_time)
-            else:
-                # Regular alien movement
-                new_x = alien.deplacer()
-                if (new_x <= 50 and alien.direction < 0) or \
-                   (new_x >= LARGEUR - 50 and alien.direction > 0):
-                    direction_change = True
-        
-        if direction_change:
-            # Change direction and move down
-            for alien in self.envahisseurs:
-                if not isinstance(alien, FormationAlien):
-                    alien.direction *= -1
-                    if alien.descendre(20):
-                        self.game_over = True
 
         # Make aliens shoot
         for alien in self.envahisseurs:
-            if alien.tirer(self.boss is not None):
+            if alien.tirer(self.boss is not None, current_time):
                 projectile = ProjectileAlien(
                     alien.rect.centerx,
                     alien.rect.bottom,
@@ -435,11 +610,13 @@ class Game:
                     alien.type_alien,
                     alien.rangee
                 )
-                self.projectiles_aliens.append(projectile)
+                self.projectiles_aliens.ajouter(projectile)
         
-        # Move aliens
+        # Bounce formations off the screen edges
         move_down = False
         for alien in self.envahisseurs:
+            if not isinstance(alien, FormationAlien):
+                continue
             new_x = alien.deplacer()
             if (new_x <= 0 and alien.direction < 0) or (new_x >= LARGEUR - alien.rect.width and alien.direction > 0):
                 move_down = True
@@ -447,44 +624,59 @@ class Game:
         
         if move_down:
             for alien in self.envahisseurs:
+                if not isinstance(alien, FormationAlien):
+                    continue
                 alien.direction *= -1
-                if alien.descendre(20):  # Returns True if reached bottom
-                    self.game_over = True
-                    if self.score > self.meilleur_score:
-                        self.meilleur_score = self.score
-                        sauvegarder_meilleur_score(self.score)
+                if alien.descendre(VITESSE_DESCENTE):  # Returns True if reached bottom
+                    self._aliens_en_bas()
         
         # Check collisions with player projectiles
-        for projectile in self.projectiles[:]:
-            for alien in self.envahisseurs[:]:
-                if projectile.rect.colliderect(alien.rect):
+        for projectile in self.projectiles:
+            for alien in self.envahisseurs:
+                if projectile.rect.colliderect(alien.rect) and se_touchent(projectile, alien):
                     if alien.prendre_degats(1):
-                        self.envahisseurs.remove(alien)
+                        self.envahisseurs.retirer(alien)
+                        if self.classic_grid is not None:
+                            self.classic_grid.retirer(alien)
                         self.score += self.combo_system.obtenir_score(alien.points)
                         self.combo_system.augmenter_combo()
                         
                         # Create explosion
-                        explosion = Explosion(
+                        ajouter_explosion(
+                            self.explosions,
                             alien.rect.centerx,
                             alien.rect.centery,
-                            self.images['explosions'],
+                            self.images['explosions_vaisseaux'].get(
+                                alien.vaisseau_index + 1, self.images['explosions']),
                             False
                         )
-                        self.explosions.append(explosion)
                         self.sound_manager.play('explosion', 0.3)
                         
                         # Maybe spawn powerup
                         if random.random() < CHANCE_POWERUP:
-                            powerup = generer_power_up(
+                            generer_power_up(
+                                self.powerups,
                                 alien.rect.centerx,
                                 alien.rect.centery,
                                 self.images
                             )
-                            self.powerups.append(powerup)
                     
-                    self.projectiles.remove(projectile)
+                    self.projectiles.retirer(projectile)
                     break
 
+    def _compacter(self):
+        """Apply this tick's deferred removals, once, before drawing."""
+        self.monde.appliquer_destructions()
+        self.projectiles.compacter()
+        self.projectiles_aliens.compacter()
+        self.envahisseurs.compacter()
+        self.mystery_aliens.compacter()
+
+    def _aliens_en_bas(self):
+        """Aliens reached the descent limit: the game is lost."""
+        self.game_over = True
+        self._enregistrer_meilleur_score()
+
     def update_boss(self):
         if self.boss is None:
             return
@@ -492,84 +684,73 @@ class Game:
         # Update boss position and state
         self.boss.update(self.joueur)  # Pass player object for patterns
         
-        # Handle boss shooting
-        new_projectiles = self.boss.tirer(self.joueur)  # Pass player object for targeting
-        if new_projectiles:
-            for pos_x, pos_y, dx, dy in new_projectiles:
-                projectile = ProjectileAlien(pos_x, pos_y, random.choice(self.images['projectile_alien']), 3, 0)  # Using type_alien=3 for boss projectiles
-                self.projectiles_aliens.append(projectile)
+        # Handle boss shooting - volleys go straight into the batched store
+        self.boss.tirer(self.joueur, self.boss_projectiles)  # Pass player object for targeting
         
         # Check for collisions with player projectiles
-        for projectile in self.projectiles[:]:
-            if self.boss.rect.colliderect(projectile.rect):
+        for projectile in self.projectiles:
+            if self.boss.rect.colliderect(projectile.rect) and se_touchent(self.boss, projectile):
                 # Always play boss damage sound on hit
                 self.sound_manager.play('boss_damage', 0.85)
                 
                 # Handle damage and effects
                 is_dead = self.boss.prendre_degats(projectile.damage)
-                self.projectiles.remove(projectile)
+                self.projectiles.retirer(projectile)
                 
                 # Create explosion at hit location
-                explosion = Explosion(
+                ajouter_explosion(
+                    self.explosions,
                     projectile.rect.centerx,
                     projectile.rect.centery,
                     self.images['explosions']
                 )
-                self.explosions.append(explosion)
                 
                 if is_dead:
                     # Create big explosion for boss death
-                    scaled_images = [pygame.transform.scale(img, (img.get_width() * 2, img.get_height() * 2)) 
-                                   for img in self.images['explosions']]
-                    explosion = Explosion(
+                    ajouter_explosion(
+                        self.explosions,
                         self.boss.rect.centerx,
                         self.boss.rect.centery,
-                        scaled_images
+                        self.images['explosions_boss']
                     )
-                    self.explosions.append(explosion)
                     self.score += self.boss.points
                     self.sound_manager.play('boss_defeated', 0.7)
                     self.sound_manager.play('level_completed', 0.5)
                     self.boss = None
 
-    def update_explosions(self):
-        for explosion in self.explosions[:]:
-            if explosion.update():
-                self.explosions.remove(explosion)
+    def update_explosions(self, current_time):
+        animer_explosions(self.explosions, current_time)
 
-    def update_powerups(self):
-        temps_actuel = pygame.time.get_ticks()
+    def update_powerups(self, temps_actuel):
         
         # Update existing powerups
-        for powerup in self.powerups[:]:
-            powerup.deplacer()
-            if powerup.rect.top > HAUTEUR:
-                self.powerups.remove(powerup)
-            elif powerup.rect.colliderect(self.joueur.rect):
-                self.vies = powerup.appliquer(self.joueur, self.vies)
-                # Activate powerup effect and play appropriate sound
-                self.joueur.activer_powerup(powerup.type)
-                if powerup.type == "health":
-                    self.sound_manager.play('health', 0.6)
-                elif powerup.type == "shield":
-                    self.sound_manager.play('shield', 0.6)
-                else:
-                    self.sound_manager.play('powerup', 0.6)
-                self.powerups.remove(powerup)
+        deplacer_power_ups(self.powerups)
+        for i in power_ups_touches(self.powerups, self.joueur.rect):
+            type_powerup = self.powerups.type[i]
+            self.vies = appliquer_power_up(type_powerup, self.joueur, self.vies)
+            # Activate powerup effect and play appropriate sound
+            self.joueur.activer_powerup(type_powerup)
+            if type_powerup == "health":
+                self.sound_manager.play('health', 0.6)
+            elif type_powerup == "shield":
+                self.sound_manager.play('shield', 0.6)
+            else:
+                self.sound_manager.play('powerup', 0.6)
+            self.powerups.detruire(i)
         
         # Check if we should spawn a new powerup
-        if (not self.powerups and 
+        if (not self.powerups.vivants() and 
             temps_actuel - self.dernier_powerup > self.delai_min_powerup and 
             random.random() < CHANCE_POWERUP):
             # Choose a random alien as spawn point
             if self.envahisseurs:
                 alien = random.choice(self.envahisseurs)
-                powerup = generer_power_up(
+                generer_power_up(
+                    self.powerups,
                     alien.rect.centerx,
                     alien.rect.centery,
                     self.images
                 )
-                self.powerups.append(powerup)
                 self.dernier_powerup = temps_actuel
 
     def check_level_completion(self):
@@ -578,33 +759,37 @@ class Game:
 
         if not self.envahisseurs and not self.boss and not self.niveau_termine:
             self.niveau_termine = True
-            self.dernier_temps_niveau = pygame.time.get_ticks()
+            self.dernier_temps_niveau = timing.get_ticks()
             self.sound_manager.play('level_completed', 0.7)
 
             next_level = self.niveau + 1
             is_boss_level = next_level % BossConstants.NIVEAU_APPARITION == 0
+            if is_boss_level and 'boss' not in self.images:
+                # Decode boss images in the background while the transition plays
+                chargeur_assets().precharger(fichiers_boss())
 
             self.level_transition.start(
                 next_level,
                 is_boss_level,
-                lambda nl=next_level, boss=is_boss_level: self._prepare_next_stage(nl, boss)
+                functools.partial(self._prepare_next_stage, next_level, is_boss_level)
             )
 
     def _prepare_next_stage(self, next_level, is_boss_level):
         """Set up enemies and state for the upcoming level."""
         self.projectiles.clear()
         self.projectiles_aliens.clear()
+        self.boss_projectiles.clear()
         self.explosions.clear()
 
         self.niveau = next_level
         self.niveau_termine = False
         self.transition_niveau = False
         self.background.randomize_backgrounds()
-        self.dernier_temps_niveau = pygame.time.get_ticks()
+        self.dernier_temps_niveau = timing.get_ticks()
 
         # Reset auxiliary spawns so waves feel fresh
         self.mystery_aliens.clear()
-        self.last_mystery_spawn = pygame.time.get_ticks()
+        self.last_mystery_spawn = timing.get_ticks()
         self.mystery_wave_size = 0
 
         if is_boss_level:
@@ -613,12 +798,29 @@ class Game:
         else:
             print(f"Starting normal level {self.niveau}")
             self.boss = None
-            self.envahisseurs = creer_envahisseurs(self.niveau, self.alien_images)
+            self.creer_vague()
+
+    def creer_vague(self):
+        """Create the alien wave for the current level."""
+        self.envahisseurs.clear()
+        for alien in creer_envahisseurs(self.niveau, self.alien_images):
+            self.envahisseurs.ajouter(alien)
+        classiques = [alien for alien in self.envahisseurs if not isinstance(alien, FormationAlien)]
+        self.classic_grid = ClassicGrid(classiques) if classiques else None
+
+    def _images_boss(self):
+        """Boss images, loaded on first use."""
+        if 'boss' not in self.images:
+            self.images['boss'] = load_boss_images()
+        return self.images['boss']
 
     def _spawn_boss_level(self):
-        self.envahisseurs = []
+        from entities.boss import Boss
+
+        self.envahisseurs.clear()
+        self.classic_grid = None
         try:
-            if 'boss' in self.images and self.images['boss']:
+            if self._images_boss():
                 boss_image = random.choice(self.images['boss'])
                 print(f"Creating boss with image size: {boss_image.get_size()}")
                 self.boss = Boss(
@@ -633,17 +835,17 @@ class Game:
             else:
                 print("No boss images found, falling back to normal level")
                 self.boss = None
-                self.envahisseurs = creer_envahisseurs(self.niveau, self.alien_images)
+                self.creer_vague()
         except Exception as e:
             print(f"Error creating boss: {e}")
             self.boss = None
-            self.envahisseurs = creer_envahisseurs(self.niveau, self.alien_images)
+            self.creer_vague()
 
     def _schedule_sound(self, sound_name, volume, delay_ms=0):
         if not self.sound_manager:
             return
 
-        trigger_time = pygame.time.get_ticks() + max(0, int(delay_ms))
+        trigger_time = timing.get_ticks() + max(0, int(delay_ms))
         self.scheduled_sounds.append((trigger_time, sound_name, volume))
 
     def _process_scheduled_sounds(self, current_time):
@@ -665,7 +867,7 @@ class Game:
         self.niveau += 1
         self.niveau_termine = False
         self.transition_niveau = True
-        self.dernier_temps_niveau = pygame.time.get_ticks()
+        self.dernier_temps_niveau = timing.get_ticks()
         
         # Randomize background for the new level
         self.background.randomize_backgrounds()
@@ -673,11 +875,12 @@ class Game:
         # Reset game state for new level but preserve powerups
         self.projectiles.clear()
         self.projectiles_aliens.clear()
+        self.boss_projectiles.clear()
         self.explosions.clear()
         # Don't clear powerups here
         
         # Create new aliens for the level
-        self.envahisseurs = creer_envahisseurs(self.niveau, self.alien_images)
+        self.creer_vague()
         
         # Reset player position
         if self.joueur:
@@ -685,7 +888,7 @@ class Game:
             self.joueur.rect.bottom = HAUTEUR - 10
 
     def draw(self):
-        surface = self.render_surface
+        surface = self.presentation.surface_de_rendu()
         surface.fill((0, 0, 0))
 
         # Draw background first
@@ -697,22 +900,19 @@ class Game:
 
             # Draw player projectiles
             for projectile in self.projectiles:
-                if isinstance(projectile, Projectile):
-                    projectile.dessiner(surface)
+                projectile.dessiner(surface)
 
             # Draw alien projectiles
             for projectile in self.projectiles_aliens:
-                if isinstance(projectile, (ProjectileAlien, ProjectileMystereAgressif)):
-                    projectile.dessiner(surface)
+                projectile.dessiner(surface)
+
+            self.boss_projectiles.dessiner(surface)
 
             for alien in self.envahisseurs:
                 alien.dessiner(surface)
 
-            for explosion in self.explosions:
-                explosion.dessiner(surface)
-
-            for powerup in self.powerups:
-                powerup.dessiner(surface)
+            dessiner_explosions(self.explosions, surface)
+            dessiner_power_ups(self.powerups, surface)
 
             # Draw mystery aliens before boss (so boss appears in front)
             for alien in self.mystery_aliens:
@@ -729,32 +929,54 @@ class Game:
                 dessiner_menu_pause(surface)
 
         elif self.menu:
-            dessiner_menu_accueil(surface, self.meilleur_score, self.controls)
+            classement = self.leaderboard.classement() if self.leaderboard else None
+            dessiner_menu_accueil(surface, self.meilleur_score, self.controls, classement)
         elif self.game_over:
             from ui.menus import dessiner_game_over
-            dessiner_game_over(surface, self.score, self.meilleur_score)
+            if self.leaderboard:
+                # Until the worker stores this run, derniere_partie is the previous one
+                derniere = self.leaderboard.derniere_partie
+                if derniere is not None and derniere['seed'] != self.seed:
+                    derniere = None
+                dessiner_game_over(surface, self.score, self.meilleur_score,
+                                   self.leaderboard.classement(), derniere)
+            else:
+                dessiner_game_over(surface, self.score, self.meilleur_score)
 
         # Overlay any active level transition on top of the scene
         self.level_transition.draw(surface)
 
-        if self.fenetre.get_size() != surface.get_size():
-            scaled_surface = pygame.transform.smoothscale(surface, self.fenetre.get_size())
-            self.fenetre.blit(scaled_surface, (0, 0))
-        else:
-            self.fenetre.blit(surface, (0, 0))
-
-        pygame.display.flip()
+        self.presentation.presenter()
 
     def run(self):
         clock = pygame.time.Clock()
+        # Low-latency mode waits before reading input rather than after the flip
+        pacer = LowLatencyPacer() if BOUCLE_FAIBLE_LATENCE else None
         self.sound_manager.play('music', 0.3)
         
         while self.running:
+            if pacer:
+                pacer.attendre()
+            timing.begin_tick(paused=self.pause)
+            debut = time.perf_counter()
             self.handle_events()
+            # No frame argument: loading a quick-save during the events rebases the clock
             self.update()
             self.draw()
-            clock.tick(60)
+            if self.latence:
+                self.latence.presente()
+            # Frame work time, without the wait for the next frame ('auto' quality)
+            travail = (time.perf_counter() - debut) * 1000
+            qualite().mesurer(travail)
+            persistance().traiter_resultats()
+            if pacer:
+                duree_flip = self.presentation.duree_flip
+                pacer.mesurer(travail - duree_flip, duree_flip)
+            else:
+                clock.tick(60)
         
+        if self.latence:
+            self.latence.afficher_rapport()
         pygame.quit()
 
 if __name__ == '__main__':
@@ -0,0 +1,109 @@
+"""
+Scripted players for headless runs.
+
+A bot is called once per tick with the Game and returns that tick's action
+bitmask (see systems.input_state). Bots keep their own RNG so they never
+consume the gameplay RNG: a seeded game plays out the same with the same bot.
+"""
+
+import random
+
+from config import LARGEUR
+from systems.input_state import ACTION_LEFT, ACTION_RIGHT, ACTION_FIRE
+
+
+class BotImmobile:
+    """Stays in place and fires continuously."""
+
+    def reset(self, seed=0):
+        pass
+
+    def __call__(self, game):
+        return ACTION_FIRE
+
+
+class BotAleatoire:
+    """Mashes random buttons, holding each choice for a few ticks."""
+
+    def __init__(self, duree_min=5, duree_max=30):
+        self.duree_min = duree_min
+        self.duree_max = duree_max
+        self.reset()
+
+    def reset(self, seed=0):
+        self.rng = random.Random(seed)
+        self.actions = 0
+        self.restant = 0
+
+    def __call__(self, game):
+        if self.restant <= 0:
+            self.actions = self.rng.randrange(32)
+            self.restant = self.rng.randint(self.duree_min, self.duree_max)
+        self.restant -= 1
+        return self.actions
+
+
+class BotEsquive:
+    """Dodges incoming shots, otherwise tracks the lowest enemy and fires."""
+
+    def __init__(self, horizon=220, marge=30):
+        self.horizon = horizon  # How far above the ship shots are considered
+        self.marge = marge      # Extra width around the ship treated as danger
+
+    def reset(self, seed=0):
+        pass
+
+    def _menaces(self, game, joueur):
+        haut = joueur.top - self.horizon
+        gauche = joueur.left - self.marge
+        droite = joueur.right + self.marge
+        for projectile in game.projectiles_aliens:
+            rect = projectile.rect
+            if rect.bottom >= haut and rect.top <= joueur.bottom and gauche <= rect.centerx <= droite:
+                yield rect.centerx
+        batch = game.boss_projectiles
+        for x, y in zip(batch.x, batch.y):
+            if haut <= y <= joueur.bottom and gauche <= x <= droite:
+                yield x
+
+    def _cible(self, game):
+        if game.boss:
+            return game.boss.rect.centerx
+        cibles = game.envahisseurs or game.mystery_aliens
+        if not cibles:
+            return None
+        return max(cibles, key=lambda alien: alien.rect.bottom).rect.centerx
+
+    def __call__(self, game):
+        joueur = game.joueur.rect
+        menaces = list(self._menaces(game, joueur))
+        if menaces:
+            # Step away from the average threat, unless the wall is in the way
+            centre = sum(menaces) / len(menaces)
+            vers_droite = centre <= joueur.centerx
+            if vers_droite and joueur.right >= LARGEUR - 5:
+                vers_droite = False
+            elif not vers_droite and joueur.left <= 5:
+                vers_droite = True
+            return ACTION_FIRE | (ACTION_RIGHT if vers_droite else ACTION_LEFT)
+
+        cible = self._cible(game)
+        if cible is None or abs(cible - joueur.centerx) < 8:
+            return ACTION_FIRE
+        return ACTION_FIRE | (ACTION_RIGHT if cible > joueur.centerx else ACTION_LEFT)
+
+
+BOTS = {
+    'immobile': BotImmobile,
+    'aleatoire': BotAleatoire,
+    'esquive': BotEsquive,
+}
+
+
+def creer_bot(nom, seed=0):
+    """Instantiate a bot by name, seeded for reproducible runs."""
+    if nom not in BOTS:
+        raise ValueError(f"Unknown bot '{nom}' (available: {', '.join(BOTS)})")
+    bot = BOTS[nom]()
+    bot.reset(seed)
+    return bot
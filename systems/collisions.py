@@ -0,0 +1,83 @@
+"""
+Pixel-accurate collisions.
+
+Rect overlap stays the broad phase everywhere; only pairs whose rects
+overlap are compared with pygame masks (the narrow phase), so a tick with no
+contact costs exactly what it did before.
+
+Masks are built once per source image and rotation bucket and shared by
+every sprite drawn from that image: a wave of aliens or a volley of bullets
+uses a handful of masks between them. Rotating sprites are bucketed to
+ROTATION_PAS degrees, and their rect is the bucket's rotated bounds.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+ROTATION_PAS = 5  # Degrees per rotation bucket (72 masks per rotating image)
+
+
+class MaskCache:
+    """Collision masks per (image, rotation bucket), least recently used evicted."""
+
+    def __init__(self, max_masques=512):
+        self.max_masques = max_masques
+        self.masques = OrderedDict()  # key -> (source, mask)
+
+    def masque(self, image, angle=0):
+        """Mask of `image` rotated by `angle` degrees (rounded to its bucket)."""
+        bucket = round(angle / ROTATION_PAS) % (360 // ROTATION_PAS)
+        cle = (id(image), bucket)
+        entree = self.masques.get(cle)
+        # The source is kept with the mask, so its id() cannot be reused
+        if entree is None or entree[0] is not image:
+            if bucket:
+                image_tournee = pygame.transform.rotate(image, bucket * ROTATION_PAS)
+            else:
+                image_tournee = image
+            entree = (image, pygame.mask.from_surface(image_tournee))
+            self.masques[cle] = entree
+            if len(self.masques) > self.max_masques:
+                self.masques.popitem(last=False)
+        else:
+            self.masques.move_to_end(cle)
+        return entree[1]
+
+    def plein(self, taille):
+        """Solid mask for shapes drawn as filled rects."""
+        cle = ('plein', tuple(taille))
+        entree = self.masques.get(cle)
+        if entree is None:
+            entree = (None, pygame.mask.Mask(taille, fill=True))
+            self.masques[cle] = entree
+        return entree[1]
+
+
+_masques = MaskCache()
+
+
+def masques():
+    """The process-wide collision mask cache."""
+    return _masques
+
+
+def rect_tourne(image, angle, centre):
+    """Bounds of `image` at `angle`'s rotation bucket, centred on `centre`."""
+    return masques().masque(image, angle).get_rect(center=centre)
+
+
+def zone_tournee(image, angle, centre):
+    """zone_collision() of a sprite drawn rotated around `centre`."""
+    masque = masques().masque(image, angle)
+    return masque, masque.get_rect(center=centre).topleft
+
+
+def se_touchent(a, b):
+    """Narrow phase for two entities whose rects already overlap.
+
+    Both provide zone_collision() -> (mask, top-left position).
+    """
+    masque_a, (xa, ya) = a.zone_collision()
+    masque_b, (xb, yb) = b.zone_collision()
+    return masque_a.overlap(masque_b, (xb - xa, yb - ya)) is not None
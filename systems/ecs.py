@@ -0,0 +1,210 @@
+"""
+Archetype component storage.
+
+Entities of one kind share an Archetype: each component is a column (a plain
+list, as in ProjectileBatch) and each entity is a row, so systems update a
+whole column in one pass instead of calling a method per object.
+
+Systems never remove rows while iterating: detruire() queues a row and
+World.appliquer_destructions() removes the queued rows once per tick by
+moving the last row into each hole, so removing k rows costs O(k) whatever
+the number of live entities.
+
+Entities that keep per-object behaviour (aliens, projectiles) live in an
+EntityPool instead: the same deferred swap-remove, for whole objects,
+addressed by generational handles.
+"""
+
+
+class Archetype:
+    """Rows of entities that have the same components, stored column by column."""
+
+    def __init__(self, nom, composants):
+        self.nom = nom
+        self.composants = tuple(composants)
+        for composant in self.composants:
+            setattr(self, composant, [])
+        self.a_detruire = set()
+
+    def __len__(self):
+        return len(getattr(self, self.composants[0]))
+
+    def colonnes(self):
+        return [getattr(self, composant) for composant in self.composants]
+
+    def vivants(self):
+        """Rows not queued for destruction."""
+        return len(self) - len(self.a_detruire)
+
+    def ajouter(self, **valeurs):
+        """Append a row; every component must be given. Returns the row index."""
+        for composant in self.composants:
+            getattr(self, composant).append(valeurs[composant])
+        return len(self) - 1
+
+    def detruire(self, index):
+        """Queue row `index` for removal at the end of the tick."""
+        self.a_detruire.add(index)
+
+    def appliquer_destructions(self):
+        if not self.a_detruire:
+            return
+        colonnes = self.colonnes()
+        # Highest rows first: the row moved into each hole is never a queued one
+        for index in sorted(self.a_detruire, reverse=True):
+            for colonne in colonnes:
+                colonne[index] = colonne[-1]
+                colonne.pop()
+        self.a_detruire.clear()
+
+    def clear(self):
+        for colonne in self.colonnes():
+            colonne.clear()
+        self.a_detruire.clear()
+
+
+class World:
+    """The archetypes of one game."""
+
+    def __init__(self):
+        self.archetypes = {}
+
+    def archetype(self, nom, composants):
+        """Return the archetype `nom`, creating it on first use."""
+        if nom not in self.archetypes:
+            self.archetypes[nom] = Archetype(nom, composants)
+        return self.archetypes[nom]
+
+    def appliquer_destructions(self):
+        for archetype in self.archetypes.values():
+            archetype.appliquer_destructions()
+
+    def clear(self):
+        for archetype in self.archetypes.values():
+            archetype.clear()
+
+
+def integrer(archetype, position, vitesse):
+    """Add the `vitesse` column to the `position` column, in place."""
+    colonne = getattr(archetype, position)
+    colonne[:] = [p + v for p, v in zip(colonne, getattr(archetype, vitesse))]
+
+
+def dessiner_sprites(fenetre, images, archetype):
+    """Blit one image per row, centred on the row's x, y and sized by `taille`."""
+    if not images:
+        return
+    fenetre.blits(
+        [(image, (x - largeur // 2, y - hauteur // 2))
+         for image, x, y, (largeur, hauteur) in zip(images, archetype.x, archetype.y, archetype.taille)],
+        False
+    )
+
+
+class EntityPool:
+    """Objects addressed by generational handles, with O(1) removal.
+
+    A handle is (slot, generation). Removing an object bumps its slot's
+    generation, so a handle kept elsewhere goes stale instead of silently
+    pointing at whatever object reuses the slot. retirer() only marks the
+    object; compacter() swap-removes the marked objects once per tick.
+    Iteration yields the objects alive when it started and skips any removed
+    along the way, so loops may add and remove without copying the pool.
+    """
+
+    def __init__(self, objets=()):
+        self.objets = []       # Dense storage, iteration order
+        self.actifs = []       # Dense index -> still alive
+        self.slots = []        # Dense index -> slot
+        self.positions = []    # Slot -> dense index
+        self.generations = []  # Slot -> generation
+        self.libres = []       # Slots free for reuse
+        self.slot_de = {}      # Live object -> slot
+        self.retires = []      # Dense indices waiting for compacter()
+        for objet in objets:
+            self.ajouter(objet)
+
+    def __len__(self):
+        return len(self.slot_de)
+
+    def __iter__(self):
+        objets, actifs = self.objets, self.actifs
+        for index in range(len(objets)):
+            if actifs[index]:
+                yield objets[index]
+
+    def __getitem__(self, index):
+        """Live object by position (used by random.choice)."""
+        if not self.retires:
+            return self.objets[index]
+        return list(self)[index]
+
+    def __contains__(self, objet):
+        return objet in self.slot_de
+
+    def ajouter(self, objet):
+        """Add an object; returns its handle."""
+        if self.libres:
+            slot = self.libres.pop()
+        else:
+            slot = len(self.generations)
+            self.generations.append(0)
+            self.positions.append(-1)
+        self.positions[slot] = len(self.objets)
+        self.objets.append(objet)
+        self.actifs.append(True)
+        self.slots.append(slot)
+        self.slot_de[objet] = slot
+        return slot, self.generations[slot]
+
+    def handle(self, objet):
+        slot = self.slot_de[objet]
+        return slot, self.generations[slot]
+
+    def get(self, handle):
+        """The object behind `handle`, or None once it was removed."""
+        slot, generation = handle
+        if slot >= len(self.generations) or self.generations[slot] != generation:
+            return None
+        return self.objets[self.positions[slot]]
+
+    def retirer(self, objet):
+        """Remove an object (or do nothing if it is already gone)."""
+        slot = self.slot_de.pop(objet, None)
+        if slot is None:
+            return False
+        self.generations[slot] += 1
+        index = self.positions[slot]
+        self.actifs[index] = False
+        self.retires.append(index)
+        return True
+
+    def compacter(self):
+        """Swap-remove every object retired since the last call."""
+        if not self.retires:
+            return
+        objets, actifs, slots, positions = self.objets, self.actifs, self.slots, self.positions
+        # Highest indices first: the row moved into each hole is never a retired one
+        for index in sorted(self.retires, reverse=True):
+            self.libres.append(slots[index])
+            dernier = len(objets) - 1
+            if index != dernier:
+                objets[index] = objets[dernier]
+                actifs[index] = actifs[dernier]
+                slots[index] = slots[dernier]
+                positions[slots[index]] = index
+            objets.pop()
+            actifs.pop()
+            slots.pop()
+        self.retires.clear()
+
+    def clear(self):
+        for slot in self.slot_de.values():
+            self.generations[slot] += 1
+        self.libres.extend(self.slot_de.values())
+        self.libres.extend(self.slots[index] for index in self.retires)
+        self.objets.clear()
+        self.actifs.clear()
+        self.slots.clear()
+        self.slot_de.clear()
+        self.retires.clear()
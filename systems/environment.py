@@ -0,0 +1,257 @@
+"""
+Gym-style environments for automated play.
+
+InvadersEnv wraps one HeadlessSimulation behind reset()/step(action), with
+the same signatures as Gymnasium: reset() returns (observation, info) and
+step() returns (observation, reward, terminated, truncated, info). An action
+is the tick's bitmask from systems.input_state (0-31), the same input a
+player, a replay or a bot produces.
+
+Observations are NumPy arrays:
+    'entites': float32 vector, the player state followed by fixed-size slots
+               (x, y, present) per entity group, coordinates scaled to 0-1
+    'pixels':  uint8 (hauteur, largeur, 3) downsampled framebuffer
+
+VecInvadersEnv steps N games in one process and returns batched arrays. The
+gameplay code uses the global `random` module and the global tick clock, so
+each env swaps its own RNG state and virtual time in around every tick.
+Benchmark:
+    python -m systems.environment --envs 8 --steps 2000 [--pixels]
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+import pygame
+
+from config import LARGEUR, HAUTEUR
+from systems.simulation import HeadlessSimulation
+from utils import timing
+
+NB_ACTIONS = 32  # Every combination of the five action bits
+
+# Entity groups of the 'entites' observation and their slot counts; when a
+# group has more entities than slots, the lowest ones (closest to the player)
+# are kept
+SLOTS_ENTITES = (
+    ('envahisseurs', 48),
+    ('mystery_aliens', 4),
+    ('boss', 1),
+    ('projectiles', 16),
+    ('projectiles_aliens', 32),
+    ('boss_projectiles', 64),
+    ('powerups', 4),
+)
+TAILLE_JOUEUR = 6  # x, y, lives, level, shield, rapid fire
+
+
+def _positions(game, groupe):
+    """(x, y) centres of one entity group, in pixels."""
+    if groupe == 'boss':
+        return [game.boss.rect.center] if game.boss else []
+    if groupe == 'boss_projectiles':
+        return list(zip(game.boss_projectiles.x, game.boss_projectiles.y))
+    if groupe == 'powerups':
+        powerups = game.powerups
+        return [(x, y) for i, (x, y) in enumerate(zip(powerups.x, powerups.y))
+                if i not in powerups.a_detruire]
+    return [objet.rect.center for objet in getattr(game, groupe)]
+
+
+class InvadersEnv:
+    """reset()/step(action) over one headless game.
+
+    Each action is repeated for `frame_skip` ticks. The reward is the score
+    gained over the step, minus `penalite_vie` per life lost. An episode is
+    truncated after `max_ticks` ticks.
+    """
+
+    def __init__(self, observation='entites', frame_skip=1, taille_pixels=(84, 84),
+                 max_ticks=60 * 60 * 10, penalite_vie=500, ship_index=0, game=None):
+        if observation not in ('entites', 'pixels'):
+            raise ValueError(f"Unknown observation '{observation}' (available: entites, pixels)")
+        self.observation = observation
+        self.frame_skip = frame_skip
+        self.taille_pixels = taille_pixels
+        self.max_ticks = max_ticks
+        self.penalite_vie = penalite_vie
+        self.ship_index = ship_index
+
+        self._etat_rng = random.getstate()
+        with self._actif():
+            self.simulation = HeadlessSimulation(game)
+        self.game = self.simulation.game
+        self.ticks = 0
+
+        if observation == 'pixels':
+            self._reduction = pygame.Surface(taille_pixels)
+            self.observation_shape = (taille_pixels[1], taille_pixels[0], 3)
+            self.observation_dtype = np.uint8
+        else:
+            self._entites = np.zeros(TAILLE_JOUEUR + 3 * sum(n for _, n in SLOTS_ENTITES), np.float32)
+            self.observation_shape = self._entites.shape
+            self.observation_dtype = np.float32
+
+    def _actif(self):
+        return _EnvActif(self)
+
+    def reset(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        with self._actif():
+            self.simulation.reset(seed=seed, ship_index=self.ship_index)
+            self.ticks = 0
+            return self._observer(), self._info()
+
+    def step(self, action):
+        game = self.game
+        score, vies = game.score, game.vies
+        with self._actif():
+            for _ in range(self.frame_skip):
+                self.simulation.step(int(action))
+                self.ticks += 1
+                if game.game_over:
+                    break
+            observation = self._observer()
+        reward = (game.score - score) - self.penalite_vie * max(0, vies - game.vies)
+        truncated = not game.game_over and self.ticks >= self.max_ticks
+        return observation, float(reward), game.game_over, truncated, self._info()
+
+    def _info(self):
+        game = self.game
+        return {'score': game.score, 'niveau': game.niveau, 'vies': game.vies,
+                'ticks': self.ticks, 'seed': game.seed}
+
+    def _observer(self):
+        if self.observation == 'pixels':
+            return self._pixels()
+        return self._vecteur()
+
+    def _vecteur(self):
+        game = self.game
+        obs = self._entites
+        obs.fill(0)
+        joueur = game.joueur
+        obs[:TAILLE_JOUEUR] = (
+            joueur.rect.centerx / LARGEUR, joueur.rect.centery / HAUTEUR,
+            game.vies / 3, game.niveau / 10,
+            bool(joueur.shield_actif), bool(joueur.rapid_fire),
+        )
+        debut = TAILLE_JOUEUR
+        for groupe, slots in SLOTS_ENTITES:
+            positions = _positions(game, groupe)
+            if positions:
+                points = np.asarray(positions, np.float32)
+                if len(points) > slots:
+                    points = points[np.argpartition(-points[:, 1], slots - 1)[:slots]]
+                bloc = obs[debut:debut + 3 * len(points)].reshape(-1, 3)
+                bloc[:, 0] = points[:, 0] / LARGEUR
+                bloc[:, 1] = points[:, 1] / HAUTEUR
+                bloc[:, 2] = 1
+            debut += 3 * slots
+        return obs.copy()
+
+    def _pixels(self):
+        self.game.draw()
+        rendu = self.game.presentation.surface_de_rendu()
+        pygame.transform.smoothscale(rendu, self.taille_pixels, self._reduction)
+        # surfarray is (x, y, rgb); observations are row-major images
+        return pygame.surfarray.array3d(self._reduction).swapaxes(0, 1)
+
+    def close(self):
+        pass
+
+
+class _EnvActif:
+    """Swaps an env's RNG state and virtual clock in for the duration of a call."""
+
+    def __init__(self, env):
+        self.env = env
+
+    def __enter__(self):
+        self.exterieur = random.getstate()
+        random.setstate(self.env._etat_rng)
+        simulation = getattr(self.env, 'simulation', None)
+        if simulation is not None:
+            timing.begin_tick(simulation.time)
+
+    def __exit__(self, *exc):
+        self.env._etat_rng = random.getstate()
+        random.setstate(self.exterieur)
+        return False
+
+
+class VecInvadersEnv:
+    """N InvadersEnv stepped together in one process, with batched arrays.
+
+    Finished episodes reset automatically: the observation returned for that
+    env is the first of the new episode, and its info keeps the last one
+    under 'final_observation'. Env i of reset(seed) plays seeds seed + i,
+    seed + i + N, seed + i + 2N, ...
+    """
+
+    def __init__(self, nombre, **kwargs):
+        self.envs = [InvadersEnv(**kwargs) for _ in range(nombre)]
+        self.nombre = nombre
+        self.observation_shape = (nombre, *self.envs[0].observation_shape)
+        self._observations = np.zeros(self.observation_shape, self.envs[0].observation_dtype)
+        self._seeds = [None] * nombre
+
+    def _prochain_seed(self, i):
+        if self._seeds[i] is None:
+            return None
+        self._seeds[i] += self.nombre
+        return self._seeds[i]
+
+    def reset(self, seed=None):
+        infos = []
+        for i, env in enumerate(self.envs):
+            self._seeds[i] = None if seed is None else seed + i
+            self._observations[i], info = env.reset(self._seeds[i])
+            infos.append(info)
+        return self._observations.copy(), infos
+
+    def step(self, actions):
+        recompenses = np.zeros(self.nombre, np.float32)
+        termines = np.zeros(self.nombre, bool)
+        tronques = np.zeros(self.nombre, bool)
+        infos = []
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            observation, recompenses[i], termines[i], tronques[i], info = env.step(action)
+            if termines[i] or tronques[i]:
+                info['final_observation'] = observation
+                observation, _ = env.reset(self._prochain_seed(i))
+            self._observations[i] = observation
+            infos.append(info)
+        return self._observations.copy(), recompenses, termines, tronques, infos
+
+    def close(self):
+        for env in self.envs:
+            env.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Random-action rollout throughput")
+    parser.add_argument('--envs', type=int, default=4)
+    parser.add_argument('--steps', type=int, default=1000)
+    parser.add_argument('--pixels', action='store_true', help="Framebuffer observations")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    envs = VecInvadersEnv(args.envs, observation='pixels' if args.pixels else 'entites')
+    observations, _ = envs.reset(seed=args.seed)
+    rng = np.random.default_rng(args.seed)
+    episodes = 0
+    debut = time.perf_counter()
+    for _ in range(args.steps):
+        observations, _, termines, tronques, _ = envs.step(rng.integers(NB_ACTIONS, size=args.envs))
+        episodes += int(np.count_nonzero(termines | tronques))
+    duree = time.perf_counter() - debut
+    print(f"{args.envs} envs, observations {observations.shape} {observations.dtype}")
+    print(f"{args.envs * args.steps / duree:,.0f} steps/s, {episodes} episodes finished")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Per-tick input as an action bitmask.
+
+The game samples the keyboard once per tick into a small integer (one bit per
+action) and hands that to the player, so the same tick can be driven by a
+replay or a bot instead of live key state.
+"""
+
+import pygame
+from utils.control_settings import DEFAULT_BINDINGS
+
+ACTION_LEFT = 1 << 0
+ACTION_RIGHT = 1 << 1
+ACTION_UP = 1 << 2
+ACTION_DOWN = 1 << 3
+ACTION_FIRE = 1 << 4  # Fire key pressed during the tick (KEYDOWN), not held
+
+MOVEMENT_ACTIONS = (
+    ("move_left", ACTION_LEFT),
+    ("move_right", ACTION_RIGHT),
+    ("move_up", ACTION_UP),
+    ("move_down", ACTION_DOWN),
+)
+
+
+class InputSampler:
+    """Samples the keyboard once per tick into an action bitmask.
+
+    Bindings are resolved to (key, bit) pairs once, and again only when the
+    ControlSettings revision changes (a key was rebound).
+    """
+
+    def __init__(self, controls=None):
+        self.controls = controls
+        self._revision = None
+        self._touches = ()
+
+    def _resoudre(self):
+        revision = self.controls.revision if self.controls else 0
+        if revision != self._revision:
+            self._touches = tuple(
+                (self.controls.get(action) if self.controls else DEFAULT_BINDINGS[action], bit)
+                for action, bit in MOVEMENT_ACTIONS)
+            self._revision = revision
+        return self._touches
+
+    def sample(self, keys=None):
+        """Return the held movement actions as a bitmask."""
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        mask = 0
+        for key, bit in self._resoudre():
+            if keys[key]:
+                mask |= bit
+        return mask
+
+
+def sample_keyboard(controls=None, keys=None):
+    """Return the held movement actions as a bitmask (resolving bindings each call)."""
+    if keys is None:
+        keys = pygame.key.get_pressed()
+    mask = 0
+    for action, bit in MOVEMENT_ACTIONS:
+        key = controls.get(action) if controls else DEFAULT_BINDINGS[action]
+        if keys[key]:
+            mask |= bit
+    return mask
@@ -0,0 +1,141 @@
+"""
+Input latency measurement and low-latency frame pacing.
+
+LatencyProbe times each input from the moment the game reads it (the event
+pump at the start of handle_events) to the return of the first
+display.flip() showing a tick that consumed it: the fire key from its
+KEYDOWN, movement from the tick whose sampled keys changed. pygame events
+carry no arrival time, so an input that arrives while the loop waits for
+its next frame is not aged by that wait; the wait between each flip and
+the next read is reported separately ('attente') as its upper bound.
+
+LowLatencyPacer replaces clock.tick(60): it busy-waits the frame boundary
+(tick_busy_loop) instead of trusting the OS sleep, and when the display
+paces the flips (vsync, a compositor, a full driver queue), it delays the
+input read until just before the next refresh, so each frame shows the
+freshest input and no finished frame waits in the queue.
+
+Both are enabled from config.py (LATENCE_MESURE, BOUCLE_FAIBLE_LATENCE); the
+probe prints its report when the game exits.
+"""
+
+import time
+from collections import deque
+
+import pygame
+
+# Genres of measured inputs, in report order
+GENRES = ('tir', 'mouvement', 'attente')
+
+
+def centile(valeurs, fraction):
+    """Nearest-rank percentile of a sorted list."""
+    if not valeurs:
+        return 0.0
+    rang = min(len(valeurs) - 1, max(0, round(fraction * len(valeurs)) - 1))
+    return valeurs[rang]
+
+
+class LatencyProbe:
+    """Read-to-flip latency of the inputs of a live game, in milliseconds."""
+
+    def __init__(self, max_mesures=100000):
+        self.mesures = {genre: deque(maxlen=max_mesures) for genre in GENRES}
+        self.lecture = None        # perf_counter of this tick's event pump
+        self.dernier_flip = None   # perf_counter when the last flip returned
+        self.lues = {}             # genre -> read time of an input not consumed yet
+        self.a_presenter = []      # (genre, read time) consumed by this tick's update
+        self.dernier_mouvement = 0
+
+    def pompe(self):
+        """The game is about to read this tick's events."""
+        self.lecture = time.perf_counter()
+        if self.dernier_flip is not None:
+            self.mesures['attente'].append((self.lecture - self.dernier_flip) * 1000)
+
+    def lire(self, genre):
+        """An input of `genre` was read; the earliest unconsumed one is timed."""
+        if self.lecture is not None:
+            self.lues.setdefault(genre, self.lecture)
+
+    def appliquer(self, genre):
+        """The update consumed the pending input of `genre`."""
+        lecture = self.lues.pop(genre, None)
+        if lecture is not None:
+            self.a_presenter.append((genre, lecture))
+
+    def mouvement(self, actions):
+        """Time a change of the held movement keys (an action bitmask)."""
+        if actions != self.dernier_mouvement:
+            self.dernier_mouvement = actions
+            self.lire('mouvement')
+            self.appliquer('mouvement')
+
+    def presente(self):
+        """The frame showing this tick has been flipped."""
+        self.dernier_flip = time.perf_counter()
+        for genre, lecture in self.a_presenter:
+            self.mesures[genre].append((self.dernier_flip - lecture) * 1000)
+        self.a_presenter.clear()
+
+    def rapport(self):
+        """{genre: {'n', 'min', 'p50', 'p90', 'p99', 'max'}} in milliseconds."""
+        rapport = {}
+        for genre, mesures in self.mesures.items():
+            valeurs = sorted(mesures)
+            if not valeurs:
+                continue
+            rapport[genre] = {
+                'n': len(valeurs),
+                'min': valeurs[0],
+                'p50': centile(valeurs, 0.5),
+                'p90': centile(valeurs, 0.9),
+                'p99': centile(valeurs, 0.99),
+                'max': valeurs[-1],
+            }
+        return rapport
+
+    def afficher_rapport(self):
+        rapport = self.rapport()
+        if not rapport:
+            print("Input latency: no input measured")
+            return
+        print("Input latency, read to flip (ms); 'attente' is the unread wait before each read")
+        print(f"  {'':10s} {'n':>7s} {'min':>7s} {'p50':>7s} {'p90':>7s} {'p99':>7s} {'max':>7s}")
+        for genre, stats in rapport.items():
+            print(f"  {genre:10s} {stats['n']:7d} {stats['min']:7.2f} {stats['p50']:7.2f} "
+                  f"{stats['p90']:7.2f} {stats['p99']:7.2f} {stats['max']:7.2f}")
+
+
+class LowLatencyPacer:
+    """Frame pacing that reads input as late as the display allows."""
+
+    def __init__(self, fps=60, marge_ms=2.0, seuil_bloque_ms=2.0, fenetre=30):
+        self.fps = fps
+        self.periode_ms = 1000 / fps
+        self.marge_ms = marge_ms                # Safety margin before the next refresh
+        self.seuil_bloque_ms = seuil_bloque_ms  # A flip this long was held by the display
+        self.clock = pygame.time.Clock()
+        self.travail = deque(maxlen=fenetre)    # Recent read-to-flip work times (ms)
+        self.flips = deque(maxlen=fenetre)      # Recent time spent inside flip (ms)
+        self.fin_flip = None
+
+    def attendre(self):
+        """Wait until this frame should read its input."""
+        self.clock.tick_busy_loop(self.fps)
+        if self.fin_flip is None or not self.flips:
+            return
+        # Flips only block when the display paces them: start the frame just in
+        # time for the next refresh instead of blocking in flip with stale input
+        if sorted(self.flips)[len(self.flips) // 2] < self.seuil_bloque_ms:
+            return
+        ecoule = (time.perf_counter() - self.fin_flip) * 1000
+        retard = self.periode_ms - max(self.travail) - self.marge_ms - ecoule
+        if retard >= 1:
+            pygame.time.delay(int(retard))  # Busy-waits, unlike pygame.time.wait
+
+    def mesurer(self, travail_ms, flip_ms):
+        """Record a frame's read-to-flip work and time blocked in flip."""
+        self.travail.append(travail_ms)
+        self.flips.append(flip_ms)
+        self.fin_flip = time.perf_counter()
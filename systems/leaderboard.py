@@ -0,0 +1,198 @@
+"""
+Local leaderboard.
+
+Every finished run is a row of an SQLite database: score, level reached,
+accuracy, best combo, ship, seed and duration. The table is indexed on
+score, (ship, score) and (level, score), so a top-N query reads N index
+entries whatever the number of runs stored.
+
+The connection lives on a worker thread. The game queues inserts and
+queries, and its screens read the latest results from a cache, so no frame
+waits on SQLite. LeaderboardStore is the synchronous layer underneath, for
+tools and benchmarks:
+    python -m systems.leaderboard [--ship N] [--level N] [--top N]
+"""
+
+import argparse
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from config import LEADERBOARD_FILE
+
+# Columns of a run, in table order
+COLONNES = ('score', 'niveau', 'precision', 'meilleur_combo', 'vaisseau', 'seed', 'duree_ms', 'date')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parties (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    niveau INTEGER NOT NULL,
+    precision REAL NOT NULL,
+    meilleur_combo INTEGER NOT NULL,
+    vaisseau INTEGER NOT NULL,
+    seed INTEGER,
+    duree_ms INTEGER NOT NULL,
+    date REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS parties_score ON parties (score DESC);
+CREATE INDEX IF NOT EXISTS parties_vaisseau ON parties (vaisseau, score DESC);
+CREATE INDEX IF NOT EXISTS parties_niveau ON parties (niveau, score DESC);
+"""
+
+_INSERT = f"INSERT INTO parties ({', '.join(COLONNES)}) VALUES ({', '.join('?' * len(COLONNES))})"
+
+
+class LeaderboardStore:
+    """Synchronous access to the leaderboard database (one thread only)."""
+
+    def __init__(self, path=LEADERBOARD_FILE):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.connexion = sqlite3.connect(path)
+        self.connexion.row_factory = sqlite3.Row
+        # Readers never block the writer; a crash loses at most the last commit
+        self.connexion.execute('PRAGMA journal_mode=WAL')
+        self.connexion.execute('PRAGMA synchronous=NORMAL')
+        self.connexion.executescript(_SCHEMA)
+
+    @staticmethod
+    def _valeurs(partie):
+        partie = dict(partie)
+        partie.setdefault('date', time.time())
+        return tuple(partie.get(colonne) for colonne in COLONNES)
+
+    def ajouter(self, partie):
+        """Insert one run (a dict keyed by COLONNES); returns its id."""
+        with self.connexion:
+            return self.connexion.execute(_INSERT, self._valeurs(partie)).lastrowid
+
+    def ajouter_plusieurs(self, parties):
+        with self.connexion:
+            self.connexion.executemany(_INSERT, (self._valeurs(partie) for partie in parties))
+
+    def top(self, n=10, vaisseau=None, niveau=None):
+        """Best runs, optionally for one ship or one level, as dicts."""
+        conditions, valeurs = [], []
+        if vaisseau is not None:
+            conditions.append('vaisseau = ?')
+            valeurs.append(vaisseau)
+        if niveau is not None:
+            conditions.append('niveau = ?')
+            valeurs.append(niveau)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ''
+        lignes = self.connexion.execute(
+            f"SELECT id, {', '.join(COLONNES)} FROM parties {where}ORDER BY score DESC LIMIT ?",
+            (*valeurs, n))
+        return [dict(ligne) for ligne in lignes]
+
+    def rang(self, score):
+        """Position a score would take in the overall ranking (1 = best)."""
+        return self.connexion.execute(
+            'SELECT COUNT(*) FROM parties WHERE score > ?', (score,)).fetchone()[0] + 1
+
+    def compter(self):
+        return self.connexion.execute('SELECT COUNT(*) FROM parties').fetchone()[0]
+
+    def fermer(self):
+        self.connexion.close()
+
+
+class Leaderboard:
+    """A LeaderboardStore on a worker thread, read through cached results.
+
+    enregistrer() and demander() return immediately. classement() returns the
+    last result of a query (an empty list until it first arrives) and asks
+    for it if it was never requested; every insert refreshes the cached
+    queries.
+    """
+
+    def __init__(self, path=LEADERBOARD_FILE, taille=10):
+        self.path = path
+        self.taille = taille
+        self.classements = {}        # (vaisseau, niveau) -> list of run dicts
+        self.derniere_partie = None  # The last recorded run, with its 'id' and 'rang'
+        self._requetes = queue.SimpleQueue()
+        self._thread = None
+
+    def _demarrer(self):
+        self._thread = threading.Thread(target=self._boucle, name='leaderboard', daemon=True)
+        self._thread.start()
+        atexit.register(self.fermer, 2.0)
+
+    def _envoyer(self, requete):
+        if self._thread is None:
+            self._demarrer()
+        self._requetes.put(requete)
+
+    def enregistrer(self, partie):
+        """Queue a finished run for insertion."""
+        self._envoyer(('ajouter', dict(partie)))
+
+    def demander(self, vaisseau=None, niveau=None):
+        """Queue a refresh of the top runs for a ship and/or level."""
+        self._envoyer(('top', (vaisseau, niveau)))
+
+    def classement(self, vaisseau=None, niveau=None):
+        cle = (vaisseau, niveau)
+        if cle not in self.classements:
+            self.classements[cle] = []
+            self.demander(vaisseau, niveau)
+        return self.classements[cle]
+
+    def _boucle(self):
+        try:
+            store = LeaderboardStore(self.path)
+        except sqlite3.Error as e:
+            print(f"Leaderboard unavailable: {e}")
+            return
+        while True:
+            requete = self._requetes.get()
+            if requete is None:
+                break
+            action, argument = requete
+            try:
+                if action == 'ajouter':
+                    argument['id'] = store.ajouter(argument)
+                    argument['rang'] = store.rang(argument['score'])
+                    self.derniere_partie = argument
+                    cles = list(self.classements)
+                else:
+                    cles = [argument]
+                for vaisseau, niveau in cles:
+                    # Swapped in whole: the main thread never sees a partial list
+                    self.classements[(vaisseau, niveau)] = store.top(self.taille, vaisseau, niveau)
+            except sqlite3.Error as e:
+                print(f"Leaderboard error: {e}")
+        store.fermer()
+
+    def fermer(self, timeout=None):
+        """Finish the queued requests and close the database."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._requetes.put(None)
+        self._thread.join(timeout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the local leaderboard")
+    parser.add_argument('--ship', type=int, default=None)
+    parser.add_argument('--level', type=int, default=None)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--db', default=LEADERBOARD_FILE)
+    args = parser.parse_args()
+
+    store = LeaderboardStore(args.db)
+    print(f"{store.compter()} runs in {args.db}")
+    for rang, partie in enumerate(store.top(args.top, args.ship, args.level), 1):
+        print(f"{rang:3d}. {partie['score']:>9,}  level {partie['niveau']:2d}  "
+              f"{partie['precision']:5.1f}%  combo x{partie['meilleur_combo']:<3d}  "
+              f"ship {partie['vaisseau']}  seed {partie['seed']}  {partie['duree_ms'] / 1000:7.1f}s")
+    store.fermer()
+
+
+if __name__ == '__main__':
+    main()
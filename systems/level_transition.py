@@ -1,6 +1,9 @@
 import pygame
 from typing import Callable, Optional, Tuple
 
+from assets import charger_police
+from utils import timing
+
 
 class LevelTransitionManager:
     """Handle smooth level transitions without blocking the game loop."""
@@ -33,8 +36,14 @@ class LevelTransitionManager:
 
         # Rendering helpers
         self._overlay_surface: Optional[pygame.Surface] = None
-        self._title_font = pygame.font.Font(None, 96)
-        self._subtitle_font = pygame.font.Font(None, 42)
+        self._title_font = charger_police(96)
+        self._subtitle_font = charger_police(42)
+
+    def __getstate__(self) -> dict:
+        # The overlay is a render cache; snapshots only keep transition state
+        state = self.__dict__.copy()
+        state['_overlay_surface'] = None
+        return state
 
     def reset(self) -> None:
         """Return to idle state and clear any pending transition."""
@@ -60,7 +69,7 @@ class LevelTransitionManager:
 
         self.active = True
         self.phase = "fade_out"
-        self.phase_start = pygame.time.get_ticks()
+        self.phase_start = timing.get_ticks()
         self.alpha = 0
         self.next_level = next_level
         self.is_boss_level = is_boss_level
@@ -80,7 +89,7 @@ class LevelTransitionManager:
             return
 
         if current_time is None:
-            current_time = pygame.time.get_ticks()
+            current_time = timing.get_ticks()
 
         elapsed = current_time - self.phase_start
 
@@ -0,0 +1,309 @@
+"""
+Memory accounting.
+
+Measures what a running game keeps in memory:
+  - bytes per entity type: each instance plus what it owns (rects, trail and
+    particle lists, surfaces it built itself such as rotated frames); assets it
+    only references are counted with their category, small ints and strings
+    are shared by the interpreter and not counted
+  - bytes per row of the column stores (archetypes, the boss bullet batch)
+  - Surface bytes per asset category: every key of Game.images, the mystery
+    alien images, the effect atlas and sprite cache, the explosion FrameCache,
+    the background and the HUD; a surface reachable from several categories
+    is counted once, in the first
+  - peak entity counts per level, sampled every tick by MemoryAccounting
+
+Entity sizes are sampled every few seconds rather than every tick: walking
+every object is far more expensive than counting collections.
+
+    python -m systems.memory --seed 3 --minutes 10 --bot esquive
+plays a headless game and prints the report.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pygame
+
+from systems.snapshot import SIMULATION_FIELDS, _slot_names
+
+# Top-level packages whose objects are walked into
+_PAQUETS_JEU = ('entities', 'effects', 'systems', 'ui', 'assets')
+
+# Entity types are the classes of these packages (systems objects are containers)
+_PAQUETS_ENTITES = ('entities', 'effects')
+
+_CONTENEURS = (list, tuple, dict, set)
+
+
+def octets_surface(surface):
+    """Pixel bytes of a surface; 0 for subsurfaces, which share their parent's."""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+def _du_jeu(valeur, paquets=_PAQUETS_JEU):
+    return type(valeur).__module__.split('.')[0] in paquets
+
+
+def _attributs(obj):
+    valeurs = list(vars(obj).values()) if hasattr(obj, '__dict__') else []
+    valeurs.extend(getattr(obj, nom) for nom in _slot_names(type(obj)) if hasattr(obj, nom))
+    return valeurs
+
+
+def _surfaces(valeur, vus):
+    """Surfaces reachable from `valeur` through containers and game objects."""
+    pile = [valeur]
+    while pile:
+        valeur = pile.pop()
+        if id(valeur) in vus:
+            continue
+        if isinstance(valeur, pygame.Surface):
+            vus.add(id(valeur))
+            yield valeur
+        elif isinstance(valeur, _CONTENEURS):
+            vus.add(id(valeur))
+            pile.extend(valeur.values() if isinstance(valeur, dict) else valeur)
+        elif _du_jeu(valeur):
+            vus.add(id(valeur))
+            pile.extend(_attributs(valeur))
+
+
+def categories_assets(game):
+    """Asset category -> objects holding its surfaces, in accounting order."""
+    from assets import cache_frames
+    from effects.effect_atlas import effect_atlas
+    from effects.visual_effects import sprites_effets
+    from entities.mystery_alien import _images as images_mystere
+
+    categories = {f'images/{cle}': valeur for cle, valeur in game.images.items()}
+    categories['mystery_aliens'] = images_mystere
+    categories['effect_atlas'] = [effect_atlas().surface, effect_atlas().hors_atlas]
+    categories['effect_sprites'] = sprites_effets().sprites
+    categories['explosion_frames'] = cache_frames().frames
+    categories['background'] = game.background
+    categories['hud'] = game.hud
+    return categories
+
+
+def octets_assets(game):
+    """({category: Surface bytes}, ids of every asset surface and container)."""
+    vus = set()
+    octets = {}
+    for categorie, valeur in categories_assets(game).items():
+        octets[categorie] = sum(octets_surface(surface) for surface in _surfaces(valeur, vus))
+    return octets, vus
+
+
+def _octets(valeur, partages, vus):
+    """Bytes owned through one attribute value (containers are followed)."""
+    total = 0
+    pile = [valeur]
+    while pile:
+        valeur = pile.pop()
+        if id(valeur) in partages or id(valeur) in vus:
+            continue
+        cls = type(valeur)
+        if cls in _CONTENEURS:
+            vus.add(id(valeur))
+            total += sys.getsizeof(valeur)
+            if cls is dict:
+                pile.extend(valeur.keys())
+                pile.extend(valeur.values())
+            else:
+                pile.extend(valeur)
+        elif cls is float or cls is pygame.Rect:
+            vus.add(id(valeur))
+            total += sys.getsizeof(valeur)
+        elif isinstance(valeur, pygame.Surface):
+            vus.add(id(valeur))
+            total += sys.getsizeof(valeur) + octets_surface(valeur)
+        # Anything else (ints, strings, other game objects) is referenced, not owned
+    return total
+
+
+def octets_entite(obj, partages=frozenset()):
+    """Bytes an entity owns: the instance, its __dict__ if any, and its values."""
+    total = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        total += sys.getsizeof(obj.__dict__)
+    vus = set()
+    return total + sum(_octets(valeur, partages, vus) for valeur in _attributs(obj))
+
+
+def _est_colonnes(valeur):
+    from entities.projectiles import ProjectileBatch
+    from systems.ecs import Archetype
+    return isinstance(valeur, (Archetype, ProjectileBatch))
+
+
+def _colonnes(store):
+    if hasattr(store, 'colonnes'):
+        return store.nom, store.colonnes()
+    return 'boss_projectiles', [store.x, store.y, store.dx, store.dy, store.image_index]
+
+
+def entites(game):
+    """(entity type -> instances, column stores) reachable from the simulation state."""
+    par_type = {}
+    stores = []
+    vus = set()
+    pile = [getattr(game, nom, None) for nom in SIMULATION_FIELDS]
+    while pile:
+        valeur = pile.pop()
+        if id(valeur) in vus or isinstance(valeur, pygame.Surface):
+            continue
+        if isinstance(valeur, _CONTENEURS):
+            vus.add(id(valeur))
+            pile.extend(valeur.values() if isinstance(valeur, dict) else valeur)
+        elif _est_colonnes(valeur):
+            vus.add(id(valeur))
+            stores.append(valeur)
+        elif _du_jeu(valeur):
+            vus.add(id(valeur))
+            if _du_jeu(valeur, _PAQUETS_ENTITES):
+                par_type.setdefault(type(valeur).__name__, []).append(valeur)
+            pile.extend(_attributs(valeur))
+    return par_type, stores
+
+
+def mesurer_entites(game, partages=None):
+    """{type: (instances, bytes)} for entities and {store: (rows, bytes)} for column stores."""
+    if partages is None:
+        _, partages = octets_assets(game)
+    par_type, stores = entites(game)
+    objets = {
+        nom: (len(instances), sum(octets_entite(obj, partages) for obj in instances))
+        for nom, instances in par_type.items()
+    }
+    colonnes = {}
+    for store in stores:
+        nom, listes = _colonnes(store)
+        vus = set()
+        lignes = len(listes[0]) if listes else 0
+        colonnes[nom] = (lignes, sum(_octets(liste, partages, vus) for liste in listes))
+    return objets, colonnes
+
+
+def compter_entites(game):
+    """Live entity count per collection; cheap enough to call every tick."""
+    compte = {
+        'envahisseurs': len(game.envahisseurs),
+        'projectiles': len(game.projectiles),
+        'projectiles_aliens': len(game.projectiles_aliens),
+        'boss_projectiles': len(game.boss_projectiles),
+        'mystery_aliens': len(game.mystery_aliens),
+        'explosions': len(game.explosions),
+        'powerups': len(game.powerups),
+        'effets_bonus': len(game.joueur.effect_manager.effects) if game.joueur else 0,
+    }
+    effets = game.boss.effect_manager if game.boss else None
+    compte['effets_boss'] = (len(effets.warning_indicators) + len(effets.danger_zones)
+                             + len(effets.transition_effects)) if effets else 0
+    compte['particules_boss'] = (len(effets.particles)
+                                 + sum(len(t.particles) for t in effets.transition_effects)) if effets else 0
+    return compte
+
+
+class MemoryAccounting:
+    """Peak counts per level every tick, entity sizes every `intervalle` ticks."""
+
+    def __init__(self, intervalle=600):
+        self.intervalle = intervalle
+        self.ticks = 0
+        self.pics = {}      # level -> {collection: peak count}
+        self.objets = {}    # entity type -> [instances measured, bytes]
+        self.colonnes = {}  # store -> [rows measured, bytes]
+        self.partages = None
+
+    def observer(self, game):
+        pics = self.pics.setdefault(game.niveau, {})
+        for nom, nombre in compter_entites(game).items():
+            if nombre > pics.get(nom, 0):
+                pics[nom] = nombre
+        if self.ticks % self.intervalle == 0:
+            self.echantillonner(game)
+        self.ticks += 1
+
+    def echantillonner(self, game):
+        # Assets only change when a boss is loaded; re-walked with each sample
+        _, self.partages = octets_assets(game)
+        objets, colonnes = mesurer_entites(game, self.partages)
+        for cumul, mesures in ((self.objets, objets), (self.colonnes, colonnes)):
+            for nom, (nombre, octets) in mesures.items():
+                total = cumul.setdefault(nom, [0, 0])
+                total[0] += nombre
+                total[1] += octets
+
+    def rapport(self, game):
+        """The whole report as plain data."""
+        surfaces, _ = octets_assets(game)
+        def moyennes(cumul):
+            return {nom: (n, octets / n) for nom, (n, octets) in cumul.items() if n}
+        return {
+            'octets_par_entite': moyennes(self.objets),
+            'octets_par_ligne': moyennes(self.colonnes),
+            'surfaces': surfaces,
+            'pics_par_niveau': self.pics,
+        }
+
+
+def afficher_rapport(rapport):
+    print("Bytes per entity (mean over sampled instances)")
+    for nom, (n, octets) in sorted(rapport['octets_par_entite'].items(), key=lambda e: -e[1][1]):
+        print(f"  {nom:28s} {octets:9.0f}  ({n} sampled)")
+    print("Bytes per row of column stores")
+    for nom, (n, octets) in sorted(rapport['octets_par_ligne'].items()):
+        print(f"  {nom:28s} {octets:9.0f}  ({n} sampled)")
+    print("Surface bytes per asset category")
+    total = 0
+    for categorie, octets in sorted(rapport['surfaces'].items(), key=lambda e: -e[1]):
+        total += octets
+        print(f"  {categorie:28s} {octets / 1024:9.0f} KiB")
+    print(f"  {'total':28s} {total / 1024:9.0f} KiB")
+    print("Peak entity counts per level")
+    for niveau, pics in sorted(rapport['pics_par_niveau'].items()):
+        print(f"  level {niveau}: " + ", ".join(f"{nom} {n}" for nom, n in pics.items() if n))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless game with a memory accounting report")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--bot', default='esquive', help="immobile, aleatoire or esquive")
+    parser.add_argument('--minutes', type=float, default=5, help="Game time to play")
+    parser.add_argument('--intervalle', type=int, default=600, help="Ticks between entity size samples")
+    args = parser.parse_args()
+
+    from systems.bots import creer_bot
+    from systems.simulation import HeadlessSimulation, TICK_MS
+
+    simulation = HeadlessSimulation()
+    comptable = MemoryAccounting(args.intervalle)
+    bot = creer_bot(args.bot, args.seed)
+    game = simulation.reset(seed=args.seed)
+    max_ticks = int(args.minutes * 60000 / TICK_MS)
+
+    # Game code prints a lot; keep only the report
+    stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+    start = time.perf_counter()
+    try:
+        ticks = 0
+        while ticks < max_ticks and not game.game_over:
+            simulation.step(bot(game))
+            comptable.observer(game)
+            ticks += 1
+        comptable.echantillonner(game)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    print(f"{ticks} ticks ({ticks * TICK_MS / 1000:.0f}s of play, level {game.niveau}) "
+          f"in {time.perf_counter() - start:.1f}s")
+    afficher_rapport(comptable.rapport(game))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Quality presets.
+
+Effect-heavy subsystems read their density from the process-wide
+QualitySettings (qualite()) instead of hardcoding it: particle counts and
+projectile trail lengths are scaled by the preset, and the parallax
+background draws only its first layers.
+
+With QUALITE_GRAPHIQUE = 'auto', the game loop reports each frame's work
+time to mesurer() and a governor moves between the presets: one step down
+when the average frame time stays over QUALITE_BUDGET_MS, one step back up
+after a few seconds well under it.
+
+Only cosmetic state depends on the preset. Particles are spawned from their
+own generators and trails keep their full history, so seeded runs and
+replays play out the same at every quality.
+"""
+
+import time
+
+from config import QUALITE_GRAPHIQUE, QUALITE_EFFETS, QUALITE_BUDGET_MS
+
+NIVEAUX = ('basse', 'moyenne', 'haute')  # Governor steps, cheapest first
+
+
+class QualitySettings:
+    """Effect density of the current preset, adjusted live in 'auto' mode."""
+
+    def __init__(self, preset=QUALITE_GRAPHIQUE, budget_ms=QUALITE_BUDGET_MS):
+        if preset != 'auto' and preset not in QUALITE_EFFETS:
+            print(f"Unknown quality '{preset}', using 'haute'")
+            preset = 'haute'
+        self.auto = preset == 'auto'
+        self.budget_ms = budget_ms
+        self.moyenne_ms = 0.0            # Moving average of the frame work time
+        self.dernier_changement = time.monotonic()
+        self.appliquer('haute' if self.auto else preset)
+
+    def appliquer(self, nom):
+        """Switch to a preset of QUALITE_EFFETS."""
+        effets = QUALITE_EFFETS[nom]
+        self.nom = nom
+        self.particules = effets['particules']
+        self.trainee = effets['trainee']
+        self.couches_fond = effets['couches_fond']
+
+    def nombre_particules(self, nombre):
+        """Particle count to spawn for an effect designed with `nombre`."""
+        if nombre <= 0:
+            return 0
+        return max(1, round(nombre * self.particules))
+
+    def longueur_trainee(self, longueur):
+        """Trail positions to draw out of `longueur`."""
+        return max(1, round(longueur * self.trainee))
+
+    def mesurer(self, duree_ms):
+        """Report one frame's work time; in 'auto' mode, adjust the preset."""
+        if not self.auto:
+            return
+        self.moyenne_ms += (duree_ms - self.moyenne_ms) * 0.05
+        maintenant = time.monotonic()
+        # Let the average settle after each change before judging again
+        if maintenant - self.dernier_changement < 1.0:
+            return
+        niveau = NIVEAUX.index(self.nom)
+        if self.moyenne_ms > self.budget_ms and niveau > 0:
+            nouveau = NIVEAUX[niveau - 1]
+        elif (self.moyenne_ms < self.budget_ms * 0.6 and niveau < len(NIVEAUX) - 1
+              and maintenant - self.dernier_changement >= 5.0):
+            nouveau = NIVEAUX[niveau + 1]
+        else:
+            return
+        print(f"Quality: {self.nom} -> {nouveau} ({self.moyenne_ms:.1f} ms per frame)")
+        self.appliquer(nouveau)
+        self.dernier_changement = maintenant
+
+
+_qualite = QualitySettings()
+
+
+def qualite():
+    """The process-wide quality settings."""
+    return _qualite
@@ -0,0 +1,224 @@
+"""
+Replay recording and fast-forward playback.
+
+A replay is the RNG seed, the tick clock at game start, the selected ship and,
+for every simulated tick, the action bitmask plus the milliseconds elapsed
+since the previous tick. Ticks are stored as one action byte and a varint
+delta, then zlib-compressed, which keeps a long session to a few kilobytes.
+
+Playback drives a headless Game through the same update() path as live play,
+as fast as the simulation allows, and keeps in-memory checkpoints every few
+seconds of game time so seek() only replays from the nearest one.
+
+Usage:
+    python -m systems.replay data/replays/<file>.nsr [--profile] [--spikes 10]
+"""
+
+import argparse
+import os
+import struct
+import time
+import zlib
+from array import array
+
+from systems.snapshot import capture_state, restore_state
+from utils import timing
+
+REPLAY_MAGIC = b'NSRP'
+REPLAY_VERSION = 5  # 2, 3: cosmetic particles and power-up effects no longer draw from the gameplay RNG; 4: pixel-accurate hits; 5: classic grid back to two steps per tick
+REPLAY_EXTENSION = '.nsr'
+
+# magic, version, seed, start time (ms), tick count, ship index
+_HEADER = struct.Struct('<4sBQIIB')
+
+
+def _write_varint(buffer, value):
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    """Compact per-tick input log of one game."""
+
+    def __init__(self, seed, start_time, ship_index=0, actions=None, deltas=None):
+        self.seed = seed
+        self.start_time = start_time
+        self.ship_index = ship_index
+        self.actions = actions if actions is not None else bytearray()
+        self.deltas = deltas if deltas is not None else array('I')
+
+    def __len__(self):
+        return len(self.actions)
+
+    @property
+    def duration_ms(self):
+        return sum(self.deltas)
+
+    def encode(self):
+        body = bytearray()
+        for action, delta in zip(self.actions, self.deltas):
+            body.append(action)
+            _write_varint(body, delta)
+        header = _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed,
+                              self.start_time, len(self.actions), self.ship_index)
+        return header + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def decode(cls, data):
+        magic, version, seed, start_time, count, ship_index = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {version}")
+
+        body = zlib.decompress(data[_HEADER.size:])
+        actions = bytearray(count)
+        deltas = array('I', [0]) * count
+        pos = 0
+        for i in range(count):
+            actions[i] = body[pos]
+            deltas[i], pos = _read_varint(body, pos + 1)
+        return cls(seed, start_time, ship_index, actions, deltas)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as handle:
+            handle.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as handle:
+            return cls.decode(handle.read())
+
+
+class ReplayRecorder:
+    """Collects the tick inputs of a live game."""
+
+    def __init__(self, seed, start_time, ship_index=0):
+        self.replay = Replay(seed, start_time, ship_index)
+        self.last_time = start_time
+
+    def record(self, actions, tick_time):
+        self.replay.actions.append(actions & 0xFF)
+        self.replay.deltas.append(max(0, tick_time - self.last_time))
+        self.last_time = tick_time
+
+    def finish(self):
+        return self.replay
+
+
+class ReplayPlayer:
+    """Replays a Replay through a headless simulation with checkpointed seeking."""
+
+    def __init__(self, replay, simulation=None, checkpoint_interval=5.0):
+        if simulation is None:
+            from systems.simulation import HeadlessSimulation
+            simulation = HeadlessSimulation()
+        self.replay = replay
+        self.simulation = simulation
+        self.game = simulation.game
+        self.checkpoint_interval_ms = int(checkpoint_interval * 1000)
+        self.checkpoints = {}  # tick -> captured state
+        self.reset()
+
+    def reset(self):
+        self.simulation.reset(self.replay.seed, self.replay.ship_index, self.replay.start_time)
+        self.tick = 0
+        self.time = self.replay.start_time
+        self.next_checkpoint = self.time
+        self._checkpoint()
+
+    def _checkpoint(self):
+        if self.time >= self.next_checkpoint and self.tick not in self.checkpoints:
+            self.checkpoints[self.tick] = (self.time, capture_state(self.game))
+            self.next_checkpoint = self.time + self.checkpoint_interval_ms
+
+    @property
+    def finished(self):
+        return self.tick >= len(self.replay)
+
+    def step(self):
+        """Simulate one recorded tick; returns False once the replay is over."""
+        if self.finished:
+            return False
+        self.time += self.replay.deltas[self.tick]
+        self.simulation.step(self.replay.actions[self.tick], self.time)
+        self.tick += 1
+        if self.checkpoint_interval_ms > 0:
+            self._checkpoint()
+        return True
+
+    def run(self, max_ticks=None, on_tick=None):
+        """Play until the end (or `max_ticks`); `on_tick(player, seconds)` gets each tick's cost."""
+        played = 0
+        while not self.finished and (max_ticks is None or played < max_ticks):
+            start = time.perf_counter()
+            self.step()
+            if on_tick:
+                on_tick(self, time.perf_counter() - start)
+            played += 1
+        return played
+
+    def seek(self, tick):
+        """Jump to `tick` from the nearest checkpoint at or before it."""
+        tick = max(0, min(tick, len(self.replay)))
+        start = max((t for t in self.checkpoints if t <= tick), default=None)
+        if start is not None and (tick < self.tick or start > self.tick):
+            self.time, state = self.checkpoints[start]
+            restore_state(self.game, state)
+            self.tick = start
+            self.next_checkpoint = self.time + self.checkpoint_interval_ms
+        while self.tick < tick:
+            self.step()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a replay headless and report tick costs")
+    parser.add_argument('path')
+    parser.add_argument('--profile', action='store_true', help="Run under cProfile")
+    parser.add_argument('--spikes', type=int, default=10, help="Number of slowest ticks to list")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+    player = ReplayPlayer(replay)
+    costs = []
+
+    def mesurer(p, seconds):
+        costs.append((seconds, p.tick))
+
+    start = time.perf_counter()
+    if args.profile:
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.runcall(player.run, None, mesurer)
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(30)
+    else:
+        player.run(on_tick=mesurer)
+    elapsed = time.perf_counter() - start
+    timing.release()
+
+    game_seconds = replay.duration_ms / 1000
+    print(f"{len(replay)} ticks ({game_seconds:.1f}s of play) in {elapsed:.2f}s "
+          f"= {game_seconds / elapsed if elapsed else 0:.1f}x real time")
+    print(f"Final score {player.game.score}, level {player.game.niveau}")
+    for seconds, tick in sorted(costs, reverse=True)[:args.spikes]:
+        print(f"  tick {tick:6d}: {seconds * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
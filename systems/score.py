@@ -1,9 +1,12 @@
 import pygame
 import json
 import os
-import shutil
 import time
 import logging
+from assets import charger_police
+from config import COMBOS_POINTS
+from utils import timing
+from utils.persistence import persistance
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -32,14 +35,6 @@ def validate_score(score):
         return False
     return True
 
-def backup_score_file():
-    """Create a backup of the score file"""
-    if os.path.exists(SCORE_FILE):
-        try:
-            shutil.copy2(SCORE_FILE, BACKUP_FILE)
-        except OSError as e:
-            logger.error(f"Failed to create backup: {e}")
-
 def restore_from_backup():
     """Attempt to restore score from backup file"""
     if os.path.exists(BACKUP_FILE):
@@ -73,29 +68,28 @@ def charger_meilleur_score():
         logger.error(f"Error loading high score: {e}")
         return 0
 
+def _score_ecrit(path, erreur):
+    if erreur is not None:
+        logger.error(f"Failed to save high score: {erreur}")
+
 def sauvegarder_meilleur_score(score):
-    """Save the high score with validation and backup"""
+    """Save the high score with validation and backup.
+
+    The write happens on the persistence thread (temp file, fsync, rename),
+    so this never blocks the frame in which the game ends.
+    """
     if not validate_score(score):
         logger.error(f"Attempted to save invalid score: {score}")
         return False
         
-    ensure_data_directory()
-    backup_score_file()
-    
-    try:
-        data = {
-            'highscore': score,
-            'timestamp': time.time(),
-            'version': '1.0'
-        }
-        
-        with open(SCORE_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
-        return True
-    
-    except OSError as e:
-        logger.error(f"Failed to save high score: {e}")
-        return False
+    data = {
+        'highscore': score,
+        'timestamp': time.time(),
+        'version': '1.0'
+    }
+    persistance().ecrire(SCORE_FILE, json.dumps(data, indent=2).encode('utf-8'),
+                         sauvegarde=BACKUP_FILE, rappel=_score_ecrit)
+    return True
 
 class ComboSystem:
     def __init__(self):
@@ -106,11 +100,12 @@ class ComboSystem:
             pygame.font.init()
             
         self.multiplicateur = 1.0
-        self.font = pygame.font.Font(None, 36)
-        self.derniere_augmentation = pygame.time.get_ticks()
+        self.font = charger_police(36)
+        self.derniere_augmentation = timing.get_ticks()
         self.flash_alpha = 0
-        self.dernier_kill = pygame.time.get_ticks()
+        self.dernier_kill = timing.get_ticks()
         self.combo_count = 0
+        self.meilleur_combo = 0  # Longest combo of the game, for the leaderboard
         self.combo_timeout = 2000
         self.flash_combo = False
         self.temps_flash = 0
@@ -121,7 +116,7 @@ class ComboSystem:
 
     def add_hit(self):
         """Add a hit to the combo system and update the multiplier"""
-        current_time = pygame.time.get_ticks()
+        current_time = timing.get_ticks()
         
         # Reset combo if too much time has passed since last hit
         if current_time - self.dernier_kill > self.combo_timeout:
@@ -132,40 +127,40 @@ class ComboSystem:
         self.combo_count += 1
         if self.combo_count > 1:  # Start increasing multiplier after first hit
             self.multiplicateur = min(2.0, 1.0 + (self.combo_count - 1) * 0.1)  # Cap at 2.0x
+        self.meilleur_combo = max(self.meilleur_combo, self.combo_count)
         
         # Update timing
         self.dernier_kill = current_time
         self.flash_alpha = 255  # Flash effect for visual feedback
 
     def augmenter_combo(self):
-        current_time = pygame.time.get_ticks()
+        current_time = timing.get_ticks()
         if current_time - self.dernier_kill < self.combo_timeout:
             self.combo_count += 1
             self.ancien_multiplicateur = self.multiplicateur
             
-            if self.combo_count >= 7:
-                self.multiplicateur = 3.0
-            elif self.combo_count >= 5:
-                self.multiplicateur = 2.0
-            elif self.combo_count >= 3:
-                self.multiplicateur = 1.5
+            for seuil, multiplicateur in sorted(COMBOS_POINTS.items(), reverse=True):
+                if self.combo_count >= seuil:
+                    self.multiplicateur = multiplicateur
+                    break
             
             if self.multiplicateur > self.ancien_multiplicateur:
                 self.activer_flash()
         else:
             self.combo_count = 1
             self.multiplicateur = 1.0
+        self.meilleur_combo = max(self.meilleur_combo, self.combo_count)
         
         self.dernier_kill = current_time
 
     def activer_flash(self):
         self.flash_combo = True
-        self.temps_flash = pygame.time.get_ticks()
+        self.temps_flash = timing.get_ticks()
         self.flash_alpha = 255
         self.position_y_offset = -20
 
     def update(self):
-        current_time = pygame.time.get_ticks()
+        current_time = timing.get_ticks()
         
         # Update combo timeout
         if current_time - self.dernier_kill > self.combo_timeout:
@@ -219,10 +214,11 @@ class ComboSystem:
     def reset(self):
         """Reset the combo system to its initial state"""
         self.multiplicateur = 1.0
-        self.derniere_augmentation = pygame.time.get_ticks()
+        self.derniere_augmentation = timing.get_ticks()
         self.flash_alpha = 0
-        self.dernier_kill = pygame.time.get_ticks()
+        self.dernier_kill = timing.get_ticks()
         self.combo_count = 0
+        self.meilleur_combo = 0
         self.flash_combo = False
         self.temps_flash = 0
         self.position_y_offset = 0
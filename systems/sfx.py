@@ -0,0 +1,184 @@
+"""
+Procedural sound effects.
+
+Effects are described by a small parameter set (duration, tone layers swept
+from one frequency to another, a noise burst, an attack/decay envelope) and
+synthesized with NumPy in one pass over the whole buffer. The samples go
+straight to pygame.mixer.Sound(buffer=...) in the mixer's own format; no WAV
+file is written or decoded.
+
+SfxCache keeps each synthesized Sound under its parameters, so asking for the
+same effect again is a dict lookup, and variations() derives pitch-shifted
+variants of a recipe (each cached under its own parameters) at load time.
+variations_son() derives the same variants from a loaded Sound by resampling
+its samples. create_sounds.py writes the same recipes to assets/sounds.
+"""
+
+import numpy as np
+import pygame
+
+FREQUENCE_ECHANTILLONNAGE = 44100
+
+# Recipes of the effects designed in create_sounds.py. Layers are
+# (start Hz, end Hz, weight); the frequency sweeps linearly over the sound.
+RECETTES = {
+    'boss_warning': {
+        'duree': 0.5, 'couches': ((440, 440, 1.0),), 'volume': 0.5,
+    },
+    'boss_teleport': {
+        'duree': 1.0, 'couches': ((200, 2000, 1.0),), 'volume': 0.5, 'relache': 0.2,
+    },
+    'boss_phase_change': {
+        'duree': 1.5, 'couches': ((200, 200, 0.5), (400, 400, 0.3), (600, 600, 0.2)),
+        'attaque': 0.25, 'relache': 1.25,
+    },
+    'boss_damage': {
+        'duree': 0.2, 'couches': ((100, 100, 0.5),), 'bruit': 0.5, 'decroissance': 20,
+    },
+}
+
+# Missing keys of a recipe
+_DEFAUTS = {
+    'duree': 0.5,
+    'couches': (),
+    'bruit': 0.0,          # Amplitude of the white-noise layer
+    'graine': 0,           # Noise seed: the same recipe always sounds the same
+    'attaque': 0.0,        # Linear fade-in, in seconds
+    'relache': 0.0,        # Linear fade-out at the end, in seconds
+    'decroissance': 0.0,   # Exponential decay rate (1/s), 0 for none
+    'volume': 1.0,
+    'hauteur': 1.0,        # Pitch factor applied to every layer
+}
+
+
+def parametres(recette):
+    """A recipe with every parameter filled in, as a hashable cache key."""
+    complet = dict(_DEFAUTS)
+    complet.update(recette)
+    complet['couches'] = tuple(tuple(couche) for couche in complet['couches'])
+    return tuple(sorted(complet.items()))
+
+
+def synthetiser(recette, frequence=FREQUENCE_ECHANTILLONNAGE):
+    """Mono float32 samples in [-1, 1] for a recipe."""
+    p = dict(parametres(recette))
+    n = int(p['duree'] * frequence)
+    t = np.arange(n, dtype=np.float64) / frequence
+
+    signal = np.zeros(n)
+    for debut, fin, poids in p['couches']:
+        debut *= p['hauteur']
+        fin *= p['hauteur']
+        # Phase of a linear sweep: the integral of the instantaneous frequency
+        phase = 2.0 * np.pi * (debut * t + (fin - debut) * t * t / (2.0 * p['duree']))
+        signal += poids * np.sin(phase)
+    if p['bruit']:
+        signal += p['bruit'] * np.random.default_rng(p['graine']).uniform(-1.0, 1.0, n)
+
+    enveloppe = np.ones(n)
+    if p['attaque']:
+        enveloppe = np.minimum(enveloppe, t / p['attaque'])
+    if p['relache']:
+        enveloppe = np.minimum(enveloppe, (p['duree'] - t) / p['relache'])
+    if p['decroissance']:
+        enveloppe *= np.exp(-p['decroissance'] * t)
+    signal *= np.clip(enveloppe, 0.0, 1.0) * p['volume']
+    return np.clip(signal, -1.0, 1.0).astype(np.float32)
+
+
+def en_pcm16(echantillons):
+    """Float samples as signed 16-bit PCM (the WAV layout of create_sounds.py)."""
+    return (echantillons * 32767.0).astype('<i2')
+
+
+def _format_mixer(echantillons, taille, canaux):
+    """Samples in the mixer's sample format, interleaved over its channels."""
+    if taille == 32:
+        donnees = echantillons.astype(np.float32)
+    elif taille == -32:
+        donnees = (echantillons * 2147483647.0).astype(np.int32)
+    elif taille == -16:
+        donnees = (echantillons * 32767.0).astype(np.int16)
+    elif taille == 16:
+        donnees = (echantillons * 32767.0 + 32768.0).astype(np.uint16)
+    elif taille == -8:
+        donnees = (echantillons * 127.0).astype(np.int8)
+    else:
+        donnees = (echantillons * 127.0 + 128.0).astype(np.uint8)
+    if canaux > 1:
+        donnees = np.repeat(donnees, canaux)
+    return donnees
+
+
+class SfxCache:
+    """Synthesized Sounds, keyed by their recipe's parameters."""
+
+    def __init__(self):
+        self.sons = {}  # parametres(recette) -> Sound
+
+    def son(self, recette):
+        """pygame Sound for a recipe (a name of RECETTES or a parameter dict)."""
+        if isinstance(recette, str):
+            recette = RECETTES[recette]
+        cle = parametres(recette)
+        son = self.sons.get(cle)
+        if son is None:
+            format_mixer = pygame.mixer.get_init()
+            if format_mixer is None:
+                raise pygame.error("pygame.mixer must be initialized before synthesizing sounds")
+            frequence, taille, canaux = format_mixer
+            echantillons = synthetiser(recette, frequence)
+            son = pygame.mixer.Sound(buffer=_format_mixer(echantillons, taille, canaux).tobytes())
+            self.sons[cle] = son
+        return son
+
+    def variations(self, recette, nombre, ecart=0.06):
+        """`nombre` Sounds of a recipe, pitched evenly over +/- `ecart`."""
+        if isinstance(recette, str):
+            recette = RECETTES[recette]
+        if nombre <= 1:
+            return [self.son(recette)]
+        hauteur = dict(parametres(recette))['hauteur']
+        return [self.son(dict(recette, hauteur=hauteur * facteur)) for facteur in hauteurs(nombre, ecart)]
+
+
+def hauteurs(nombre, ecart):
+    """`nombre` pitch factors spread evenly over 1 +/- `ecart`."""
+    if nombre <= 1:
+        return [1.0]
+    return [1.0 - ecart + 2.0 * ecart * i / (nombre - 1) for i in range(nombre)]
+
+
+def variations_son(son, nombre, ecart=0.06):
+    """`nombre` resampled copies of a loaded Sound, pitched evenly over +/- `ecart`.
+
+    A pitch factor f plays the samples f times faster (linear interpolation),
+    so the variant is also 1/f as long, like a tape played faster.
+    """
+    if nombre <= 1:
+        return [son]
+    echantillons = pygame.sndarray.array(son)
+    n = echantillons.shape[0]
+    temps = np.arange(n)
+    variantes = []
+    for facteur in hauteurs(nombre, ecart):
+        if facteur == 1.0:
+            variantes.append(son)
+            continue
+        positions = np.arange(0.0, n - 1, facteur)
+        if echantillons.ndim == 1:
+            donnees = np.interp(positions, temps, echantillons)
+        else:
+            donnees = np.stack([np.interp(positions, temps, canal) for canal in echantillons.T], axis=1)
+        if echantillons.dtype.kind in 'iu':
+            donnees = np.rint(donnees)
+        variantes.append(pygame.sndarray.make_sound(np.ascontiguousarray(donnees.astype(echantillons.dtype))))
+    return variantes
+
+
+_sfx = SfxCache()
+
+
+def sfx():
+    """The process-wide synthesized sound cache."""
+    return _sfx
@@ -0,0 +1,51 @@
+"""
+Headless simulation harness.
+
+Runs the real Game update loop without a window or audio device (SDL dummy
+drivers) on a virtual tick clock, so sessions can be replayed or simulated
+many times faster than real time.
+"""
+
+import os
+
+from utils import timing
+
+TICK_MS = 1000 / 60
+
+
+def configurer_headless():
+    """Select SDL's dummy video/audio drivers; must run before pygame.init()."""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+
+class HeadlessSimulation:
+    """A Game driven tick by tick with explicit actions and timestamps."""
+
+    def __init__(self, game=None):
+        if game is None:
+            configurer_headless()
+            from main import Game
+            game = Game(headless=True)
+        self.game = game
+        self.time = 0
+
+    def reset(self, seed=None, ship_index=0, start_time=0):
+        """Start a new game at virtual time `start_time` with a fixed seed."""
+        from ui.menus import menu_state
+        menu_state.selected_ship_index = ship_index
+        self.time = start_time
+        timing.begin_tick(start_time)
+        self.game.demarrer_nouveau_jeu(seed=seed)
+        return self.game
+
+    def step(self, actions=0, now=None):
+        """Advance one tick with the given action bitmask."""
+        self.time = self.time + TICK_MS if now is None else now
+        frame = timing.begin_tick(self.time, paused=self.game.pause)
+        self.game.update(actions, frame)
+        return self.game
+
+    @property
+    def termine(self):
+        return self.game.game_over
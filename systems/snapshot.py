@@ -0,0 +1,303 @@
+"""
+Game-state capture and binary snapshots.
+
+capture_state() clones every simulation field of a Game (entities, timers,
+systems) together with the gameplay RNG and the tick clock, so the game can be
+rewound later with restore_state(). Surfaces, fonts, sounds and other loaded
+assets are shared rather than copied: they never change during play.
+
+serialize_state() writes the same state as a compact binary blob (pickle +
+zlib) for quick-saves and for handing a game to another process. Assets are
+written as stable asset IDs (e.g. ('images', 'aliens', 3)) through pickle's
+persistent IDs and resolved against the receiving game's AssetRegistry, so no
+pixels are ever serialized. Entities that hold derived surfaces (rotated or
+flashed frames) rebuild them in __setstate__.
+"""
+
+import io
+import pickle
+import random
+import struct
+import types
+import zlib
+
+import pygame
+
+from assets import polices_chargees
+from utils import timing
+
+# Game attributes that make up the simulation state
+SIMULATION_FIELDS = (
+    'joueur',
+    'projectiles',
+    'projectiles_aliens',
+    'boss_projectiles',
+    'envahisseurs',
+    'classic_grid',
+    'monde',
+    'explosions',
+    'powerups',
+    'boss',
+    'mystery_aliens',
+    'last_mystery_spawn',
+    'mystery_spawn_delay',
+    'mystery_wave_size',
+    'score',
+    'vies',
+    'niveau',
+    'niveau_termine',
+    'transition_niveau',
+    'dernier_temps_niveau',
+    'combo_system',
+    'level_transition',
+    'scheduled_sounds',
+    'dernier_powerup',
+    'game_over',
+    'pause',
+    'seed',
+    'debut_partie',
+    'partie_enregistree',
+)
+
+# Values returned as-is by the cloner
+_ATOMIC_TYPES = (
+    type(None), bool, int, float, complex, str, bytes, range, type,
+    types.FunctionType, types.BuiltinFunctionType, types.MethodType, types.ModuleType,
+    pygame.Surface, pygame.font.Font, pygame.mixer.Sound, pygame.mixer.Channel,
+)
+
+
+# Game attributes holding loaded assets, shared by every capture
+ASSET_FIELDS = ('images', 'alien_images', 'sound_manager', 'controls', 'background', 'hud')
+
+SNAPSHOT_MAGIC = b'NSSN'
+SNAPSHOT_VERSION = 4
+
+# magic, version, zlib level (0 = stored)
+_HEADER = struct.Struct('<4sBB')
+
+# Objects that may only appear in a snapshot as asset IDs
+_ASSET_TYPES = (pygame.Surface, pygame.font.Font, pygame.mixer.Sound)
+
+
+def _share(memo, obj):
+    """Register an asset container (and everything under it) as shared."""
+    if id(obj) in memo:
+        return
+    memo[id(obj)] = obj
+    if isinstance(obj, dict):
+        for value in obj.values():
+            _share(memo, value)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _share(memo, value)
+
+
+def _shared_memo(game):
+    memo = {id(game): game}
+    for name in ASSET_FIELDS:
+        value = getattr(game, name, None)
+        if value is not None:
+            _share(memo, value)
+    return memo
+
+
+def _slot_names(cls):
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ('__dict__', '__weakref__'):
+                yield name
+
+
+def slot_state(obj):
+    """Pickle state of a slotted object: its assigned slots, by name.
+
+    A __getstate__ without a matching __setstate__ returns it as (None, state),
+    the form pickle restores into slots.
+    """
+    return {name: getattr(obj, name) for name in _slot_names(type(obj)) if hasattr(obj, name)}
+
+
+def restore_slots(obj, state):
+    """Counterpart of slot_state() for classes with their own __setstate__."""
+    for name, value in state.items():
+        setattr(obj, name, value)
+
+
+def clone(obj, memo):
+    """Deep-copy gameplay objects, sharing assets and anything already in `memo`."""
+    oid = id(obj)
+    if oid in memo:
+        return memo[oid]
+    if isinstance(obj, _ATOMIC_TYPES):
+        return obj
+
+    cls = type(obj)
+    if cls is list:
+        copy = []
+        memo[oid] = copy
+        copy.extend(clone(value, memo) for value in obj)
+        return copy
+    if cls is dict:
+        copy = {}
+        memo[oid] = copy
+        for key, value in obj.items():
+            copy[clone(key, memo)] = clone(value, memo)
+        return copy
+    if cls is tuple:
+        copy = tuple(clone(value, memo) for value in obj)
+        memo[oid] = copy
+        return copy
+    if cls is set:
+        copy = set()
+        memo[oid] = copy
+        copy.update(clone(value, memo) for value in obj)
+        return copy
+    if cls is pygame.Rect:
+        copy = obj.copy()
+        memo[oid] = copy
+        return copy
+
+    copy = cls.__new__(cls)
+    memo[oid] = copy
+    if hasattr(obj, '__dict__'):
+        for name, value in vars(obj).items():
+            copy.__dict__[name] = clone(value, memo)
+    for name in _slot_names(cls):
+        if hasattr(obj, name):
+            setattr(copy, name, clone(getattr(obj, name), memo))
+    return copy
+
+
+def capture_state(game):
+    """Return an opaque, reusable capture of the game's simulation state."""
+    memo = _shared_memo(game)
+    fields = {name: clone(getattr(game, name, None), memo) for name in SIMULATION_FIELDS}
+    return {
+        'fields': fields,
+        'rng': random.getstate(),
+        'tick_time': timing.get_ticks(),
+    }
+
+
+def restore_state(game, state):
+    """Rewind `game` to a capture; the capture stays valid for later restores."""
+    memo = _shared_memo(game)
+    for name, value in state['fields'].items():
+        setattr(game, name, clone(value, memo))
+    random.setstate(state['rng'])
+    timing.rebase(state['tick_time'])
+
+
+class AssetRegistry:
+    """Two-way map between a game's loaded assets and stable asset IDs."""
+
+    def __init__(self, game):
+        self.game = game
+        self.rebuild()
+
+    def rebuild(self):
+        self.ids = {}     # id(obj) -> asset id
+        self.objets = {}  # asset id -> obj (also keeps every id() valid)
+        self._ajouter(('game',), self.game)
+        for name in ASSET_FIELDS:
+            value = getattr(self.game, name, None)
+            if value is not None:
+                self._ajouter((name,), value)
+        for (nom, taille), font in polices_chargees():
+            self._ajouter(('font', nom, taille), font)
+
+    def _ajouter(self, key, obj):
+        if id(obj) in self.ids:
+            return
+        self.ids[id(obj)] = key
+        self.objets[key] = obj
+        if isinstance(obj, dict):
+            for name, value in obj.items():
+                if not isinstance(value, _ATOMIC_TYPES) or isinstance(value, _ASSET_TYPES):
+                    self._ajouter(key + (name,), value)
+        elif isinstance(obj, (list, tuple)):
+            for index, value in enumerate(obj):
+                if not isinstance(value, _ATOMIC_TYPES) or isinstance(value, _ASSET_TYPES):
+                    self._ajouter(key + (index,), value)
+
+    def asset_id(self, obj):
+        key = self.ids.get(id(obj))
+        if key is None and isinstance(obj, _ASSET_TYPES):
+            # Assets can be added after the registry was built (new ship, fonts)
+            self.rebuild()
+            key = self.ids.get(id(obj))
+            if key is None:
+                raise pickle.PicklingError(
+                    f"{type(obj).__name__} is not a registered asset; "
+                    f"give its owner a __getstate__ that drops or rebuilds it")
+        return key
+
+    def asset(self, key):
+        if key not in self.objets:
+            self.rebuild()
+            if key not in self.objets:
+                raise pickle.UnpicklingError(f"Unknown asset ID in snapshot: {key}")
+        return self.objets[key]
+
+
+def registre_assets(game):
+    """Return the game's AssetRegistry, built on first use."""
+    registry = getattr(game, '_registre_assets', None)
+    if registry is None:
+        registry = AssetRegistry(game)
+        game._registre_assets = registry
+    return registry
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, handle, registry):
+        super().__init__(handle, pickle.HIGHEST_PROTOCOL)
+        self.registry = registry
+
+    def persistent_id(self, obj):
+        return self.registry.asset_id(obj)
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, handle, registry):
+        super().__init__(handle)
+        self.registry = registry
+
+    def persistent_load(self, pid):
+        return self.registry.asset(pid)
+
+
+def serialize_state(game, compression=1):
+    """Return the game's simulation state as a compact binary blob."""
+    fields = {name: getattr(game, name, None) for name in SIMULATION_FIELDS}
+    handle = io.BytesIO()
+    _Pickler(handle, registre_assets(game)).dump({
+        'fields': fields,
+        'rng': random.getstate(),
+        'tick_time': timing.get_ticks(),
+    })
+    body = handle.getvalue()
+    if compression:
+        body = zlib.compress(body, compression)
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, compression) + body
+
+
+def deserialize_state(game, data):
+    """Restore a blob from serialize_state() into `game`."""
+    magic, version, compression = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a game snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    body = memoryview(data)[_HEADER.size:]
+    if compression:
+        body = zlib.decompress(body)
+    state = _Unpickler(io.BytesIO(body), registre_assets(game)).load()
+    for name, value in state['fields'].items():
+        setattr(game, name, value)
+    random.setstate(state['rng'])
+    timing.rebase(state['tick_time'])
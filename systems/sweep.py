@@ -0,0 +1,255 @@
+"""
+Balancing sweeps.
+
+Plays headless games with a bot over a grid of config overrides and seeds,
+spread over every core with a ProcessPoolExecutor. Each worker process keeps
+one headless Game and patches the overridden constants before each run.
+
+Results are streamed as they complete into a columnar JSON-lines file: every
+line is a row group, {"column": [values...], ...}, so partial sweeps are
+usable and files can be appended to. lire_resultats() merges the groups.
+
+Overrides name a constant in config.py, or a BossConstants attribute:
+    python -m systems.sweep --set FREQUENCE_TIR_ALIEN_BASE=0.0003|0.0006 \\
+        --set BossConstants.HP_BASE=50|80 --seeds 8 --bot esquive
+A JSON grid file ({"NAME": [values...]}) can be given with --grid instead.
+"""
+
+import argparse
+import ast
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config import DATA_DIR
+
+SWEEP_DIR = os.path.join(DATA_DIR, 'sweeps')
+MAX_TICKS_DEFAULT = 60 * 60 * 10  # Ten minutes of game time
+
+RESULT_COLUMNS = ('seed', 'bot', 'survie_s', 'niveau', 'score', 'vies',
+                  'game_over', 'ticks', 'ticks_par_s')
+
+_MISSING = object()
+_simulation = None  # One headless game per worker process
+
+
+def _convertir(original, value):
+    """Match JSON values to the original's shape (dict keys are ints in config)."""
+    if isinstance(original, dict) and isinstance(value, dict):
+        key_type = type(next(iter(original), ''))
+        return {key_type(k): v for k, v in value.items()}
+    return value
+
+
+def appliquer_overrides(overrides):
+    """Patch config constants everywhere they were imported; returns an undo list.
+
+    Modules use `from config import ...`, so each one holds its own binding of
+    the constant; every module binding the original object is patched.
+    """
+    import config
+    saved = []
+    for name, value in overrides.items():
+        if '.' in name:
+            owner_name, attr = name.split('.', 1)
+            owner = getattr(config, owner_name)
+            original = getattr(owner, attr)
+            saved.append((owner, attr, original))
+            setattr(owner, attr, _convertir(original, value))
+            continue
+
+        original = getattr(config, name, _MISSING)
+        if original is _MISSING:
+            raise ValueError(f"Unknown config constant: {name}")
+        value = _convertir(original, value)
+        for module in list(sys.modules.values()):
+            if getattr(module, name, _MISSING) is original:
+                saved.append((module, name, original))
+                setattr(module, name, value)
+    return saved
+
+
+def annuler_overrides(saved):
+    for owner, name, original in reversed(saved):
+        setattr(owner, name, original)
+
+
+def _init_worker():
+    global _simulation
+    # Game code prints a lot; keep worker output quiet
+    sys.stdout = open(os.devnull, 'w')
+    from systems.simulation import HeadlessSimulation
+    _simulation = HeadlessSimulation()
+
+
+def simuler_partie(overrides, seed, bot_name, max_ticks=MAX_TICKS_DEFAULT, simulation=None):
+    """Play one headless game and return its result row."""
+    from systems.bots import creer_bot
+    from systems.simulation import TICK_MS
+    from utils import timing
+
+    simulation = simulation or _simulation
+    saved = appliquer_overrides(overrides)
+    try:
+        bot = creer_bot(bot_name, seed)
+        game = simulation.reset(seed=seed, start_time=0)
+        start = time.perf_counter()
+        ticks = 0
+        while ticks < max_ticks and not game.game_over:
+            simulation.step(bot(game))
+            ticks += 1
+        elapsed = time.perf_counter() - start
+    finally:
+        annuler_overrides(saved)
+        timing.release()
+
+    row = dict(overrides)
+    row.update({
+        'seed': seed,
+        'bot': bot_name,
+        'survie_s': round(ticks * TICK_MS / 1000, 2),
+        'niveau': game.niveau,
+        'score': game.score,
+        'vies': game.vies,
+        'game_over': game.game_over,
+        'ticks': ticks,
+        'ticks_par_s': round(ticks / elapsed, 1) if elapsed else 0.0,
+    })
+    return row
+
+
+def grille(parametres):
+    """Expand {name: [values...]} into every combination of overrides."""
+    names = list(parametres)
+    return [dict(zip(names, values)) for values in itertools.product(*(parametres[n] for n in names))]
+
+
+class ResultWriter:
+    """Appends result rows to a JSON-lines file, one row group per line."""
+
+    def __init__(self, path, columns, row_group=32):
+        self.path = path
+        self.columns = list(columns)
+        self.row_group = row_group
+        self.rows = []
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    def ajouter(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.row_group:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        group = {column: [row.get(column) for row in self.rows] for column in self.columns}
+        with open(self.path, 'a', encoding='utf-8') as handle:
+            handle.write(json.dumps(group) + '\n')
+        self.rows = []
+
+
+def lire_resultats(path):
+    """Load a results file as {column: [values...]}."""
+    columns = {}
+    count = 0
+    with open(path, 'r', encoding='utf-8') as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            group = json.loads(line)
+            size = len(next(iter(group.values()), []))
+            # Columns missing from some groups (files appended by other sweeps) are None
+            for column in group.keys() - columns.keys():
+                columns[column] = [None] * count
+            for column, values in columns.items():
+                values.extend(group.get(column, [None] * size))
+            count += size
+    return columns
+
+
+def lancer_sweep(parametres, seeds, bot_name, path, max_ticks=MAX_TICKS_DEFAULT,
+                 workers=None, row_group=32, on_result=None):
+    """Run every (override set, seed) pair and stream the rows to `path`."""
+    combinaisons = grille(parametres)
+    writer = ResultWriter(path, list(parametres) + list(RESULT_COLUMNS), row_group)
+    total = len(combinaisons) * len(seeds)
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [pool.submit(simuler_partie, overrides, seed, bot_name, max_ticks)
+                   for overrides in combinaisons for seed in seeds]
+        try:
+            for future in as_completed(futures):
+                row = future.result()
+                writer.ajouter(row)
+                done += 1
+                if on_result:
+                    on_result(row, done, total)
+        finally:
+            writer.flush()
+    return total
+
+
+def _lire_valeurs(text):
+    values = []
+    for part in text.split('|'):
+        try:
+            values.append(ast.literal_eval(part))
+        except (ValueError, SyntaxError):
+            values.append(part)
+    return values
+
+
+def _resumer(path, parametres):
+    columns = lire_resultats(path)
+    names = list(parametres)
+    groups = {}
+    for i in range(len(columns['seed'])):
+        key = tuple(json.dumps(columns[name][i], sort_keys=True) for name in names)
+        groups.setdefault(key, []).append(i)
+    print(f"{'  '.join(names)}  |  runs  survie_s  niveau  score  ticks/s")
+    for key, indices in sorted(groups.items()):
+        def moyenne(column):
+            return sum(columns[column][i] for i in indices) / len(indices)
+        print(f"{'  '.join(key)}  |  {len(indices):4d}  {moyenne('survie_s'):8.1f}  "
+              f"{moyenne('niveau'):6.2f}  {moyenne('score'):7.0f}  {moyenne('ticks_par_s'):7.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless balancing sweep over config overrides and seeds")
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=V1|V2',
+                        help="Constant to sweep, values separated by '|'")
+    parser.add_argument('--grid', help="JSON file mapping constant names to value lists")
+    parser.add_argument('--seeds', type=int, default=4, help="Number of seeds per combination")
+    parser.add_argument('--seed-base', type=int, default=0)
+    parser.add_argument('--bot', default='esquive', help="immobile, aleatoire or esquive")
+    parser.add_argument('--max-ticks', type=int, default=MAX_TICKS_DEFAULT)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--out', default=os.path.join(SWEEP_DIR, time.strftime('%Y%m%d-%H%M%S') + '.jsonl'))
+    args = parser.parse_args()
+
+    parametres = {}
+    if args.grid:
+        with open(args.grid, 'r', encoding='utf-8') as handle:
+            parametres.update(json.load(handle))
+    for item in args.set:
+        name, _, values = item.partition('=')
+        parametres[name.strip()] = _lire_valeurs(values)
+
+    seeds = list(range(args.seed_base, args.seed_base + args.seeds))
+
+    def progres(row, done, total):
+        print(f"[{done}/{total}] seed {row['seed']}: level {row['niveau']}, "
+              f"score {row['score']}, {row['survie_s']}s, {row['ticks_par_s']:.0f} ticks/s")
+
+    start = time.perf_counter()
+    total = lancer_sweep(parametres, seeds, args.bot, args.out, args.max_ticks,
+                         args.workers, on_result=progres)
+    print(f"{total} games in {time.perf_counter() - start:.1f}s -> {args.out}")
+    _resumer(args.out, parametres)
+
+
+if __name__ == '__main__':
+    main()
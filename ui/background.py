@@ -1,9 +1,51 @@
 import pygame
 import os
 import random
+from assets import chargeur_assets
 from config import LARGEUR, HAUTEUR, ASSETS_DIR
+from systems.quality import qualite
+
+# A layer counts as opaque when every pixel's alpha is above this
+SEUIL_OPAQUE = 250
+
+
+def est_opaque(image):
+    """True when `image` has no (noticeably) transparent pixel."""
+    if not image.get_flags() & pygame.SRCALPHA:
+        return True
+    largeur, hauteur = image.get_size()
+    return pygame.mask.from_surface(image, SEUIL_OPAQUE).count() == largeur * hauteur
+
+
+# Background file -> est_opaque() of its scaled image, so later levels skip the scan
+_opacite = {}
+
+
+def bande_verticale(image, opaque):
+    """The image tiled twice vertically, so any scroll offset is one blit."""
+    largeur, hauteur = image.get_size()
+    if not pygame.display.get_surface():
+        bande = pygame.Surface((largeur, hauteur * 2), 0 if opaque else pygame.SRCALPHA)
+    elif opaque:
+        bande = pygame.Surface((largeur, hauteur * 2)).convert()
+    else:
+        bande = pygame.Surface((largeur, hauteur * 2), pygame.SRCALPHA).convert_alpha()
+    bande.blit(image, (0, 0))
+    bande.blit(image, (0, hauteur))
+    return bande
+
 
 class ParallaxBackground:
+    """Scrolling nebula layers, composited so that hidden work is skipped.
+
+    Layers drawn under an opaque layer are never visible and are neither
+    decoded nor drawn; opaque layers are blitted without per-pixel alpha;
+    layers scrolling at the same speed are pre-blended into one; each
+    remaining layer is a strip tiled twice, so a scroll offset costs one blit
+    instead of two. With the shipped (opaque) nebulas, the background is a
+    single opaque blit and only the top nebula is decoded.
+    """
+
     def __init__(self):
         # Define background layers with their scroll speeds
         self.layer_configs = [
@@ -29,6 +71,9 @@ class ParallaxBackground:
         
         self.backgrounds = []
         self.layer_positions = []
+        self.bandes = []  # Visible strips, bottom first: {'bande', 'couche', 'opaque'}
+        # Own generator: picking backgrounds must not reseed or consume the gameplay RNG
+        self.rng = random.Random()
         self.randomize_backgrounds()
         
     def randomize_backgrounds(self):
@@ -36,38 +81,71 @@ class ParallaxBackground:
         self.backgrounds = []
         self.layer_positions = []
         
-        # Refresh random seed using current time
-        random.seed()
-        
+        # Randomly select a background for each layer
+        chemins = []
         for config in self.layer_configs:
-            # Randomly select a background from the options
-            bg_num = random.choice(config['options'])
-            bg_path = os.path.join(
+            bg_num = self.rng.choice(config['options'])
+            chemins.append(os.path.join(
                 ASSETS_DIR,
                 'backgrounds',
                 f'{config["pattern"]}{bg_num}-1024x1024.png'
-            )
-            
+            ))
+            self.backgrounds.append({'scroll_speed': config['speed']})
+            self.layer_positions.append(0)
+
+        # Only the top layers down to the first opaque one can be seen: decode
+        # those, in parallel when earlier levels showed they are transparent
+        chargeur = chargeur_assets()
+        probables = []
+        for bg_path in reversed(chemins):
+            probables.append(bg_path)
+            if _opacite.get(bg_path) is not False:
+                break
+        chargeur.precharger(probables)
+
+        for i in reversed(range(len(chemins))):
+            bg, bg_path = self.backgrounds[i], chemins[i]
             try:
-                # Load and scale the image
-                image = pygame.image.load(bg_path).convert_alpha()
-                image = pygame.transform.scale(image, (LARGEUR, HAUTEUR))
-                
-                self.backgrounds.append({
-                    'image': image,
-                    'scroll_speed': config['speed']
-                })
-                self.layer_positions.append(0)
-            except pygame.error as e:
+                # Load and scale the image; full-screen layers are too big to keep cached
+                bg['image'] = chargeur.image(bg_path, (LARGEUR, HAUTEUR), garder=False)
+                if bg_path not in _opacite:
+                    _opacite[bg_path] = est_opaque(bg['image'])
+                bg['opaque'] = _opacite[bg_path]
+            except (pygame.error, OSError) as e:
                 print(f"Error loading background {bg_path}: {e}")
                 # Create a fallback solid color background
-                fallback = pygame.Surface((LARGEUR, HAUTEUR))
-                fallback.fill((0, 0, 30))  # Dark blue
-                self.backgrounds.append({
-                    'image': fallback,
-                    'scroll_speed': config['speed']
-                })
-                self.layer_positions.append(0)
+                bg['image'] = pygame.Surface((LARGEUR, HAUTEUR))
+                bg['image'].fill((0, 0, 30))  # Dark blue
+                bg['opaque'] = True
+            if bg['opaque']:
+                break
+
+        self._composer()
+
+    def _composer(self):
+        """Build the strips actually drawn from the loaded (visible) layers."""
+        visibles = [i for i, bg in enumerate(self.backgrounds) if 'image' in bg]
+        for i in visibles:
+            bg = self.backgrounds[i]
+            if bg['opaque'] and pygame.display.get_surface():
+                bg['image'] = bg['image'].convert()
+
+        self.bandes = []
+        for i in visibles:
+            bg = self.backgrounds[i]
+            precedente = self.bandes[-1] if self.bandes else None
+            if precedente and self.backgrounds[precedente['couche']]['scroll_speed'] == bg['scroll_speed']:
+                # Same speed: the two layers stay aligned, blend them once
+                surface = precedente['bande']
+                surface.blit(bg['image'], (0, 0))
+                surface.blit(bg['image'], (0, HAUTEUR))
+                continue
+            self.bandes.append({'bande': bande_verticale(bg['image'], bg['opaque']),
+                                'couche': i, 'opaque': bg['opaque']})
+
+        # The strips hold everything drawn from now on
+        for i in visibles:
+            del self.backgrounds[i]['image']
     
     def update(self):
         # Update each layer's position
@@ -78,17 +156,11 @@ class ParallaxBackground:
                 self.layer_positions[i] = 0
     
     def draw(self, fenetre):
-        # Draw each background layer
-        for i, bg in enumerate(self.backgrounds):
-            # Calculate positions for seamless scrolling
-            pos_y = int(self.layer_positions[i])
-            
-            # Draw the main image
-            fenetre.blit(bg['image'], (0, pos_y))
-            
-            # Draw the wrapped portion at the top
-            if pos_y > 0:
-                fenetre.blit(bg['image'], (0, pos_y - HAUTEUR))
+        # Bottom strip first; lower quality drops the translucent strips over it
+        for bande in self.bandes[:max(1, qualite().couches_fond)]:
+            # Row 0 of the screen shows row -pos_y of the layer, wrapped
+            pos_y = int(self.layer_positions[bande['couche']]) % HAUTEUR
+            fenetre.blit(bande['bande'], (0, 0), (0, HAUTEUR - pos_y, LARGEUR, HAUTEUR))
 
     def fade_transition(self, fenetre, alpha=0):
         """Draw the background with a fade effect for level transitions."""
@@ -1,11 +1,16 @@
 import pygame
 import math
 import random
+from assets import chargeur_assets
 from config import LARGEUR, HAUTEUR, BLANC, VERT, ROUGE, NOIR
 import os
 
 from utils.control_settings import ControlSettings
 
+# Glitch effects draw from their own generator so the pause overlay never
+# consumes the gameplay RNG
+_rng_visuel = random.Random()
+
 class MenuState:
     def __init__(self):
         self.boss_pos = [LARGEUR // 2, HAUTEUR // 3]
@@ -65,11 +70,7 @@ def load_player_ships():
             if filename.lower().endswith(('.png', '.jpg', '.jpeg')):
                 try:
                     image_path = os.path.join(player_dir, filename)
-                    image = pygame.image.load(image_path)
-                    if pygame.display.get_surface():
-                        image = image.convert_alpha()
-                    scaled_size = (80, 80)
-                    image = pygame.transform.smoothscale(image, scaled_size)
+                    image = chargeur_assets().image(image_path, (80, 80), lisse=True)
                     ships.append(image)
                     ship_names.append(os.path.splitext(filename)[0])
                 except pygame.error as e:
@@ -556,13 +557,13 @@ def draw_title_and_score(fenetre, temps, meilleur_score):
 
     for i in range(3):
         offset = int(math.sin(temps / 300 + i) * 4)
-        glitch_x = random.randint(-2, 2) if temps % 200 < 50 else 0
-        glitch_y = random.randint(-2, 2) if temps % 200 < 50 else 0
+        glitch_x = _rng_visuel.randint(-2, 2) if temps % 200 < 50 else 0
+        glitch_y = _rng_visuel.randint(-2, 2) if temps % 200 < 50 else 0
 
         if temps % 500 < 50 and i == 0:
             corrupt_chars = list(texte_base)
-            corrupt_pos = random.randint(0, len(corrupt_chars) - 1)
-            corrupt_chars[corrupt_pos] = chr(random.randint(33, 90))
+            corrupt_pos = _rng_visuel.randint(0, len(corrupt_chars) - 1)
+            corrupt_chars[corrupt_pos] = chr(_rng_visuel.randint(33, 90))
             text_variant = ''.join(corrupt_chars)
         else:
             text_variant = texte_base
@@ -633,7 +634,41 @@ def draw_title_and_score(fenetre, temps, meilleur_score):
         fenetre.blit(glow_surface, pos)
         fenetre.blit(surface, pos)
 
-def dessiner_menu_accueil(fenetre, meilleur_score, controls):
+def draw_leaderboard(fenetre, temps, classement, ancre, lignes=5, partie_id=None):
+    """Draw the best runs in a panel; `ancre` is a rect attribute/value pair,
+    e.g. ('topleft', (20, 20)). The run with `partie_id` is highlighted."""
+    pulse = abs(math.sin(temps/1000)) * 0.5 + 0.5
+    panel_padding = 15
+    font_titre = menu_state.get_font(32)
+    font_ligne = menu_state.get_font(24)
+
+    surfaces = [font_titre.render("LEADERBOARD", True, (255, 255, 0))]
+    if not classement:
+        surfaces.append(font_ligne.render("NO RUNS YET", True, (0, 160, 0)))
+    for rang, partie in enumerate(classement[:lignes], 1):
+        couleur = (255, 255, 255) if partie['id'] == partie_id else (0, 255, 0)
+        texte = (f"{rang}. {partie['score']:>9,}  LVL {partie['niveau']:<2d}  "
+                 f"{partie['precision']:.0f}%  x{partie['meilleur_combo']}")
+        surfaces.append(font_ligne.render(texte, True, couleur))
+
+    largeur = max(surface.get_width() for surface in surfaces) + panel_padding * 2
+    hauteur = sum(surface.get_height() + 5 for surface in surfaces) + panel_padding * 2
+    panel_rect = pygame.Rect(0, 0, largeur, hauteur)
+    setattr(panel_rect, *ancre)
+
+    # Same metallic panel as the high score
+    panel_surface = pygame.Surface(panel_rect.size, pygame.SRCALPHA)
+    pygame.draw.rect(panel_surface, (30, 30, 40, 200), panel_surface.get_rect(), border_radius=8)
+    pygame.draw.rect(panel_surface, (0, 255, 0, int(100 * pulse)), panel_surface.get_rect(),
+                     width=2, border_radius=8)
+    fenetre.blit(panel_surface, panel_rect)
+
+    y = panel_rect.y + panel_padding
+    for surface in surfaces:
+        fenetre.blit(surface, (panel_rect.x + panel_padding, y))
+        y += surface.get_height() + 5
+
+def dessiner_menu_accueil(fenetre, meilleur_score, controls, classement=None):
     """Draw the main menu with all visual effects."""
     temps = pygame.time.get_ticks()
 
@@ -642,6 +677,8 @@ def dessiner_menu_accueil(fenetre, meilleur_score, controls):
 
     draw_background_effects(fenetre, temps)
     draw_title_and_score(fenetre, temps, meilleur_score)
+    if classement is not None and menu_state.active_view == 'main':
+        draw_leaderboard(fenetre, temps, classement, ('topleft', (20, 20)))
 
     draw_menu_items(fenetre, temps, controls, show_instructions=menu_state.active_view == 'main')
 
@@ -675,8 +712,8 @@ def dessiner_menu_pause(fenetre):
     # Multiple layers for glitch effect
     for i in range(3):
         offset = int(math.sin(temps/300 + i) * 4)
-        glitch_x = random.randint(-2, 2) if temps % 200 < 50 else 0
-        glitch_y = random.randint(-2, 2) if temps % 200 < 50 else 0
+        glitch_x = _rng_visuel.randint(-2, 2) if temps % 200 < 50 else 0
+        glitch_y = _rng_visuel.randint(-2, 2) if temps % 200 < 50 else 0
         
         couleurs = [(110, 200, 255), (80, 160, 255), (60, 120, 220)]
         titre = font_titre.render(texte_base, True, couleurs[i])
@@ -701,7 +738,7 @@ def dessiner_menu_pause(fenetre):
         )
         fenetre.blit(instruction, rect_instruction)
 
-def dessiner_game_over(fenetre, score, meilleur_score):
+def dessiner_game_over(fenetre, score, meilleur_score, classement=None, derniere_partie=None):
     temps = pygame.time.get_ticks()
     
     # Create a temporary surface for wave effect
@@ -733,14 +770,14 @@ def dessiner_game_over(fenetre, score, meilleur_score):
     # Multi-layer effect for "GAME OVER"
     for i in range(3):
         offset = int(math.sin(temps/300 + i) * 4)
-        glitch_x = random.randint(-2, 2) if temps % 200 < 50 else 0
-        glitch_y = random.randint(-2, 2) if temps % 200 < 50 else 0
+        glitch_x = _rng_visuel.randint(-2, 2) if temps % 200 < 50 else 0
+        glitch_y = _rng_visuel.randint(-2, 2) if temps % 200 < 50 else 0
         
         # Random corruption effect
         if temps % 500 < 50 and i == 0:
             corrupt_chars = list(texte_base)
-            corrupt_pos = random.randint(0, len(corrupt_chars)-1)
-            corrupt_chars[corrupt_pos] = chr(random.randint(33, 90))
+            corrupt_pos = _rng_visuel.randint(0, len(corrupt_chars)-1)
+            corrupt_chars[corrupt_pos] = chr(_rng_visuel.randint(33, 90))
             texte_corrompu = "".join(corrupt_chars)
             texte_go = font_go.render(texte_corrompu, True, (255, 0, 0))
         else:
@@ -797,4 +834,12 @@ def dessiner_game_over(fenetre, score, meilleur_score):
                         (ligne_x, y + 30),
                         (ligne_x + ligne_longueur, y + 30), 1)
 
-menu_state.load_resources()
+    # Best runs, with this one highlighted once the leaderboard has stored it
+    if classement is not None:
+        partie_id = derniere_partie['id'] if derniere_partie else None
+        draw_leaderboard(fenetre, temps, classement, ('midtop', (LARGEUR//2, HAUTEUR//2 + 260)),
+                         partie_id=partie_id)
+        if derniere_partie and derniere_partie['rang'] > 5:
+            font_rang = pygame.font.Font(None, 36)
+            texte_rang = font_rang.render(f"RANK #{derniere_partie['rang']:,}", True, (0, 255, 0))
+            fenetre.blit(texte_rang, (LARGEUR//2 - texte_rang.get_width()//2, HAUTEUR - 60))
@@ -2,6 +2,10 @@ import pygame
 import math
 from config import *
 import random
+from utils import timing
+
+# HUD animation jitter must not consume the gameplay RNG
+_rng_visuel = random.Random()
 
 class ModernHUD:
     def __init__(self):
@@ -232,8 +236,8 @@ class ModernHUD:
                 points = [(start_x, start_y)]
                 for _ in range(2):
                     prev_x, prev_y = points[-1]
-                    mid_x = (prev_x + end_x) / 2 + (random.random() - 0.5) * 10
-                    mid_y = (prev_y + end_y) / 2 + (random.random() - 0.5) * 10
+                    mid_x = (prev_x + end_x) / 2 + (_rng_visuel.random() - 0.5) * 10
+                    mid_y = (prev_y + end_y) / 2 + (_rng_visuel.random() - 0.5) * 10
                     points.append((mid_x, mid_y))
                 points.append((end_x, end_y))
                 
@@ -265,10 +269,11 @@ class ModernHUD:
         shield_x = center_x - 40
         fire_x = center_x + 40
         
-        # Draw powerup indicators
+        # Draw powerup indicators (timers run on the game clock, not the animation clock)
+        maintenant = timing.get_ticks()
         if game_state.joueur.shield_actif:
             temps_restant = max(0, game_state.joueur.shield_duree - 
-                              (temps - game_state.joueur.shield_temps))
+                              (maintenant - game_state.joueur.shield_temps))
             if temps_restant > 0:
                 self.draw_modern_powerup(surface, "shield", temps_restant,
                                       game_state.joueur.shield_duree,
@@ -276,7 +281,7 @@ class ModernHUD:
         
         if game_state.joueur.rapid_fire:
             temps_restant = max(0, game_state.joueur.rapid_fire_duration -
-                              (temps - game_state.joueur.rapid_fire_timer))
+                              (maintenant - game_state.joueur.rapid_fire_timer))
             if temps_restant > 0:
                 self.draw_modern_powerup(surface, "fire", temps_restant,
                                       game_state.joueur.rapid_fire_duration,
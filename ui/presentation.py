@@ -0,0 +1,130 @@
+"""
+Window presentation.
+
+The game always draws a fixed LARGEUR x HAUTEUR image; Presentation puts it
+in a window of any size, in one of three modes:
+  - 'scaled': SDL's renderer scales the window (pygame.SCALED), linear or
+    nearest filtering
+  - 'entier': integer nearest-neighbour upscale, letterboxed
+  - 'lisse': smoothscale to the largest aspect-correct size, letterboxed
+config.py picks a mode per quality (PRESENTATION_PAR_QUALITE). When renderer
+scaling is unavailable, 'scaled' falls back to 'lisse' if smooth filtering
+was asked for, 'entier' otherwise.
+"""
+
+import os
+import time
+import pygame
+
+# Presentation modes
+MODE_SCALED = 'scaled'  # SDL renderer scales the window (pygame.SCALED)
+MODE_ENTIER = 'entier'  # Integer nearest-neighbour upscale, letterboxed
+MODE_LISSE = 'lisse'    # smoothscale to the largest aspect-correct size
+
+
+class Presentation:
+    """Puts the fixed-size game image in a window of any size.
+
+    The game always draws at `taille_rendu`. When the window has that size the
+    game draws straight into the display surface. Otherwise it draws into an
+    off-screen surface that is scaled into a persistent destination surface,
+    rebuilt only when the window size changes.
+    """
+
+    def __init__(self, taille_rendu, mode=MODE_SCALED, lisse=True, titre=''):
+        self.taille_rendu = taille_rendu
+        self.mode = mode
+        self.lisse = lisse
+        self.titre = titre
+        self.fenetre = None
+        self.plein_ecran = False
+        self._rendu = None         # Off-screen render target, when needed
+        self._destination = None   # Scaled image, reused while the window size holds
+        self._position = (0, 0)
+        self._bandes = []          # Letterbox rectangles cleared every frame
+        self._taille_fenetre = None
+        self.duree_flip = 0.0      # Milliseconds the last flip took (blocked by vsync or a full queue)
+
+    def _flags(self):
+        if self.mode == MODE_SCALED:
+            return pygame.SCALED | (pygame.FULLSCREEN if self.plein_ecran else pygame.RESIZABLE)
+        return pygame.FULLSCREEN if self.plein_ecran else pygame.RESIZABLE
+
+    def _mode_secours(self):
+        """Mode used when SDL renderer scaling is unavailable."""
+        return MODE_LISSE if self.lisse else MODE_ENTIER
+
+    def ouvrir_fenetre(self):
+        """(Re)create the window for the current mode; returns the display surface."""
+        if self.mode == MODE_SCALED:
+            # Read by SDL when the renderer is created: linear or nearest filtering
+            os.environ['SDL_RENDER_SCALE_QUALITY'] = '1' if self.lisse else '0'
+        taille = (0, 0) if self.plein_ecran and self.mode != MODE_SCALED else self.taille_rendu
+        try:
+            self.fenetre = pygame.display.set_mode(taille, self._flags())
+        except pygame.error as error:
+            if self.mode != MODE_SCALED:
+                raise
+            print(f"Renderer scaling unavailable, using '{self._mode_secours()}': {error}")
+            self.mode = self._mode_secours()
+            taille = (0, 0) if self.plein_ecran else self.taille_rendu
+            self.fenetre = pygame.display.set_mode(taille, self._flags())
+        if self.titre:
+            pygame.display.set_caption(self.titre)
+        self._taille_fenetre = None
+        return self.fenetre
+
+    def basculer_plein_ecran(self):
+        self.plein_ecran = not self.plein_ecran
+        return self.ouvrir_fenetre()
+
+    def surface_de_rendu(self):
+        """Surface the game should draw this frame's image into."""
+        self.fenetre = pygame.display.get_surface() or self.fenetre
+        if self.fenetre.get_size() == self.taille_rendu:
+            return self.fenetre
+        if self._rendu is None:
+            self._rendu = pygame.Surface(self.taille_rendu).convert()
+        return self._rendu
+
+    def _preparer(self, taille_fenetre):
+        """Compute the destination size, position and letterbox for a window size."""
+        largeur, hauteur = self.taille_rendu
+        fenetre_l, fenetre_h = taille_fenetre
+        facteur = min(fenetre_l / largeur, fenetre_h / hauteur)
+        if self.mode == MODE_ENTIER and facteur >= 1:
+            facteur = int(facteur)
+        taille = (max(1, int(largeur * facteur)), max(1, int(hauteur * facteur)))
+        x = (fenetre_l - taille[0]) // 2
+        y = (fenetre_h - taille[1]) // 2
+
+        # At 1:1 the render surface is blitted as is
+        self._destination = pygame.Surface(taille).convert() if taille != self.taille_rendu else None
+        self._position = (x, y)
+        self._bandes = [rect for rect in (
+            pygame.Rect(0, 0, fenetre_l, y),
+            pygame.Rect(0, y + taille[1], fenetre_l, fenetre_h - y - taille[1]),
+            pygame.Rect(0, y, x, taille[1]),
+            pygame.Rect(x + taille[0], y, fenetre_l - x - taille[0], taille[1]),
+        ) if rect.width > 0 and rect.height > 0]
+        self._taille_fenetre = taille_fenetre
+
+    def presenter(self):
+        """Scale this frame's image to the window (if needed) and flip."""
+        taille_fenetre = self.fenetre.get_size()
+        if taille_fenetre != self.taille_rendu and self._rendu is not None:
+            if taille_fenetre != self._taille_fenetre:
+                self._preparer(taille_fenetre)
+            destination = self._destination
+            if destination is None:
+                destination = self._rendu
+            elif self.mode == MODE_LISSE:
+                pygame.transform.smoothscale(self._rendu, destination.get_size(), destination)
+            else:
+                pygame.transform.scale(self._rendu, destination.get_size(), destination)
+            for bande in self._bandes:
+                self.fenetre.fill((0, 0, 0), bande)
+            self.fenetre.blit(destination, self._position)
+        debut = time.perf_counter()
+        pygame.display.flip()
+        self.duree_flip = (time.perf_counter() - debut) * 1000
@@ -0,0 +1,27 @@
+import pygame
+from assets import charger_police
+from config import LARGEUR, HAUTEUR
+
+def dessiner_splash(fenetre, progression, message="Chargement..."):
+    """Startup screen with a progress bar; `progression` goes from 0 to 1."""
+    progression = max(0.0, min(1.0, progression))
+    fenetre.fill((5, 5, 20))
+
+    font_titre = charger_police(110)
+    titre = font_titre.render("NEBULA SURGE", True, (0, 255, 255))
+    fenetre.blit(titre, titre.get_rect(center=(LARGEUR // 2, HAUTEUR // 2 - 80)))
+
+    # Progress bar
+    largeur, hauteur = 600, 18
+    cadre = pygame.Rect(0, 0, largeur, hauteur)
+    cadre.center = (LARGEUR // 2, HAUTEUR // 2 + 40)
+    pygame.draw.rect(fenetre, (20, 40, 60), cadre, border_radius=9)
+    if progression > 0:
+        rempli = cadre.copy()
+        rempli.width = max(hauteur, int(largeur * progression))
+        pygame.draw.rect(fenetre, (0, 200, 255), rempli, border_radius=9)
+    pygame.draw.rect(fenetre, (0, 255, 255), cadre, 2, border_radius=9)
+
+    font_message = charger_police(36)
+    texte = font_message.render(f"{message} {int(progression * 100)}%", True, (180, 220, 255))
+    fenetre.blit(texte, texte.get_rect(center=(LARGEUR // 2, cadre.bottom + 36)))
@@ -2,6 +2,8 @@ import json
 import os
 import pygame
 
+from utils.persistence import persistance
+
 DEFAULT_BINDINGS = {
     "move_left": pygame.K_LEFT,
     "move_right": pygame.K_RIGHT,
@@ -28,6 +30,7 @@ class ControlSettings:
 
     def __init__(self):
         self.bindings = {action: DEFAULT_BINDINGS[action] for action, _ in self.ACTIONS}
+        self.revision = 0  # Bumped on every binding change, for cached lookups
         self.load()
 
     def load(self):
@@ -39,18 +42,22 @@ class ControlSettings:
             for action, key_code in data.items():
                 if action in self.bindings and isinstance(key_code, int):
                     self.bindings[action] = key_code
+            self.revision += 1
         except (OSError, ValueError, json.JSONDecodeError):
             # Keep defaults on failure
             pass
 
+    # Rebinding several keys in a row writes the file once
+    SAVE_DELAY = 0.5
+
     def save(self):
-        os.makedirs(os.path.dirname(self.FILE_PATH), exist_ok=True)
-        with open(self.FILE_PATH, "w", encoding="utf-8") as handle:
-            json.dump(self.bindings, handle, indent=2)
+        data = json.dumps(self.bindings, indent=2).encode("utf-8")
+        persistance().ecrire(self.FILE_PATH, data, delai=self.SAVE_DELAY)
 
     def reset_defaults(self):
         for action, default_key in DEFAULT_BINDINGS.items():
             self.bindings[action] = default_key
+        self.revision += 1
         self.save()
 
     def get(self, action):
@@ -67,6 +74,7 @@ class ControlSettings:
             if other_action != action and other_key == key:
                 self.bindings[other_action] = previous_key
         self.bindings[action] = key
+        self.revision += 1
         self.save()
 
     def key_label(self, action):
@@ -0,0 +1,179 @@
+"""
+Background file persistence.
+
+Scores, settings, replays and quick-saves are written by one writer thread
+so the game loop never waits on the disk. Every write goes to a temporary
+file in the same directory, is fsynced, then renamed over the target: a
+crash leaves either the old file or the new one, never a truncated one.
+
+Writes to the same path coalesce: while a write is pending, a newer one
+replaces its data (only the latest version reaches the disk), and writes
+given a delay wait that long for newer data first. Results are queued for
+the main thread, which reports them from traiter_resultats() once a frame.
+"""
+
+import atexit
+import os
+import queue
+import shutil
+import threading
+import time
+
+
+def ecrire_atomique(path, data, sauvegarde=None):
+    """Write `data` to `path` through a fsynced temporary file and a rename.
+
+    With `sauvegarde`, the previous version of the file is kept under that
+    name first, for loaders that fall back to it.
+    """
+    dossier = os.path.dirname(path) or '.'
+    os.makedirs(dossier, exist_ok=True)
+    if sauvegarde and os.path.exists(path):
+        shutil.copy2(path, sauvegarde)
+
+    temporaire = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporaire, 'wb') as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporaire, path)
+    except BaseException:
+        try:
+            os.remove(temporaire)
+        except OSError:
+            pass
+        raise
+
+    # Make the rename itself durable (not supported on every platform)
+    try:
+        descripteur = os.open(dossier, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descripteur)
+    except OSError:
+        pass
+    finally:
+        os.close(descripteur)
+
+
+class _Ecriture:
+    __slots__ = ('data', 'sauvegarde', 'echeance', 'rappels')
+
+    def __init__(self, data, sauvegarde, echeance, rappel):
+        self.data = data
+        self.sauvegarde = sauvegarde
+        self.echeance = echeance
+        self.rappels = [rappel] if rappel else []
+
+
+class PersistenceWriter:
+    """Writes files atomically on a background thread, coalescing per path."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._en_attente = {}  # path -> _Ecriture, oldest first
+        self._en_cours = None  # Path being written
+        self._resultats = queue.SimpleQueue()
+        self._thread = None
+
+    def _demarrer(self):
+        self._thread = threading.Thread(target=self._boucle, name='persistence', daemon=True)
+        self._thread.start()
+        # Pending writes still reach the disk when the game exits
+        atexit.register(self.vider, 5.0)
+
+    def ecrire(self, path, data, sauvegarde=None, delai=0.0, rappel=None):
+        """Queue a write of `data` (bytes, or a callable returning bytes) to `path`.
+
+        `delai` seconds are left for newer data to replace this one before it
+        is written. `rappel(path, erreur)` runs on the main thread, from
+        traiter_resultats(), once the file is written (erreur is None) or failed.
+        """
+        with self._condition:
+            if self._thread is None:
+                self._demarrer()
+            echeance = time.monotonic() + delai
+            ecriture = self._en_attente.get(path)
+            if ecriture is None:
+                self._en_attente[path] = _Ecriture(data, sauvegarde, echeance, rappel)
+            else:
+                ecriture.data = data
+                ecriture.sauvegarde = sauvegarde or ecriture.sauvegarde
+                ecriture.echeance = max(ecriture.echeance, echeance)
+                if rappel:
+                    ecriture.rappels.append(rappel)
+            self._condition.notify_all()
+
+    def _prochaine(self):
+        """Pop the next due write; waits while none is due. Holds the condition."""
+        while True:
+            if self._en_attente:
+                maintenant = time.monotonic()
+                path, ecriture = min(self._en_attente.items(), key=lambda item: item[1].echeance)
+                if ecriture.echeance <= maintenant:
+                    del self._en_attente[path]
+                    self._en_cours = path
+                    return path, ecriture
+                self._condition.wait(ecriture.echeance - maintenant)
+            else:
+                self._condition.wait()
+
+    def _boucle(self):
+        while True:
+            with self._condition:
+                path, ecriture = self._prochaine()
+            erreur = None
+            try:
+                data = ecriture.data() if callable(ecriture.data) else ecriture.data
+                ecrire_atomique(path, data, ecriture.sauvegarde)
+            except Exception as e:  # Reported on the main thread, never raised here
+                erreur = e
+            with self._condition:
+                self._en_cours = None
+                self._condition.notify_all()
+            self._resultats.put((path, erreur, ecriture.rappels))
+
+    def traiter_resultats(self):
+        """Run the callbacks of finished writes; call from the main thread."""
+        while True:
+            try:
+                path, erreur, rappels = self._resultats.get_nowait()
+            except queue.Empty:
+                return
+            if erreur is not None and not rappels:
+                print(f"Error writing {path}: {erreur}")
+            for rappel in rappels:
+                rappel(path, erreur)
+
+    def en_attente(self, path=None):
+        """True while `path` (or any file, by default) still has to be written."""
+        with self._condition:
+            if path is None:
+                return bool(self._en_attente) or self._en_cours is not None
+            return path in self._en_attente or self._en_cours == path
+
+    def vider(self, timeout=None):
+        """Write everything pending now, ignoring delays; False on timeout."""
+        limite = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            if self._thread is None:
+                return True
+            for ecriture in self._en_attente.values():
+                ecriture.echeance = 0
+            self._condition.notify_all()
+            while self._en_attente or self._en_cours is not None:
+                restant = None if limite is None else limite - time.monotonic()
+                if restant is not None and restant <= 0:
+                    return False
+                self._condition.wait(restant)
+        return True
+
+
+_writer = PersistenceWriter()
+
+
+def persistance():
+    """The process-wide persistence writer."""
+    return _writer
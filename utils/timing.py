@@ -0,0 +1,75 @@
+"""
+Simulation clock.
+
+Gameplay code reads time through get_ticks() instead of pygame.time.get_ticks().
+The game loop starts each tick with begin_tick(), which builds the tick's
+FrameContext (timestamp, elapsed time, tick index, pause state) once; every
+update in the tick sees the same timestamp, and headless runs (replays,
+simulations) can drive the clock with virtual timestamps at any speed. The
+tick-level updates take the FrameContext (or its timestamp) as an argument,
+so per-object loops read one attribute instead of calling the clock.
+Restoring a snapshot rebases the live clock so the game resumes from the
+snapshot's time.
+"""
+
+import pygame
+
+
+class FrameContext:
+    """Time as seen by one tick."""
+
+    __slots__ = ('now', 'dt', 'tick', 'paused')
+
+    def __init__(self, now, dt=0, tick=0, paused=False):
+        self.now = now        # Tick timestamp, in milliseconds
+        self.dt = dt          # Milliseconds since the previous tick
+        self.tick = tick      # Ticks begun since the clock was (re)started
+        self.paused = paused  # Gameplay frozen for this tick
+
+    def __repr__(self):
+        return f"FrameContext(now={self.now}, dt={self.dt}, tick={self.tick}, paused={self.paused})"
+
+
+_frame = None
+_offset = 0  # Added to the live pygame clock after a rebase()
+
+
+def get_ticks():
+    """Current tick time in milliseconds (live pygame clock when not frozen)."""
+    if _frame is not None:
+        return _frame.now
+    return pygame.time.get_ticks() + _offset
+
+
+def frame():
+    """The current tick's FrameContext (a live-clock one outside of ticks)."""
+    if _frame is not None:
+        return _frame
+    return FrameContext(pygame.time.get_ticks() + _offset)
+
+
+def begin_tick(now=None, paused=False):
+    """Freeze the clock for the coming tick; defaults to the live pygame clock."""
+    global _frame
+    now = pygame.time.get_ticks() + _offset if now is None else int(now)
+    if _frame is None:
+        _frame = FrameContext(now, 0, 0, paused)
+    else:
+        _frame = FrameContext(now, now - _frame.now, _frame.tick + 1, paused)
+    return _frame
+
+
+def rebase(now):
+    """Make the live clock continue from `now` and freeze it there."""
+    global _offset, _frame
+    _offset = int(now) - pygame.time.get_ticks()
+    # A jump in time, not elapsed time: the next tick measures from `now`
+    tick = _frame.tick if _frame is not None else 0
+    _frame = FrameContext(int(now), 0, tick, _frame.paused if _frame is not None else False)
+    return _frame
+
+
+def release():
+    """Return to the live pygame clock."""
+    global _frame
+    _frame = None